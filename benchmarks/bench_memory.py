@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark comparing ObjectData dataclasses with the array-backed ObjectTable.
+
+Usage: python benchmarks/bench_memory.py [--num-objects N]
+
+Prints a JSON document with the bytes allocated per object by each representation.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from perception_engine import ObjectData
+from perception_records import ObjectTable
+
+def measure(build):
+    """Return (result, bytes still allocated after build)"""
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--num-objects", type=int, default=100_000)
+    args = parser.parse_args()
+    num_objects = args.num_objects
+
+    objects, dataclass_bytes = measure(lambda: [ObjectData() for _ in range(num_objects)])
+    del objects
+    table, table_bytes = measure(lambda: ObjectTable(num_objects))
+
+    print(json.dumps({
+        "benchmark": "memory",
+        "num_objects": num_objects,
+        "dataclass_bytes_per_object": dataclass_bytes / num_objects,
+        "table_bytes_per_object": table_bytes / num_objects,
+        "table_record_itemsize": table.array.dtype.itemsize,
+        "reduction_factor": dataclass_bytes / table_bytes if table_bytes else None,
+    }, indent=2))
+
+if __name__ == "__main__":
+    main()
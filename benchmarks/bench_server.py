@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Load generator for the micro-batching evaluation server.
+
+Usage: python benchmarks/bench_server.py [--windows-ms MS [MS ...]] [--clients N]
+                                         [--requests N] [--objects-per-request N]
+                                         [--url HOST:PORT] [--output FILE]
+
+For every micro-batching window a ``perception_server.py`` subprocess is
+started on a free port (or the server at ``--url`` is used as is), then
+``--clients`` concurrent keep-alive connections each send ``--requests``
+POST /evaluate requests back to back. The JSON report lists per window the
+request and object throughput, the latency percentiles in milliseconds and
+the server's mean batch size.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import asdict
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_throughput import git_commit, scalar_objects, synthetic_corpus
+from perception_engine import object_to_dict
+
+SERVER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "perception_server.py")
+PERCENTILES = (50, 90, 99, 99.9)
+
+def request_bodies(count, objects_per_request, seed):
+    """Encoded /evaluate bodies cycling over a synthetic corpus"""
+    objects = scalar_objects(next(synthetic_corpus(max(count, 1) * objects_per_request, 10_000, seed)))
+    specs = [{"object_data": object_to_dict(obj), "ego_data": asdict(ego), "abs_vel_over_ground": list(abs_vel)}
+             for obj, ego, abs_vel in objects]
+    return [json.dumps({"objects": specs[start:start + objects_per_request]}).encode()
+            for start in range(0, len(specs), objects_per_request)]
+
+async def http_request(reader, writer, method, path, body=b""):
+    """Send one keep-alive request and return (status, decoded JSON body)"""
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    payload = await reader.readexactly(length) if length else b""
+    return status, json.loads(payload) if payload else None
+
+async def client(host, port, bodies, latencies):
+    """Send bodies back to back over one connection, appending each latency in seconds"""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for body in bodies:
+            start = time.perf_counter()
+            status, _ = await http_request(reader, writer, "POST", "/evaluate", body)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                raise RuntimeError(f"Server answered {status}")
+    finally:
+        writer.close()
+
+async def generate_load(host, port, bodies, clients, requests, objects_per_request):
+    """Run the concurrent clients and summarize throughput and latency"""
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        client(host, port, [bodies[(index * requests + step) % len(bodies)] for step in range(requests)], latencies)
+        for index in range(clients)))
+    seconds = time.perf_counter() - start
+    reader, writer = await asyncio.open_connection(host, port)
+    _, stats = await http_request(reader, writer, "GET", "/stats")
+    writer.close()
+    latencies_ms = np.array(latencies) * 1e3
+    return {
+        "clients": clients,
+        "requests": len(latencies),
+        "objects_per_request": objects_per_request,
+        "seconds": seconds,
+        "requests_per_second": len(latencies) / seconds,
+        "objects_per_second": len(latencies) * objects_per_request / seconds,
+        "latency_ms": {
+            **{f"p{percentile:g}": float(np.percentile(latencies_ms, percentile)) for percentile in PERCENTILES},
+            "mean": float(latencies_ms.mean()),
+            "max": float(latencies_ms.max()),
+        },
+        "server": stats,
+    }
+
+def start_server(window_ms):
+    """Start a server subprocess on a free port, returning (process, host, port)"""
+    process = subprocess.Popen([sys.executable, SERVER, "--port", "0", "--window-ms", str(window_ms)],
+                               stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line.startswith("Listening on http://"):
+        process.kill()
+        raise RuntimeError(f"Server failed to start: {line!r}")
+    host, port = line.strip()[len("Listening on http://"):].rsplit(":", 1)
+    return process, host, int(port)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--windows-ms", type=float, nargs="+", default=[0.0, 1.0, 2.0, 5.0])
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--requests", type=int, default=200, help="requests per client")
+    parser.add_argument("--objects-per-request", type=int, default=1)
+    parser.add_argument("--distinct-bodies", type=int, default=1_000)
+    parser.add_argument("--url", help="HOST:PORT of a running server instead of starting one per window")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON document to this file instead of stdout")
+    args = parser.parse_args()
+
+    bodies = request_bodies(args.distinct_bodies, args.objects_per_request, args.seed)
+    report = {
+        "benchmark": "server",
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "runs": [],
+    }
+    if args.url:
+        host, port = args.url.rsplit(":", 1)
+        run = asyncio.run(generate_load(host, int(port), bodies, args.clients, args.requests,
+                                        args.objects_per_request))
+        report["runs"].append(dict(run, url=args.url))
+    for window_ms in ([] if args.url else args.windows_ms):
+        process, host, port = start_server(window_ms)
+        try:
+            run = asyncio.run(generate_load(host, port, bodies, args.clients, args.requests,
+                                            args.objects_per_request))
+        finally:
+            process.terminate()
+            process.wait()
+        report["runs"].append(dict(run, window_ms=window_ms))
+
+    document = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(document + "\n")
+    else:
+        print(document)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmarks for the perception checks.
+
+Usage: python benchmarks/bench_throughput.py [--sizes N [N ...]] [--output FILE]
+
+Micro-benchmarks time every scalar check of ``perception_engine`` and the
+helpers ``is_dep_obj_probably_video_ghost`` / ``is_moving_towards_ego_lane``
+(nanoseconds per call), and every vectorized check of ``perception_batch``
+(nanoseconds per object). End-to-end benchmarks report objects/second for
+
+* ``single``: ``evaluate_object`` on ObjectData instances
+* ``single_cached``: ``CheckCache.evaluate_object`` on the same instances
+  (every lookup misses, this is the cost of the cache key)
+* ``single_cached_repeated``: ``CheckCache.evaluate_object`` evaluating every
+  instance ``--repeats`` times in a row, as stationary objects do over
+  consecutive cycles
+* ``batch``: ``evaluate_batch`` over the corpus in batches of ``--batch-size``
+* ``replay_columnar``: ``replay`` of a memory-mapped columnar recording
+* ``replay_jsonl``: ``replay`` of a JSONL recording
+
+on synthetic corpora of each requested size. The scalar and JSONL modes run
+on at most ``--scalar-limit`` objects of each corpus. Results are printed (or
+written) as one JSON document for comparison across commits.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from perception_batch import FILTER_TYPES, FIXED_CHECKS, OBJECT_TYPES, ObjectBatch, evaluate_batch
+from perception_cache import CheckCache
+from perception_columnar import ColumnarWriter
+from perception_engine import (
+    CHECKS,
+    CHECK_NAMES,
+    Parameters,
+    evaluate_object,
+    is_dep_obj_probably_video_ghost,
+    is_moving_towards_ego_lane,
+)
+from perception_records import ObjectTable
+from perception_replay import encode_cycle_record, replay, write_jsonl_records
+
+def synthetic_batch(size, rng):
+    """Random objects covering the hit and miss branches of every check"""
+    def counts(values):
+        return rng.choice(values, size)
+
+    return ObjectBatch({
+        "state_x": rng.uniform(-20.0, 150.0, size),
+        "state_y": rng.uniform(-8.0, 8.0, size),
+        "state_vx": rng.uniform(-5.0, 5.0, size),
+        "state_vy": rng.uniform(-6.0, 6.0, size),
+        "is_object_vru": rng.random(size) < 0.5,
+        "rcs": rng.uniform(-25.0, 10.0, size),
+        "num_cycles_existing": rng.integers(0, 300, size),
+        "filter_type": rng.integers(0, len(FILTER_TYPES), size),
+        "prob_has_been_observed_moving": rng.random(size) * 0.3,
+        "prob_is_currently_moving": rng.random(size) * 0.3,
+        "total_num_radar_updates": counts([0, 0, 1, 2, 3, 4, 5, 9, 12, 40]),
+        "total_num_video_updates": counts([0, 0, 1, 2, 3, 4, 5, 9, 12, 40]),
+        "total_num_front_left_corner_updates": counts([0, 0, 0, 1, 3]),
+        "total_num_front_right_corner_updates": counts([0, 0, 0, 1, 3]),
+        "total_num_front_center_location_radar_updates": counts([0, 1, 2, 3, 9, 12]),
+        "updates_since_last_video_update": counts([0, 0, 1, 2, 5, 12]),
+        "updates_since_last_radar_update": counts([0, 0, 1, 2, 5, 12]),
+        "avg_dx_innovation": rng.uniform(-3.0, 3.0, size),
+        "elevation": rng.uniform(0.0, 5.0, size),
+        "elevation_is_valid": rng.random(size) < 0.7,
+        "number_micro_doppler_cycles": counts([0, 0, 1, 3]),
+        "expected_vr_high_enough_for_mu_doppler_counter": counts([0, 1, 2, 5]),
+        "vy_unreliable_accumulated": rng.uniform(0.0, 3.0, size),
+        "total_num_cycles_with_oncoming_locations": counts([0, 0, 2]),
+        "most_probable_conditional_type": rng.integers(0, len(OBJECT_TYPES), size),
+        "video_inv_ttc": np.where(rng.random(size) < 0.5, 0.0, np.inf),
+        "is_suppressed_until_next_video_update": rng.random(size) < 0.2,
+        "is_suppressed_due_to_video_otc_post_processing": rng.random(size) < 0.2,
+        "is_updated_with_stat_loc_with_high_mdoppler_with_outgoing_vr": rng.random(size) < 0.5,
+        "ego_velocity_x": rng.uniform(0.0, 30.0, size),
+        "ego_acceleration_y": rng.uniform(-1.0, 1.0, size),
+        "ego_yaw_rate": np.where(rng.random(size) < 0.5, 0.0, rng.uniform(-0.3, 0.3, size)),
+        "abs_vel_over_ground_x": rng.uniform(-1.0, 10.0, size) * counts([0.0, 0.1, 1.0]),
+        "abs_vel_over_ground_y": rng.uniform(-2.0, 10.0, size) * counts([0.0, 0.1, 1.0]),
+    })
+
+def synthetic_corpus(size, batch_size, seed):
+    """Yield a synthetic corpus of size objects in batches of at most batch_size"""
+    rng = np.random.default_rng(seed)
+    for start in range(0, size, batch_size):
+        yield synthetic_batch(min(batch_size, size - start), rng)
+
+def scalar_objects(batch):
+    """(ObjectData, EgoVehicleData, abs_vel_over_ground) triples of a batch"""
+    return [(record.to_object_data(), record.ego, record.abs_vel_over_ground)
+            for record in ObjectTable.from_batch(batch)]
+
+def best_time(fn, repeat):
+    """Best wall time of repeat calls"""
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+def micro_benchmarks(objects, batch, params, repeat):
+    """Per-call time of every scalar check and helper, per-object time of every vectorized check"""
+    results = {"scalar_ns_per_call": {}, "batch_ns_per_object": {}}
+    scalar = results["scalar_ns_per_call"]
+    for name, check in zip(CHECK_NAMES, CHECKS):
+        seconds = best_time(lambda: [check(obj, ego, params, abs_vel) for obj, ego, abs_vel in objects], repeat)
+        scalar[name] = seconds / len(objects) * 1e9
+    seconds = best_time(lambda: [is_dep_obj_probably_video_ghost(obj) for obj, _, _ in objects], repeat)
+    scalar["is_dep_obj_probably_video_ghost"] = seconds / len(objects) * 1e9
+    seconds = best_time(lambda: [is_moving_towards_ego_lane(obj.state.y, obj.state.vy, abs_vel[1])
+                                 for obj, _, abs_vel in objects], repeat)
+    scalar["is_moving_towards_ego_lane"] = seconds / len(objects) * 1e9
+
+    vectorized = results["batch_ns_per_object"]
+    for name, check in FIXED_CHECKS.items():
+        vectorized[name] = best_time(lambda: check(batch.columns), repeat) / len(batch) * 1e9
+    vectorized["evaluate_batch"] = best_time(lambda: evaluate_batch(batch, params), repeat) / len(batch) * 1e9
+    return results
+
+def throughput(mode, size, num_objects, seconds):
+    return {
+        "mode": mode,
+        "corpus_size": size,
+        "objects": num_objects,
+        "seconds": seconds,
+        "objects_per_second": num_objects / seconds if seconds else None,
+    }
+
+def write_columnar(path, corpus, objects_per_cycle):
+    """Write a corpus as a columnar recording with objects_per_cycle objects per cycle"""
+    cycle = 0
+    with ColumnarWriter(path) as writer:
+        for batch in corpus:
+            for start in range(0, len(batch), objects_per_cycle):
+                writer.append(cycle, batch.take(slice(start, start + objects_per_cycle)))
+                cycle += 1
+
+def write_jsonl(path, objects, objects_per_cycle):
+    """Write scalar objects as a JSONL recording with objects_per_cycle objects per cycle"""
+    def records():
+        for cycle, start in enumerate(range(0, len(objects), objects_per_cycle)):
+            chunk = objects[start:start + objects_per_cycle]
+            yield encode_cycle_record(cycle, chunk[0][1], [obj for obj, _, _ in chunk],
+                                      [abs_vel for _, _, abs_vel in chunk])
+
+    with open(path, "w") as f:
+        write_jsonl_records(records(), f)
+
+def end_to_end_benchmarks(size, params, args, workdir):
+    """Objects/second of every evaluation mode on one synthetic corpus size"""
+    sample = next(synthetic_corpus(min(size, args.scalar_limit), args.scalar_limit, args.seed))
+    objects = scalar_objects(sample)
+    results = []
+
+    start = time.perf_counter()
+    for obj, ego, abs_vel in objects:
+        evaluate_object(obj, ego, params, abs_vel)
+    results.append(throughput("single", size, len(objects), time.perf_counter() - start))
+
+    cache = CheckCache()
+    start = time.perf_counter()
+    for obj, ego, abs_vel in objects:
+        cache.evaluate_object(obj, ego, params, abs_vel)
+    results.append(dict(throughput("single_cached", size, len(objects), time.perf_counter() - start),
+                        hit_rate=cache.hit_rate))
+
+    cache = CheckCache()
+    start = time.perf_counter()
+    for obj, ego, abs_vel in objects:
+        for _ in range(args.repeats):
+            cache.evaluate_object(obj, ego, params, abs_vel)
+    results.append(dict(throughput("single_cached_repeated", size, len(objects) * args.repeats,
+                                   time.perf_counter() - start), hit_rate=cache.hit_rate))
+
+    seconds = 0.0
+    for batch in synthetic_corpus(size, args.batch_size, args.seed):
+        start = time.perf_counter()
+        evaluate_batch(batch, params)
+        seconds += time.perf_counter() - start
+    results.append(throughput("batch", size, size, seconds))
+
+    columnar_path = os.path.join(workdir, f"corpus_{size}.perc")
+    write_columnar(columnar_path, synthetic_corpus(size, args.batch_size, args.seed), args.objects_per_cycle)
+    start = time.perf_counter()
+    stats = replay(columnar_path, params)
+    results.append(throughput("replay_columnar", size, stats.num_objects, time.perf_counter() - start))
+
+    jsonl_path = os.path.join(workdir, f"corpus_{size}.jsonl")
+    write_jsonl(jsonl_path, objects, args.objects_per_cycle)
+    start = time.perf_counter()
+    stats = replay(jsonl_path, params)
+    results.append(throughput("replay_jsonl", size, stats.num_objects, time.perf_counter() - start))
+    return results
+
+def git_commit():
+    """Current commit of the repository, None outside a git checkout"""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 10_000_000])
+    parser.add_argument("--batch-size", type=int, default=1_000_000)
+    parser.add_argument("--scalar-limit", type=int, default=20_000)
+    parser.add_argument("--micro-objects", type=int, default=10_000)
+    parser.add_argument("--objects-per-cycle", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the JSON document to this file instead of stdout")
+    args = parser.parse_args()
+    params = Parameters()
+
+    micro_batch = next(synthetic_corpus(args.micro_objects, args.micro_objects, args.seed))
+    report = {
+        "benchmark": "throughput",
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "micro": micro_benchmarks(scalar_objects(micro_batch), micro_batch, params, args.repeat),
+        "end_to_end": [],
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in args.sizes:
+            report["end_to_end"].extend(end_to_end_benchmarks(size, params, args, workdir))
+
+    document = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(document + "\n")
+    else:
+        print(document)
+
+if __name__ == "__main__":
+    main()
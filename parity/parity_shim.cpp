@@ -0,0 +1,97 @@
+// C entry point of the parity harness: evaluates the Dc::Per::Dep checks
+// extracted from inputFile.cpp over a flat array of objects and packs the
+// results like perception_batch.pack_hit_matrix.
+
+#include "per/variation_points/depPolicies/inc/postProcessing/per_depPostProcessingAlgos.hpp"
+
+#include "envmodel_lib/postProcessing/per_postProcessingHelper.hpp"
+
+#include "prm/gen/PerParam/api/prm_PerParam_cfg.hpp"
+
+bool prm::PerParam::CCfg::isMicroDopplerCheckOnStationaryVruApplied = true;
+
+namespace
+{
+constexpr int           numChecks          = 15;
+constexpr vfc::uint32_t disqualifiedForAeb = 1U << 16U;
+constexpr vfc::uint32_t disqualifiedForAcc = 1U << 17U;
+constexpr vfc::uint32_t disqualifiedForVy  = 1U << 18U;
+
+// Hit bit of one check plus the relevance bits it cleared
+vfc::uint32_t checkBits(int index, vfc::uint16_t bitField)
+{
+   vfc::uint32_t bits = 0U;
+   if ((bitField & PostProcessing::relevantForAeb) == 0U)
+   {
+      bits |= disqualifiedForAeb;
+   }
+   if ((bitField & PostProcessing::relevantForAcc) == 0U)
+   {
+      bits |= disqualifiedForAcc;
+   }
+   if ((bitField & PostProcessing::relevantForVyDependentFunctions) == 0U)
+   {
+      bits |= disqualifiedForVy;
+   }
+   return bits == 0U ? 0U : (bits | (1U << index));
+}
+
+vfc::uint32_t evaluateObject(const ParityParams& parityParams, const ParityObject& parityObj)
+{
+   namespace Dep = Dc::Per::Dep;
+
+   const ::Per::InterfaceDep::DepObject        obj(parityObj);
+   const ::Per::Frames::Rot1dAcc2dFor          hvmFor(parityObj);
+   const ::Per::Parameters::DepParameters      params(parityParams);
+   const vfc::linalg::TVectorN<vfc::float32_t, 2> absVel{
+      {parityObj.abs_vel_over_ground_x, parityObj.abs_vel_over_ground_y}};
+   const bool isVru = parityObj.is_object_vru != 0;
+
+   vfc::uint16_t bitFields[numChecks];
+   for (vfc::uint16_t& bitField : bitFields)
+   {
+      bitField = PostProcessing::relevantForAllFunctions;
+   }
+
+   Dep::applySuppressionUntilNextVideoUpdateCheck(obj, bitFields[0]);
+   Dep::applyPostProcessVideoOtcCheck(obj, bitFields[1]);
+   Dep::applyUpdatedWithStatLocWithHighMDopplerWithOutgoingVrCheck(obj, absVel, isVru, bitFields[4]);
+   Dep::applyIsMeasuredRatioCheckForFastWnj(absVel, obj, bitFields[5]);
+   Dep::applyNonCrossingObjectCheck(obj, absVel, bitFields[6]);
+   Dep::applyMicroDopplerCheck(isVru, absVel, obj, params, bitFields[7]);
+   Dep::applyRadarOnlyRcsAndDrInnovationLimit(obj, bitFields[8]);
+   Dep::applyElevationCheck(obj, absVel, isVru, params, bitFields[9]);
+   Dep::applyInnovationCheck(hvmFor, obj, isVru, params, bitFields[10]);
+   Dep::applyImplausibleVyVruCheck(isVru, absVel, hvmFor, obj, params, bitFields[11]);
+   Dep::applyImplausibleVideoTtcForVru(isVru, obj, bitFields[12]);
+   Dep::applyRadarOnlyNLDCheck(hvmFor, obj, bitFields[13]);
+   Dep::applyRadarOnlyStationaryCheck(absVel, obj, bitFields[14]);
+
+   vfc::uint32_t bits = 0U;
+   for (int index = 0; index < numChecks; ++index)
+   {
+      bits |= checkBits(index, bitFields[index]);
+   }
+   // The two helpers return a flag and carry no function relevance
+   if (Dep::isMovingTowardsEgoLane(parityObj.state_y, parityObj.state_vy, parityObj.abs_vel_over_ground_y))
+   {
+      bits |= 1U << 2U;
+   }
+   if (Dep::isDepObjProbablyVideoGhost(obj))
+   {
+      bits |= 1U << 3U;
+   }
+   return bits;
+}
+}  // namespace
+
+extern "C" void parity_evaluate(
+   const ParityParams* params, const ParityObject* objects, std::int64_t count, vfc::uint32_t* bits)
+{
+   prm::PerParam::CCfg::isMicroDopplerCheckOnStationaryVruApplied =
+      params->is_micro_doppler_check_on_stationary_vru_applied != 0;
+   for (std::int64_t index = 0; index < count; ++index)
+   {
+      bits[index] = evaluateObject(*params, objects[index]);
+   }
+}
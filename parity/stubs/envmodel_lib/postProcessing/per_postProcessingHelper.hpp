@@ -0,0 +1,29 @@
+// Stand-in for the post-processing helper: function relevance bits start
+// set and are cleared by the disqualify* calls.
+#pragma once
+
+#include "vfc_stub.hpp"
+
+namespace PostProcessing
+{
+constexpr vfc::uint16_t relevantForAeb                  = 1U << 0U;
+constexpr vfc::uint16_t relevantForAcc                  = 1U << 1U;
+constexpr vfc::uint16_t relevantForVyDependentFunctions = 1U << 2U;
+constexpr vfc::uint16_t relevantForAllFunctions =
+   relevantForAeb | relevantForAcc | relevantForVyDependentFunctions;
+
+inline void disqualifyForAeb(vfc::uint16_t& bitField)
+{
+   bitField = static_cast<vfc::uint16_t>(bitField & ~relevantForAeb);
+}
+
+inline void disqualifyForAebAndAcc(vfc::uint16_t& bitField)
+{
+   bitField = static_cast<vfc::uint16_t>(bitField & ~(relevantForAeb | relevantForAcc));
+}
+
+inline void disqualifyForVyDependentFunctions(vfc::uint16_t& bitField)
+{
+   bitField = static_cast<vfc::uint16_t>(bitField & ~relevantForVyDependentFunctions);
+}
+}  // namespace PostProcessing
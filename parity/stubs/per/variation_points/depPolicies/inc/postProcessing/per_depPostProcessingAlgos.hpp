@@ -0,0 +1,75 @@
+// Declarations of the Dc::Per::Dep functions compiled by the parity harness.
+#pragma once
+
+#include "per_types_stub.hpp"
+
+namespace Dc
+{
+namespace Per
+{
+namespace Dep
+{
+void applySuppressionUntilNextVideoUpdateCheck(
+   const ::Per::InterfaceDep::DepObject& obj, vfc::uint16_t& functionRelevanceBitField);
+void applyPostProcessVideoOtcCheck(
+   const ::Per::InterfaceDep::DepObject& obj, vfc::uint16_t& functionRelevanceBitField);
+bool isMovingTowardsEgoLane(
+   const vfc::float32_t dyObj, const vfc::float32_t vyObjRel, const vfc::float32_t vyObjOverGround);
+bool isDepObjProbablyVideoGhost(const ::Per::InterfaceDep::DepObject& depObj);
+void applyUpdatedWithStatLocWithHighMDopplerWithOutgoingVrCheck(
+   const ::Per::InterfaceDep::DepObject&          obj,
+   const vfc::linalg::TVectorN<vfc::float32_t, 2> absVelOverGround,
+   const bool                                     isObjectVru,
+   vfc::uint16_t&                                 functionRelevanceBitField);
+void applyIsMeasuredRatioCheckForFastWnj(
+   const vfc::linalg::TVectorN<vfc::float32_t, 2> absVelOverGround,
+   const ::Per::InterfaceDep::DepObject&          obj,
+   vfc::uint16_t&                                 functionRelevanceBitField);
+void applyNonCrossingObjectCheck(
+   const ::Per::InterfaceDep::DepObject&          obj,
+   const vfc::linalg::TVectorN<vfc::float32_t, 2> absVelOverGround,
+   vfc::uint16_t&                                 functionRelevanceBitField);
+void applyMicroDopplerCheck(
+   const bool                                     isObjectVru,
+   const vfc::linalg::TVectorN<vfc::float32_t, 2> absVelOverGround,
+   const ::Per::InterfaceDep::DepObject&          obj,
+   const ::Per::Parameters::DepParameters&        params,
+   vfc::uint16_t&                                 functionRelevanceBitField);
+void applyRadarOnlyRcsAndDrInnovationLimit(
+   const ::Per::InterfaceDep::DepObject& obj, vfc::uint16_t& functionRelevanceBitField);
+void applyElevationCheck(
+   const ::Per::InterfaceDep::DepObject&          obj,
+   const vfc::linalg::TVectorN<vfc::float32_t, 2> absVelOverGround,
+   const bool                                     isObjectVru,
+   const ::Per::Parameters::DepParameters&        params,
+   vfc::uint16_t&                                 functionRelevanceBitField);
+void applyInnovationCheck(
+   const ::Per::Frames::Rot1dAcc2dFor&     hvmFor,
+   const ::Per::InterfaceDep::DepObject&   obj,
+   const bool                              isVruObject,
+   const ::Per::Parameters::DepParameters& params,
+   vfc::uint16_t&                          functionRelevanceBitField);
+vfc::float32_t calcDxInnovationThreshold(
+   const ::Per::Frames::Rot1dAcc2dFor&   hvmFor,
+   const ::Per::InterfaceDep::DepObject& obj,
+   const bool                            isVruObject);
+void applyImplausibleVyVruCheck(
+   const bool                                     isObjectVru,
+   const vfc::linalg::TVectorN<vfc::float32_t, 2> absVelOverGround,
+   const ::Per::Frames::Rot1dAcc2dFor&            hvmFor,
+   const ::Per::InterfaceDep::DepObject&          obj,
+   const ::Per::Parameters::DepParameters&        params,
+   vfc::uint16_t&                                 functionRelevanceBitField);
+void applyImplausibleVideoTtcForVru(
+   const bool isVru, const ::Per::InterfaceDep::DepObject& obj, vfc::uint16_t& functionRelevanceBitField);
+void applyRadarOnlyNLDCheck(
+   const ::Per::Frames::Rot1dAcc2dFor&   hvmFor,
+   const ::Per::InterfaceDep::DepObject& obj,
+   vfc::uint16_t&                        functionRelevanceBitField);
+void applyRadarOnlyStationaryCheck(
+   const vfc::linalg::TVectorN<vfc::float32_t, 2>& absVelOverGround,
+   const ::Per::InterfaceDep::DepObject&           obj,
+   vfc::uint16_t&                                  functionRelevanceBitField);
+}  // namespace Dep
+}  // namespace Per
+}  // namespace Dc
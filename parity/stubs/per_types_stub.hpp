@@ -0,0 +1,263 @@
+// Stand-in object, ego motion and parameter types backed by the flat
+// ParityObject / ParityParams records filled by perception_parity.py.
+#pragma once
+
+#include "vfc_stub.hpp"
+
+extern "C" {
+// All fields are 4 bytes wide, so the layout has no padding; keep in sync
+// with PARITY_OBJECT_FIELDS / PARITY_PARAMS_FIELDS in perception_parity.py.
+struct ParityObject
+{
+   float        state_x, state_y, state_vx, state_vy;
+   float        rcs, prob_has_been_observed_moving, prob_is_currently_moving, avg_dx_innovation;
+   float        elevation, vy_unreliable_accumulated, video_inv_ttc;
+   float        ego_velocity_x, ego_acceleration_y, ego_yaw_rate;
+   float        abs_vel_over_ground_x, abs_vel_over_ground_y;
+   std::int32_t num_cycles_existing, filter_type;
+   std::int32_t total_num_radar_updates, total_num_video_updates;
+   std::int32_t total_num_front_left_corner_updates, total_num_front_right_corner_updates;
+   std::int32_t total_num_front_center_location_radar_updates;
+   std::int32_t updates_since_last_video_update, updates_since_last_radar_update;
+   std::int32_t number_micro_doppler_cycles, expected_vr_high_enough_for_mu_doppler_counter;
+   std::int32_t total_num_cycles_with_oncoming_locations;
+   std::int32_t is_object_vru, elevation_is_valid, is_good_quality_fused_object;
+   std::int32_t is_suppressed_until_next_video_update, is_suppressed_due_to_video_otc_post_processing;
+   std::int32_t is_updated_with_stat_loc_with_high_mdoppler_with_outgoing_vr;
+};
+
+struct ParityParams
+{
+   float        innovation_check_dx_threshold, innovation_check_dy_threshold;
+   float        implausible_vy_thresh_la_hypo;
+   float        elevation_check_dx_limits[2], elevation_check_dz_thresholds[2];
+   std::int32_t is_micro_doppler_check_enabled, min_vru_micro_doppler_cycles;
+   std::int32_t is_micro_doppler_check_on_crossing_vru_applied;
+   std::int32_t is_micro_doppler_check_on_stationary_vru_applied;
+};
+}
+
+namespace Per
+{
+namespace Parameters
+{
+enum class ObstacleSensorIndex
+{
+   frontCenterLocationRadar,
+   frontCenterVideo,
+   frontLeftCornerObjectRadar,
+   frontRightCornerObjectRadar
+};
+
+enum class PerSensorTechs
+{
+   techRadar,
+   techVideo
+};
+
+// Same codes as perception_batch.FILTER_TYPES
+enum class PER_ALGOS_MBF_TYPES
+{
+   TYPE_LA  = 0,
+   TYPE_WNJ = 1,
+   TYPE_KF  = 2
+};
+
+class DepParameters
+{
+public:
+   explicit DepParameters(const ParityParams& params) : m_params(params) {}
+
+   bool           getIsMicroDopplerCheckEnabled() const { return m_params.is_micro_doppler_check_enabled != 0; }
+   vfc::uint16_t  getMinVruMicroDopplerCycles() const
+   {
+      return static_cast<vfc::uint16_t>(m_params.min_vru_micro_doppler_cycles);
+   }
+   bool getIsMicroDopplerCheckOnCrossingVruApplied() const
+   {
+      return m_params.is_micro_doppler_check_on_crossing_vru_applied != 0;
+   }
+   vfc::float32_t getInnovationCheckDxThreshold() const { return m_params.innovation_check_dx_threshold; }
+   vfc::float32_t getInnovationCheckDyThreshold() const { return m_params.innovation_check_dy_threshold; }
+   vfc::float32_t getImplausibleVyThreshLAHypo() const { return m_params.implausible_vy_thresh_la_hypo; }
+   const vfc::float32_t* getElevationCheckDxLimits() const { return m_params.elevation_check_dx_limits; }
+   const vfc::float32_t* getElevationCheckDzThresholds() const { return m_params.elevation_check_dz_thresholds; }
+
+private:
+   const ParityParams& m_params;
+};
+}  // namespace Parameters
+
+namespace Frames
+{
+class Rot1dAcc2dFor
+{
+public:
+   explicit Rot1dAcc2dFor(const ParityObject& obj) : m_obj(obj) {}
+
+   vfc::float32_t getVelocity(unsigned index) const { return index == 0U ? m_obj.ego_velocity_x : 0.F; }
+   vfc::float32_t getAcceleration(unsigned index) const { return index == 1U ? m_obj.ego_acceleration_y : 0.F; }
+   vfc::float32_t getAngleDt(unsigned) const { return m_obj.ego_yaw_rate; }
+
+private:
+   const ParityObject& m_obj;
+};
+}  // namespace Frames
+
+namespace InterfaceDep
+{
+class ObjectState
+{
+public:
+   explicit ObjectState(const ParityObject& obj) : m_obj(obj) {}
+
+   vfc::float32_t getX() const { return m_obj.state_x; }
+   vfc::float32_t getY() const { return m_obj.state_y; }
+   vfc::float32_t getPosition(unsigned index) const { return index == 0U ? m_obj.state_x : m_obj.state_y; }
+   vfc::float32_t getVelocity(unsigned index) const { return index == 0U ? m_obj.state_vx : m_obj.state_vy; }
+
+private:
+   const ParityObject& m_obj;
+};
+
+// Sensor helper with the sensor mapping used by the Python emulator:
+// front center video and the video technology share the video counters,
+// front center location radar "since last update" uses the radar counter.
+class SensorFilterFusHelper
+{
+public:
+   explicit SensorFilterFusHelper(const ParityObject& obj) : m_obj(obj) {}
+
+   vfc::uint8_t getTotalNumSensorUpdates(::Per::Parameters::ObstacleSensorIndex sensor) const
+   {
+      switch (sensor)
+      {
+         case ::Per::Parameters::ObstacleSensorIndex::frontCenterLocationRadar:
+            return static_cast<vfc::uint8_t>(m_obj.total_num_front_center_location_radar_updates);
+         case ::Per::Parameters::ObstacleSensorIndex::frontCenterVideo:
+            return static_cast<vfc::uint8_t>(m_obj.total_num_video_updates);
+         case ::Per::Parameters::ObstacleSensorIndex::frontLeftCornerObjectRadar:
+            return static_cast<vfc::uint8_t>(m_obj.total_num_front_left_corner_updates);
+         default:
+            return static_cast<vfc::uint8_t>(m_obj.total_num_front_right_corner_updates);
+      }
+   }
+
+   vfc::uint8_t getTotalNumSensorUpdates(::Per::Parameters::PerSensorTechs tech) const
+   {
+      return static_cast<vfc::uint8_t>(
+         tech == ::Per::Parameters::PerSensorTechs::techRadar ? m_obj.total_num_radar_updates
+                                                              : m_obj.total_num_video_updates);
+   }
+
+   vfc::uint8_t getUpdatesSinceLastSensorUpdate(::Per::Parameters::ObstacleSensorIndex sensor) const
+   {
+      return static_cast<vfc::uint8_t>(
+         sensor == ::Per::Parameters::ObstacleSensorIndex::frontCenterVideo ? m_obj.updates_since_last_video_update
+                                                                            : m_obj.updates_since_last_radar_update);
+   }
+
+   vfc::uint8_t getUpdatesSinceLastSensorUpdate(::Per::Parameters::PerSensorTechs tech) const
+   {
+      return static_cast<vfc::uint8_t>(
+         tech == ::Per::Parameters::PerSensorTechs::techVideo ? m_obj.updates_since_last_video_update
+                                                              : m_obj.updates_since_last_radar_update);
+   }
+
+   bool isOnlyUpdatedBySensorXIgnoringEnvModelSensor(::Per::Parameters::ObstacleSensorIndex sensor) const
+   {
+      return m_obj.total_num_video_updates == 0 && getTotalNumSensorUpdates(sensor) > 0U;
+   }
+
+   bool isGoodQualityFusedObject(::Per::Parameters::ObstacleSensorIndex, ::Per::Parameters::ObstacleSensorIndex) const
+   {
+      return m_obj.is_good_quality_fused_object != 0;
+   }
+
+private:
+   const ParityObject& m_obj;
+};
+
+class DepObject
+{
+public:
+   explicit DepObject(const ParityObject& obj) : sensorFilterFusHelper(obj), m_obj(obj), m_state(obj) {}
+
+   SensorFilterFusHelper sensorFilterFusHelper;
+
+   const ObjectState& getState() const { return m_state; }
+   bool               getIsSuppressedUntilNextVideoUpdate() const { return m_obj.is_suppressed_until_next_video_update != 0; }
+   bool               getIsSuppressedDueToVideoOtcPostProcessing() const
+   {
+      return m_obj.is_suppressed_due_to_video_otc_post_processing != 0;
+   }
+   bool getIsUpdatedWithStatLocWithHighMDopplerWithOutgoingVr() const
+   {
+      return m_obj.is_updated_with_stat_loc_with_high_mdoppler_with_outgoing_vr != 0;
+   }
+   vfc::uint16_t getNumberMicroDopplerCycles() const
+   {
+      return static_cast<vfc::uint16_t>(m_obj.number_micro_doppler_cycles);
+   }
+   vfc::uint16_t getExpectedVrHighEnoughForMuDopplerCounter() const
+   {
+      return static_cast<vfc::uint16_t>(m_obj.expected_vr_high_enough_for_mu_doppler_counter);
+   }
+   vfc::uint16_t getTotalNumCyclesWithOncomingLocations() const
+   {
+      return static_cast<vfc::uint16_t>(m_obj.total_num_cycles_with_oncoming_locations);
+   }
+   vfc::uint16_t get_numCyclesExisting() const { return static_cast<vfc::uint16_t>(m_obj.num_cycles_existing); }
+   ::Per::Parameters::PER_ALGOS_MBF_TYPES get_filterType() const
+   {
+      return static_cast<::Per::Parameters::PER_ALGOS_MBF_TYPES>(m_obj.filter_type);
+   }
+   vfc::float32_t get_rcs() const { return m_obj.rcs; }
+   vfc::float32_t get_probIsCurrentlyMoving() const { return m_obj.prob_is_currently_moving; }
+   vfc::float32_t get_probHasBeenObservedMoving() const { return m_obj.prob_has_been_observed_moving; }
+   vfc::float32_t getAvgDxInnovation() const { return m_obj.avg_dx_innovation; }
+   bool           elevation_isValid() const { return m_obj.elevation_is_valid != 0; }
+   vfc::float32_t get_elevation() const { return m_obj.elevation; }
+   vfc::float32_t getVyUnreliableAccumulated() const { return m_obj.vy_unreliable_accumulated; }
+   vfc::float32_t getVideoInvTtc() const { return m_obj.video_inv_ttc; }
+   vfc::float32_t absVelOverGround(unsigned index) const
+   {
+      return index == 0U ? m_obj.abs_vel_over_ground_x : m_obj.abs_vel_over_ground_y;
+   }
+
+private:
+   const ParityObject& m_obj;
+   ObjectState         m_state;
+};
+}  // namespace InterfaceDep
+
+namespace Algos
+{
+namespace InterpolatingFcts
+{
+// Linear interpolation over two supporting points, constant outside of them
+inline vfc::float32_t linearInterpolateConstantExtrapolate(
+   const vfc::float32_t* xs, const vfc::float32_t* ys, vfc::float32_t x)
+{
+   if (x <= xs[0])
+   {
+      return ys[0];
+   }
+   if (x >= xs[1])
+   {
+      return ys[1];
+   }
+   return ys[0] + ((x - xs[0]) / (xs[1] - xs[0])) * (ys[1] - ys[0]);
+}
+}  // namespace InterpolatingFcts
+
+namespace ObjectFunctions
+{
+inline vfc::float32_t calcTotalAbsVelocityOverGround(
+   const ::Per::InterfaceDep::DepObject& obj, const ::Per::Frames::Rot1dAcc2dFor&)
+{
+   return std::hypot(obj.absVelOverGround(0U), obj.absVelOverGround(1U));
+}
+}  // namespace ObjectFunctions
+}  // namespace Algos
+}  // namespace Per
@@ -0,0 +1,17 @@
+// Stand-in for the generated PerParam configuration; values are set by the
+// parity shim from the Parameters of the current batch.
+#pragma once
+
+namespace prm
+{
+namespace PerParam
+{
+class CCfg
+{
+public:
+   static bool get_isMicroDopplerCheckOnStationaryVruApplied() { return isMicroDopplerCheckOnStationaryVruApplied; }
+
+   static bool isMicroDopplerCheckOnStationaryVruApplied;
+};
+}  // namespace PerParam
+}  // namespace prm
@@ -0,0 +1,79 @@
+// Minimal stand-in for the vfc library, covering what the emulated
+// Dc::Per::Dep functions of inputFile.cpp use.
+#pragma once
+
+#include <cmath>
+#include <cstdint>
+#include <limits>
+
+#define VFC_STATIC_ASSERT2(cond, msg) static_assert(cond, msg)
+
+namespace vfc
+{
+using float32_t = float;
+using uint8_t   = std::uint8_t;
+using uint16_t  = std::uint16_t;
+using uint32_t  = std::uint32_t;
+
+template <typename T>
+using numeric_limits = std::numeric_limits<T>;
+
+namespace linalg
+{
+template <typename T, int N>
+struct TVectorN
+{
+   T        values[N];
+   T&       operator[](int index) { return values[index]; }
+   const T& operator[](int index) const { return values[index]; }
+};
+}  // namespace linalg
+
+template <typename T>
+inline T abs(T value)
+{
+   return std::fabs(value);
+}
+
+template <typename T>
+inline T min(T left, T right)
+{
+   return right < left ? right : left;
+}
+
+template <typename T>
+inline T divide(T numerator, T denominator)
+{
+   return numerator / denominator;
+}
+
+template <typename T>
+inline bool isNegative(T value)
+{
+   return value < static_cast<T>(0);
+}
+
+template <typename T>
+inline bool isPositive(T value)
+{
+   return value > static_cast<T>(0);
+}
+
+template <typename T>
+inline bool notZero(T value)
+{
+   return value != static_cast<T>(0);
+}
+
+template <typename T>
+inline bool isEqual(T left, T right, T epsilon)
+{
+   return std::fabs(left - right) <= epsilon;
+}
+
+template <typename T>
+constexpr T typedDegree2Radian()
+{
+   return static_cast<T>(3.14159265358979323846 / 180.0);
+}
+}  // namespace vfc
@@ -0,0 +1,515 @@
+"""
+Vectorized batch evaluation of the perception checks.
+
+Objects are held as a struct of arrays: one NumPy column per ``ObjectData`` /
+``SensorFilterFusHelper`` field plus the ego motion and absolute velocity over
+ground of every object. ``evaluate_batch`` runs every check from
+``perception_engine`` over all objects at once and returns a boolean hit matrix
+of shape ``(N, len(CHECK_NAMES))``. Requires NumPy.
+
+``evaluate_batch(..., float32=True)`` evaluates a float32-faithful copy of the
+batch (``ObjectBatch.to_float32``) instead: every float column is a float32
+array and every check computes in float32 like the C++ ``vfc::float32_t``
+code, with its constants rounded to float32, ``vfc::divide`` as float32
+division and ``numeric_limits<float32_t>::max()`` as the invalid video TTC
+sentinel.
+"""
+
+import math
+import typing
+from dataclasses import fields
+from typing import Dict, Iterable, List, Optional, Sequence, Union
+
+import numpy as np
+
+from perception_engine import (
+    CHECK_NAMES,
+    CHECK_RELEVANCE,
+    EGO_DRIVING_STRAIGHT_ACCELERATION_THRESHOLD,
+    EGO_DRIVING_STRAIGHT_ANGLE_DT_THRESHOLD,
+    EGO_DRIVING_STRAIGHT_RADIUS,
+    RELEVANCE_BIT_NAMES,
+    EgoVehicleData,
+    ObjectData,
+    ObjectState,
+    Parameters,
+    SensorFilterFusHelper,
+    get_instrumentation,
+)
+
+# Categorical string fields are stored as small integer codes
+FILTER_TYPES = ("LA", "WNJ", "KF")
+OBJECT_TYPES = ("PEDESTRIAN", "CAR", "TRUCK", "2WHEELER", "BICYCLE", "MOTORCYCLE",
+                "UNKNOWN", "OBSTACLE", "OBSTACLE_MOBILE")
+CATEGORIES = {
+    "filter_type": FILTER_TYPES,
+    "most_probable_conditional_type": OBJECT_TYPES,
+}
+UNKNOWN_CATEGORY = -1
+
+# vfc::numeric_limits<vfc::float32_t>::max(); the emulator's doubles use inf instead
+FLT_MAX = np.finfo(np.float32).max
+
+# Two-element innovation lists are split into one column per component
+INNOVATION_COMPONENTS = ("dr", "alpha")
+
+_SCALAR_DTYPES = {
+    float: np.float64,
+    int: np.int32,
+    bool: np.bool_,
+    str: np.int8,
+}
+
+def _build_columns():
+    """Derive the column layout from the ObjectData dataclasses"""
+    columns = {}
+    for state_field in fields(ObjectState):
+        columns[f"state_{state_field.name}"] = np.dtype(np.float64)
+    for sensor_field in fields(SensorFilterFusHelper):
+        columns[sensor_field.name] = np.dtype(_SCALAR_DTYPES[sensor_field.type])
+    hints = typing.get_type_hints(ObjectData)
+    for obj_field in fields(ObjectData):
+        hint = hints[obj_field.name]
+        if hint in (ObjectState, SensorFilterFusHelper):
+            continue
+        if hint == List[float]:
+            for component in INNOVATION_COMPONENTS:
+                columns[f"{obj_field.name}_{component}"] = np.dtype(np.float64)
+        else:
+            columns[obj_field.name] = np.dtype(_SCALAR_DTYPES[hint])
+    for ego_field in fields(EgoVehicleData):
+        columns[f"ego_{ego_field.name}"] = np.dtype(np.float64)
+    columns["abs_vel_over_ground_x"] = np.dtype(np.float64)
+    columns["abs_vel_over_ground_y"] = np.dtype(np.float64)
+    return columns
+
+# Column name -> dtype, in a stable order
+OBJECT_COLUMNS: Dict[str, np.dtype] = _build_columns()
+
+def encode_category(column, value):
+    """Encode a categorical string value as its integer code"""
+    try:
+        return CATEGORIES[column].index(value)
+    except ValueError:
+        return UNKNOWN_CATEGORY
+
+def decode_category(column, code):
+    """Decode an integer code back to its categorical string value"""
+    values = CATEGORIES[column]
+    return values[code] if 0 <= code < len(values) else "UNKNOWN"
+
+def object_to_row(obj: ObjectData, ego: EgoVehicleData, abs_vel_over_ground: Sequence[float]) -> Dict[str, Union[float, int, bool]]:
+    """Flatten one object and its ego context into a column-name -> value row"""
+    row = {}
+    for state_field in fields(ObjectState):
+        row[f"state_{state_field.name}"] = getattr(obj.state, state_field.name)
+    for sensor_field in fields(SensorFilterFusHelper):
+        row[sensor_field.name] = getattr(obj.sensor_filter_fus_helper, sensor_field.name)
+    for obj_field in fields(ObjectData):
+        value = getattr(obj, obj_field.name)
+        if isinstance(value, (ObjectState, SensorFilterFusHelper)):
+            continue
+        if isinstance(value, list):
+            for component, component_value in zip(INNOVATION_COMPONENTS, value):
+                row[f"{obj_field.name}_{component}"] = component_value
+        elif obj_field.name in CATEGORIES:
+            row[obj_field.name] = encode_category(obj_field.name, value)
+        else:
+            row[obj_field.name] = value
+    for ego_field in fields(EgoVehicleData):
+        row[f"ego_{ego_field.name}"] = getattr(ego, ego_field.name)
+    row["abs_vel_over_ground_x"] = abs_vel_over_ground[0]
+    row["abs_vel_over_ground_y"] = abs_vel_over_ground[1]
+    return row
+
+# Column defaults taken from a default-constructed object
+_DEFAULT_ROW = object_to_row(ObjectData(), EgoVehicleData(), (0.0, 0.0))
+
+class ObjectBatch:
+    """Struct-of-arrays container holding N objects, one array per column"""
+
+    def __init__(self, columns: Dict[str, np.ndarray], float32: bool = False):
+        sizes = {len(values) for values in columns.values()}
+        if len(sizes) > 1:
+            raise ValueError(f"Columns have differing lengths: {sorted(sizes)}")
+        unknown = set(columns) - set(OBJECT_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown columns: {sorted(unknown)}")
+        self.size = sizes.pop() if sizes else 0
+        self.float32 = float32
+        self.columns = {}
+        for name, dtype in OBJECT_COLUMNS.items():
+            if float32 and dtype == np.float64:
+                dtype = np.dtype(np.float32)
+            if name in columns:
+                self.columns[name] = np.asarray(columns[name], dtype=dtype)
+            else:
+                self.columns[name] = np.full(self.size, _DEFAULT_ROW[name], dtype=dtype)
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, name) -> np.ndarray:
+        return self.columns[name]
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Union[float, int, bool]]]) -> "ObjectBatch":
+        """Build a batch from flattened rows as returned by object_to_row"""
+        rows = list(rows)
+        columns = {
+            name: np.fromiter((row.get(name, _DEFAULT_ROW[name]) for row in rows), dtype=dtype, count=len(rows))
+            for name, dtype in OBJECT_COLUMNS.items()
+        }
+        return cls(columns)
+
+    @classmethod
+    def from_objects(cls, objects: Sequence[ObjectData],
+                     ego: Union[EgoVehicleData, Sequence[EgoVehicleData]],
+                     abs_vel_over_ground: Sequence[Sequence[float]]) -> "ObjectBatch":
+        """Build a batch from ObjectData instances sharing one ego or with one ego each"""
+        egos = [ego] * len(objects) if isinstance(ego, EgoVehicleData) else ego
+        return cls.from_rows(object_to_row(obj, obj_ego, abs_vel)
+                             for obj, obj_ego, abs_vel in zip(objects, egos, abs_vel_over_ground))
+
+    def take(self, index) -> "ObjectBatch":
+        """Select a subset of objects by boolean mask or integer index"""
+        return ObjectBatch({name: values[index] for name, values in self.columns.items()}, self.float32)
+
+    def to_float32(self) -> "ObjectBatch":
+        """Copy with float32 float columns, mapping an infinite video TTC to the FLT_MAX sentinel"""
+        if self.float32:
+            return self
+        columns = dict(self.columns)
+        video_inv_ttc = columns["video_inv_ttc"]
+        columns["video_inv_ttc"] = np.where(np.isinf(video_inv_ttc), np.copysign(FLT_MAX, video_inv_ttc), video_inv_ttc)
+        return ObjectBatch(columns, float32=True)
+
+def float_type(c):
+    """Scalar type of the float columns: np.float32 in float32-faithful batches, else np.float64"""
+    return c["state_x"].dtype.type
+
+def divide(numerator, denominator):
+    """vfc::divide in the float type of the operands; the callers' denominators are never zero"""
+    return np.divide(numerator, denominator)
+
+def is_moving_towards_ego_lane(c):
+    """Function 3: isMovingTowardsEgoLane"""
+    dy_obj = c["state_y"]
+    return ((dy_obj * c["state_vy"]) < 0.0) | ((dy_obj * c["abs_vel_over_ground_y"]) < 0.0)
+
+def is_dep_obj_probably_video_ghost(c):
+    """Function 4: isDepObjProbablyVideoGhost"""
+    fc_radar_updates = c["total_num_front_center_location_radar_updates"]
+    is_initial_radar_update_phase = ((fc_radar_updates > 0) & (fc_radar_updates < 3) &
+                                     (c["updates_since_last_radar_update"] == 0))
+    is_tracked_by_video = c["total_num_video_updates"] > 3
+    has_not_been_updated_by_corner_radar = ((c["total_num_front_left_corner_updates"] == 0) &
+                                            (c["total_num_front_right_corner_updates"] == 0))
+    is_almost_video_only = is_tracked_by_video & has_not_been_updated_by_corner_radar & is_initial_radar_update_phase
+    has_no_micro_doppler = ((c["number_micro_doppler_cycles"] == 0) &
+                            (c["expected_vr_high_enough_for_mu_doppler_counter"] > 0))
+    is_very_low_rcs = c["rcs"] < -15.0
+    return is_almost_video_only & has_no_micro_doppler & is_very_low_rcs
+
+def is_front_center_radar_only(c):
+    """Object only updated by the front center location radar"""
+    return (c["total_num_video_updates"] == 0) & (c["total_num_front_center_location_radar_updates"] > 0)
+
+def is_ego_turning(c):
+    """Ego yaw rate above the turning threshold of applyImplausibleVyVruCheck"""
+    ft = float_type(c)
+    turning_ego_yaw_rate_threshold = ft(10.0) * ft(math.pi / 180.0)  # 10 degrees in radians
+    return np.abs(c["ego_yaw_rate"]) > turning_ego_yaw_rate_threshold
+
+def ego_radius(c):
+    """Ego curve radius velocity_x / yaw_rate, infinite without yaw rate"""
+    yaw_rate = c["ego_yaw_rate"]
+    return np.divide(c["ego_velocity_x"], yaw_rate, out=np.full(yaw_rate.shape, np.inf, dtype=yaw_rate.dtype),
+                     where=yaw_rate != 0)
+
+def is_ego_driving_straight(c):
+    """Ego driving straight check used by applyRadarOnlyNLDCheck"""
+    yaw_rate = c["ego_yaw_rate"]
+    return (yaw_rate == 0) | ((np.abs(ego_radius(c)) > EGO_DRIVING_STRAIGHT_RADIUS) |
+                              ((np.abs(c["ego_acceleration_y"]) < EGO_DRIVING_STRAIGHT_ACCELERATION_THRESHOLD) &
+                               (yaw_rate < EGO_DRIVING_STRAIGHT_ANGLE_DT_THRESHOLD)))
+
+def calc_abs_vel_over_ground(c):
+    """Velocities over ground (x, y) of all objects from their relative velocities and the ego motion"""
+    yaw_rate = c["ego_yaw_rate"]
+    return (c["state_vx"] + c["ego_velocity_x"] - yaw_rate * c["state_y"],
+            c["state_vy"] + yaw_rate * c["state_x"])
+
+def apply_updated_with_stat_loc_with_high_mdoppler_with_outgoing_vr_check(c):
+    """Function 6: applyUpdatedWithStatLocWithHighMDopplerWithOutgoingVrCheck"""
+    return (c["is_object_vru"] &
+            (c["abs_vel_over_ground_x"] < 0.2) &
+            (c["abs_vel_over_ground_y"] > 1.0) &
+            (np.abs(c["state_y"]) < 0.5) &
+            c["is_updated_with_stat_loc_with_high_mdoppler_with_outgoing_vr"])
+
+def apply_is_measured_ratio_check_for_fast_wnj(c):
+    """Function 7: applyIsMeasuredRatioCheckForFastWnj"""
+    ft = float_type(c)
+    num_cycles = c["num_cycles_existing"]
+    ratio = divide(c["total_num_radar_updates"].astype(ft), num_cycles.astype(ft) + ft(1.0))
+    return ((c["filter_type"] == FILTER_TYPES.index("WNJ")) &
+            (np.abs(c["abs_vel_over_ground_y"]) > 4.6) &
+            (num_cycles < 255) &
+            (num_cycles > 1) &
+            (ratio < 0.7) &
+            (c["total_num_video_updates"] <= 5))
+
+def apply_non_crossing_object_check(c):
+    """Function 9: applyNonCrossingObjectCheck"""
+    appears_crossing = c["abs_vel_over_ground_y"] > 0.5
+    is_prob_moving_low = (c["prob_is_currently_moving"] < 0.1) & (c["prob_has_been_observed_moving"] < 0.1)
+    is_not_perceived_as_moving_by_radar = ((c["total_num_front_center_location_radar_updates"] > 0) &
+                                           (c["number_micro_doppler_cycles"] == 0) &
+                                           (c["total_num_cycles_with_oncoming_locations"] == 0))
+    return appears_crossing & is_prob_moving_low & is_not_perceived_as_moving_by_radar
+
+def apply_radar_only_rcs_and_dr_innovation_limit(c):
+    """Function 13: applyRadarOnlyRcsAndDrInnovationLimit"""
+    return is_front_center_radar_only(c) & (np.abs(c["avg_dx_innovation"]) > 1.2) & (c["rcs"] < -15.0)
+
+def max_float(c):
+    """vfc::numeric_limits<vfc::float32_t>::max(): FLT_MAX in float32 batches, represented by inf in double ones"""
+    return FLT_MAX if float_type(c) is np.float32 else np.inf
+
+def apply_implausible_video_ttc_for_vru(c):
+    """Function 25: applyImplausibleVideoTtcForVru"""
+    return (c["is_object_vru"] &
+            (c["updates_since_last_video_update"] < 1) &
+            (c["video_inv_ttc"] == max_float(c)))
+
+def apply_radar_only_nld_check(c):
+    """Function 29: applyRadarOnlyNLDCheck"""
+    dx_obj = c["state_x"]
+    abs_dy_obj = np.abs(c["state_y"])
+    num_cycles = c["num_cycles_existing"]
+    is_object_in_relevant_area = (((abs_dy_obj <= 1.25) & (dx_obj < 120.0)) |
+                                  ((abs_dy_obj <= 6.0) & (dx_obj < 10.0)))
+    is_object_measured_sufficiently = (c["total_num_radar_updates"] >= num_cycles) | (num_cycles >= 30)
+    is_radar_only_nld_candidate = ~(is_ego_driving_straight(c) & is_object_in_relevant_area &
+                                    (num_cycles >= 3) & is_object_measured_sufficiently)
+    is_object_close_with_high_lateral_velocity = ((np.abs(c["state_vy"]) > 3.0) & (dx_obj < 8.0) & (abs_dy_obj < 4.0))
+    return (c["total_num_video_updates"] == 0) & (is_radar_only_nld_candidate | is_object_close_with_high_lateral_velocity)
+
+def apply_radar_only_stationary_check(c):
+    """Function 30: applyRadarOnlyStationaryCheck"""
+    return ((c["total_num_video_updates"] == 0) &
+            (c["abs_vel_over_ground_x"] < 0.3) &
+            (c["abs_vel_over_ground_y"] < 0.3))
+
+def calc_total_abs_velocity_over_ground(c):
+    """Magnitude of the absolute velocity over ground, as vfc::sqrt(vfc::sqr(vx) + vfc::sqr(vy)) in float32"""
+    abs_vel_x, abs_vel_y = c["abs_vel_over_ground_x"], c["abs_vel_over_ground_y"]
+    if float_type(c) is np.float32:
+        return np.sqrt(abs_vel_x * abs_vel_x + abs_vel_y * abs_vel_y)
+    return np.hypot(abs_vel_x, abs_vel_y)
+
+def calc_dx_innovation_threshold(c):
+    """calcDxInnovationThreshold: dx innovation threshold by object type, rcs, vy reliability, fusion and speed"""
+    ft = float_type(c)
+    abs_dx = np.abs(c["state_x"])
+    rcs = c["rcs"]
+    is_vru = c["is_object_vru"]
+    num_cycles_existing = c["num_cycles_existing"]
+    nr_contribution = ft(0.8) * np.minimum(ft(255.0), num_cycles_existing.astype(ft))  # 80% of cycles
+    is_good_fused_object = ((num_cycles_existing > 5) &
+                            c["is_good_quality_fused_object"] &
+                            (c["total_num_front_center_location_radar_updates"].astype(ft) >= nr_contribution) &
+                            (c["total_num_video_updates"].astype(ft) >= nr_contribution))
+    is_very_slow_object = calc_total_abs_velocity_over_ground(c) < 1.0
+    return np.select(
+        [(abs_dx < 20.0) & is_vru,
+         (rcs < -5.0) & (c["vy_unreliable_accumulated"] > 1.9),
+         rcs < -15.0,
+         is_good_fused_object & is_very_slow_object & (rcs > -10.0),
+         (abs_dx < 35.0) & is_vru & (rcs < -5.0) & is_very_slow_object],
+        [ft(1.5), ft(1.1), ft(1.5), ft(6.0), ft(1.4)],
+        default=ft(1.6))
+
+def interpolate_elevation_dz_threshold(params: Parameters, obj_dx):
+    """Allowed elevation threshold over dx: linear interpolation between the limits, constant outside
+
+    Selects the endpoints like linearInterpolateConstantExtrapolate; the
+    interpolation of the objects outside the limits is discarded, so equal
+    limits do not warn about their division by zero.
+    """
+    ft = obj_dx.dtype.type
+    dx_low, dx_high = map(ft, params.elevation_check_dx_limits)
+    dz_low, dz_high = map(ft, params.elevation_check_dz_thresholds)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        interpolated = dz_low + ((obj_dx - dx_low) / (dx_high - dx_low)) * (dz_high - dz_low)
+    return np.where(obj_dx <= dx_low, dz_low, np.where(obj_dx >= dx_high, dz_high, interpolated))
+
+# Checks whose outcome does not depend on Parameters
+FIXED_CHECKS = {
+    "applySuppressionUntilNextVideoUpdateCheck": lambda c: c["is_suppressed_until_next_video_update"],
+    "applyPostProcessVideoOtcCheck": lambda c: c["is_suppressed_due_to_video_otc_post_processing"],
+    "isMovingTowardsEgoLane": is_moving_towards_ego_lane,
+    "isDepObjProbablyVideoGhost": is_dep_obj_probably_video_ghost,
+    "applyUpdatedWithStatLocWithHighMDopplerWithOutgoingVrCheck": apply_updated_with_stat_loc_with_high_mdoppler_with_outgoing_vr_check,
+    "applyIsMeasuredRatioCheckForFastWnj": apply_is_measured_ratio_check_for_fast_wnj,
+    "applyNonCrossingObjectCheck": apply_non_crossing_object_check,
+    "applyRadarOnlyRcsAndDrInnovationLimit": apply_radar_only_rcs_and_dr_innovation_limit,
+    "applyImplausibleVideoTtcForVru": apply_implausible_video_ttc_for_vru,
+    "applyRadarOnlyNLDCheck": apply_radar_only_nld_check,
+    "applyRadarOnlyStationaryCheck": apply_radar_only_stationary_check,
+}
+
+CHECK_INDEX = {name: index for index, name in enumerate(CHECK_NAMES)}
+
+class BatchFeatures:
+    """Threshold-independent intermediate values of a batch
+
+    Parameter independent checks are fully evaluated here. For the parameter
+    dependent checks only the candidate objects (those passing every
+    parameter independent term) are kept, together with the values compared
+    against the parameters, so that evaluating another parameter set only
+    touches the candidates.
+
+    With weights every object stands for weights[i] objects in count_hits
+    (the multiplicities of deduplicated rows, see ``perception_dedup``).
+    """
+
+    def __init__(self, batch: ObjectBatch, weights: Optional[np.ndarray] = None):
+        c = batch.columns
+        self.size = len(batch)
+        self.weights = weights
+        self.num_objects = self.size if weights is None else int(weights.sum())
+        self.fixed_hits = {CHECK_INDEX[name]: check(c) for name, check in FIXED_CHECKS.items()}
+        self.fixed_counts = {index: self._count(check_hits) for index, check_hits in self.fixed_hits.items()}
+
+        # Function 12: applyMicroDopplerCheck
+        fc_radar_updates = c["total_num_front_center_location_radar_updates"]
+        micro_doppler_precondition = (c["is_object_vru"] &
+                                      (c["expected_vr_high_enough_for_mu_doppler_counter"] >= 2) &
+                                      (fc_radar_updates > 0) &
+                                      (c["total_num_front_left_corner_updates"] < 1) &
+                                      (c["total_num_front_right_corner_updates"] < 1))
+        abs_vel_x = c["abs_vel_over_ground_x"]
+        abs_vel_y = c["abs_vel_over_ground_y"]
+        is_object_old = (c["num_cycles_existing"] > 12) & (fc_radar_updates > 8)
+        ft = float_type(c)
+        upper_abs_vy_threshold = np.where(is_object_old, ft(3.2), ft(99.0))
+        is_crossing_vru = (abs_vel_y > 0.5) & (abs_vel_y < upper_abs_vy_threshold) & (abs_vel_x < 4.0)
+        is_stationary_vru = (abs_vel_x < 0.5) & (abs_vel_y < 0.5)
+        self.micro_doppler_index = np.flatnonzero(micro_doppler_precondition & (is_crossing_vru | is_stationary_vru))
+        self.micro_doppler_cycles = c["number_micro_doppler_cycles"][self.micro_doppler_index]
+        self.micro_doppler_crossing = is_crossing_vru[self.micro_doppler_index]
+        self.micro_doppler_stationary = is_stationary_vru[self.micro_doppler_index]
+
+        # Function 14: applyElevationCheck
+        obj_dx = c["state_x"]
+        is_object_stationary = (abs_vel_x < 1.0) & (abs_vel_y < 1.0)
+        is_stationary_video_confirmed_object = is_object_stationary & (c["updates_since_last_video_update"] < 10)
+        elevation_precondition = (obj_dx > 0) & c["elevation_is_valid"] & (is_stationary_video_confirmed_object | c["is_object_vru"])
+        self.elevation_index = np.flatnonzero(elevation_precondition)
+        self.elevation_dx = obj_dx[self.elevation_index]
+        self.elevation = c["elevation"][self.elevation_index]
+
+        # Function 21: applyInnovationCheck
+        is_innovation_exceeded = np.abs(c["avg_dx_innovation"]) > calc_dx_innovation_threshold(c)
+        self.innovation_index = np.flatnonzero(is_innovation_exceeded)
+        self.innovation_abs_dx = np.abs(obj_dx[self.innovation_index])
+        self.innovation_abs_dy = np.abs(c["state_y"][self.innovation_index])
+
+        # Function 23: applyImplausibleVyVruCheck
+        vy_candidate = c["is_object_vru"] & (c["filter_type"] == FILTER_TYPES.index("LA")) & ~is_ego_turning(c)
+        self.implausible_vy_index = np.flatnonzero(vy_candidate)
+        self.implausible_vy_abs_vel_y = abs_vel_y[self.implausible_vy_index]
+
+    def _count(self, hits: np.ndarray, index: Optional[np.ndarray] = None) -> int:
+        """Number of objects hit, hits given for all objects or for the objects at index"""
+        if self.weights is None:
+            return int(np.count_nonzero(hits))
+        weights = self.weights if index is None else self.weights[index]
+        return int(weights[hits].sum())
+
+    def parameter_dependent_hits(self, params: Parameters):
+        """Yield (check index, candidate index, candidate hits) for the parameter dependent checks"""
+        # Function 12: applyMicroDopplerCheck
+        if params.is_micro_doppler_check_enabled:
+            conditions = np.zeros(len(self.micro_doppler_index), dtype=bool)
+            if params.is_micro_doppler_check_on_crossing_vru_applied:
+                conditions |= self.micro_doppler_crossing
+            if params.is_micro_doppler_check_on_stationary_vru_applied:
+                conditions |= self.micro_doppler_stationary
+            micro_doppler_hits = conditions & (self.micro_doppler_cycles < params.min_vru_micro_doppler_cycles)
+        else:
+            micro_doppler_hits = np.zeros(len(self.micro_doppler_index), dtype=bool)
+        yield CHECK_INDEX["applyMicroDopplerCheck"], self.micro_doppler_index, micro_doppler_hits
+
+        # Function 14: applyElevationCheck
+        yield (CHECK_INDEX["applyElevationCheck"], self.elevation_index,
+               self.elevation > interpolate_elevation_dz_threshold(params, self.elevation_dx))
+
+        # Function 21: applyInnovationCheck
+        yield (CHECK_INDEX["applyInnovationCheck"], self.innovation_index,
+               (self.innovation_abs_dx < params.innovation_check_dx_threshold) &
+               (self.innovation_abs_dy < params.innovation_check_dy_threshold))
+
+        # Function 23: applyImplausibleVyVruCheck
+        yield (CHECK_INDEX["applyImplausibleVyVruCheck"], self.implausible_vy_index,
+               self.implausible_vy_abs_vel_y > params.implausible_vy_thresh_la_hypo)
+
+    def evaluate(self, params: Parameters) -> np.ndarray:
+        """Build the (N, checks) boolean hit matrix for one parameter set"""
+        hits = np.zeros((self.size, len(CHECK_NAMES)), dtype=bool)
+        for index, check_hits in self.fixed_hits.items():
+            hits[:, index] = check_hits
+        for index, candidates, candidate_hits in self.parameter_dependent_hits(params):
+            hits[candidates[candidate_hits], index] = True
+        return hits
+
+    def count_hits(self, params: Parameters) -> np.ndarray:
+        """Count the hits of every check for one parameter set without building the hit matrix"""
+        counts = np.zeros(len(CHECK_NAMES), dtype=np.int64)
+        for index, count in self.fixed_counts.items():
+            counts[index] = count
+        for index, candidates, candidate_hits in self.parameter_dependent_hits(params):
+            counts[index] = self._count(candidate_hits, candidates)
+        return counts
+
+def concatenate_batches(batches: Sequence[ObjectBatch]) -> ObjectBatch:
+    """Concatenate batches into one batch"""
+    return ObjectBatch({name: np.concatenate([batch[name] for batch in batches]) for name in OBJECT_COLUMNS},
+                       all(batch.float32 for batch in batches) if batches else False)
+
+def evaluate_batch(batch: ObjectBatch, params: Optional[Parameters] = None, float32: bool = False) -> np.ndarray:
+    """Evaluate all checks over a batch, returning an (N, checks) boolean hit matrix
+
+    With float32 the batch is evaluated float32-faithfully, see ``ObjectBatch.to_float32``.
+    """
+    if float32:
+        batch = batch.to_float32()
+    instrumentation = get_instrumentation()
+    if instrumentation is not None:
+        return instrumentation.evaluate_batch(batch, params or Parameters())
+    return BatchFeatures(batch).evaluate(params or Parameters())
+
+# Hit bit of every check and the relevance bits it implies, in CHECK_NAMES order
+_CHECK_BIT_VALUES = (np.uint32(1) << np.arange(len(CHECK_NAMES), dtype=np.uint32))
+_RELEVANCE_MASKS = [
+    (np.uint32(bit), np.uint32(sum(1 << index for index, name in enumerate(CHECK_NAMES) if CHECK_RELEVANCE[name] & bit)))
+    for bit in RELEVANCE_BIT_NAMES
+]
+
+def pack_hit_matrix(hits: np.ndarray) -> np.ndarray:
+    """Pack an (N, checks) hit matrix into N uint32 result bitfields"""
+    bits = hits.astype(np.uint32) @ _CHECK_BIT_VALUES
+    relevance = np.zeros_like(bits)
+    for bit, check_mask in _RELEVANCE_MASKS:
+        relevance |= np.where(bits & check_mask, bit, np.uint32(0))
+    return bits | relevance
+
+def unpack_hit_matrix(bits: np.ndarray) -> np.ndarray:
+    """(N, checks) hit matrix from packed result bitfields"""
+    return (np.asarray(bits, dtype=np.uint32)[:, None] & _CHECK_BIT_VALUES) != 0
+
+def evaluate_batch_bits(batch: ObjectBatch, params: Optional[Parameters] = None, float32: bool = False) -> np.ndarray:
+    """Evaluate all checks over a batch, returning one uint32 result bitfield per object"""
+    return pack_hit_matrix(evaluate_batch(batch, params, float32))
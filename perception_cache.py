@@ -0,0 +1,223 @@
+"""
+Dependency-aware memoization of the check results.
+
+The checks only read the columns and parameters listed in
+``perception_rules.CHECK_COLUMNS`` / ``CHECK_PARAMETERS``. ``CheckCache``
+keys the results of all checks of an object on exactly those values, so
+objects that differ only in fields no check reads (ids, extents, most
+counters) share one cached result. Stationary and slow objects in
+recordings produce long runs of such identical inputs.
+
+Float columns can be quantized per column (``quantization={"rcs": 0.5}``):
+values in the same step share one key and therefore the result of the first
+object evaluated with that key. Without quantization results are exact.
+
+``CheckCache.evaluate_object`` is a drop-in for ``evaluate_object`` of
+``perception_engine``. Building and looking up a key costs about a third of
+evaluating all checks and a hit about half, so the cache pays off from
+roughly 50% hits: parked scenes with mostly stationary objects, not moving
+traffic whose inputs change every cycle. Caching single checks never pays, a
+lookup costs as much as the check. The vectorized batch path is not cached,
+see ``perception_dedup`` instead.
+"""
+
+import math
+import operator
+import struct
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional, Sequence
+
+import numpy as np
+
+from perception_batch import CATEGORIES, OBJECT_COLUMNS
+from perception_engine import (
+    CheckResult,
+    EgoVehicleData,
+    ObjectData,
+    ObjectState,
+    Parameters,
+    SensorFilterFusHelper,
+    evaluate_object,
+    pack_hits,
+)
+from perception_rules import CHECK_COLUMNS, CHECK_PARAMETERS
+
+class LRUCache:
+    """Bounded mapping evicting the least recently used entry, with hit/miss counters"""
+
+    def __init__(self, max_entries: int):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Cached value of key, counting a hit or a miss"""
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any):
+        """Store a value, evicting the least recently used entry when full"""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop all entries and reset the counters"""
+        self._entries.clear()
+        self.hits = self.misses = self.evictions = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+def _attribute_getter(paths):
+    """attrgetter that always returns a tuple"""
+    if not paths:
+        return lambda value: ()
+    if len(paths) == 1:
+        getter = operator.attrgetter(paths[0])
+        return lambda value: (getter(value),)
+    return operator.attrgetter(*paths)
+
+def _object_path(column):
+    """(sub-record, attribute) of the ObjectData field of a column, None for ego / velocity columns"""
+    if column.startswith("state_") and column[len("state_"):] in ObjectState.__dataclass_fields__:
+        return "state", column[len("state_"):]
+    if column in SensorFilterFusHelper.__dataclass_fields__:
+        return "sensor_filter_fus_helper", column
+    if column in ObjectData.__dataclass_fields__:
+        return None, column
+    return None
+
+class CheckCache:
+    """LRU cache of the check results of whole objects keyed on the columns and parameters the checks read"""
+
+    def __init__(self, max_entries: int = 4096, quantization: Optional[Dict[str, float]] = None):
+        quantization = dict(quantization or {})
+        for name, step in quantization.items():
+            if name not in OBJECT_COLUMNS:
+                raise ValueError(f"Unknown column: {name}")
+            if OBJECT_COLUMNS[name] != np.float64:
+                raise ValueError(f"Only float columns can be quantized: {name}")
+            if not step > 0:
+                raise ValueError(f"Quantization step of {name} must be positive, got {step}")
+        self.quantization = quantization
+        self.cache = LRUCache(max_entries)
+        self._compile_key()
+        self._last_parameter_values = None
+        self._last_parameter_key = None
+
+    def _compile_key(self):
+        """Build the getters of the object, ego and parameter values any check reads"""
+        columns = sorted(set().union(*CHECK_COLUMNS.values()))
+        object_columns = [column for column in columns if _object_path(column) is not None]
+        ego_columns = [column for column in columns if column.startswith("ego_")]
+        velocity_columns = ["abs_vel_over_ground_x", "abs_vel_over_ground_y"]
+        unsupported = set(columns) - set(object_columns) - set(ego_columns) - set(velocity_columns)
+        if unsupported:
+            raise ValueError(f"Columns without a cache key: {sorted(unsupported)}")
+        parameters = sorted(set().union(*CHECK_PARAMETERS.values()))
+
+        # Numbers are packed into one bytes string, which hashes once and compares
+        # bitwise like perception_dedup; categories stay strings. One getter per
+        # sub-record, so nested records are looked up once per key.
+        names = {record: ([], []) for record in (None, "state", "sensor_filter_fus_helper", "ego")}
+        for column in object_columns:
+            if column not in self.quantization:
+                record, name = _object_path(column)
+                names[record][name in CATEGORIES].append(name)
+        for column in ego_columns:
+            names["ego"][False].append(column[len("ego_"):])
+        if names["state"][True] or names["ego"][True]:
+            raise ValueError("Category columns are only supported on the object and its sensor fusion helper")
+        self._object_numbers, self._object_categories = map(_attribute_getter, names[None])
+        self._state_numbers = _attribute_getter(names["state"][False])
+        self._helper_numbers, self._helper_categories = map(_attribute_getter, names["sensor_filter_fus_helper"])
+        self._ego_numbers = _attribute_getter(names["ego"][False])
+        self._quantized = [(_object_path(column), step) for column, step in self.quantization.items()
+                           if column in object_columns]
+        num_numbers = (sum(len(numbers) for numbers, _ in names.values()) + len(velocity_columns)
+                       + len(self._quantized))
+        self._pack = struct.Struct(f"{num_numbers}d").pack
+        self._parameter_getter = _attribute_getter(parameters)
+        defaults = Parameters()
+        self._list_positions = frozenset(position for position, name in enumerate(parameters)
+                                         if isinstance(getattr(defaults, name), list))
+
+    def _parameter_key(self, params: Parameters) -> tuple:
+        """Hashable values of the parameters any check reads, reused while they are unchanged"""
+        values = self._parameter_getter(params)
+        if values != self._last_parameter_values:
+            # Copies of the list values, so that in-place edits of params are noticed
+            self._last_parameter_values = tuple(list(value) if position in self._list_positions else value
+                                                for position, value in enumerate(values))
+            self._last_parameter_key = tuple(tuple(value) if position in self._list_positions else value
+                                             for position, value in enumerate(values))
+        return self._last_parameter_key
+
+    def key(self, obj: ObjectData, ego: EgoVehicleData, params: Parameters,
+            abs_vel_over_ground: Sequence[float]) -> tuple:
+        """Cache key of one object: every column and parameter any check reads"""
+        helper = obj.sensor_filter_fus_helper
+        numbers = (self._object_numbers(obj) + self._state_numbers(obj.state) + self._helper_numbers(helper)
+                   + self._ego_numbers(ego))
+        if self._quantized:
+            numbers += tuple(self._quantize(obj, path, step) for path, step in self._quantized)
+        return (self._pack(*numbers, abs_vel_over_ground[0], abs_vel_over_ground[1]),
+                self._object_categories(obj), self._helper_categories(helper), self._parameter_key(params))
+
+    @staticmethod
+    def _quantize(obj: ObjectData, path: tuple, step: float):
+        """Quantization bin of a float field, non-finite values are their own bin"""
+        record, name = path
+        value = getattr(obj if record is None else getattr(obj, record), name)
+        return math.floor(value / step) if math.isfinite(value) else value
+
+    def evaluate_object(self, obj: ObjectData, ego: EgoVehicleData, params: Parameters,
+                        abs_vel_over_ground: Sequence[float]) -> List[CheckResult]:
+        """Evaluate all checks for a single object, reusing the results of an object with the same check inputs"""
+        key = self.key(obj, ego, params, abs_vel_over_ground)
+        results = self.cache.get(key)
+        if results is None:
+            results = evaluate_object(obj, ego, params, abs_vel_over_ground)
+            self.cache.put(key, results)
+        return list(results)
+
+    def evaluate_object_bits(self, obj: ObjectData, ego: EgoVehicleData, params: Parameters,
+                             abs_vel_over_ground: Sequence[float]) -> int:
+        """Packed result bitfield for one object"""
+        return pack_hits([result.hit for result in self.evaluate_object(obj, ego, params, abs_vel_over_ground)])
+
+    def clear(self):
+        """Drop all cached results and statistics"""
+        self.cache.clear()
+
+    @property
+    def hit_rate(self) -> float:
+        return self.cache.hit_rate
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Cache statistics"""
+        return {
+            "hits": self.cache.hits,
+            "misses": self.cache.misses,
+            "evictions": self.cache.evictions,
+            "entries": len(self.cache),
+            "hit_rate": self.cache.hit_rate,
+        }
@@ -0,0 +1,179 @@
+"""
+Process-pool runner for multi-recording evaluation campaigns.
+
+A campaign evaluates every recording in a directory. Recordings are split into
+shards (whole files or cycle ranges of at most ``cycles_per_shard`` cycles)
+which are evaluated in parallel by a ``ProcessPoolExecutor``. The parameter
+set is handed to each worker once through the pool initializer, so tasks only
+carry the shard description. Shard statistics are merged in shard order, which
+makes the result independent of worker scheduling.
+
+``CampaignJob`` runs the same shards without blocking the caller, for front
+ends with their own event loop: ``poll()`` merges the shards finished so far
+and ``cancel()`` drops the shards not yet started. With ``collect_results``
+the workers also return their per-object results as a ``ResultTable``.
+"""
+
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from perception_columnar import RECORDING_SUFFIX
+from perception_engine import Parameters
+from perception_replay import CheckStatistics, aggregate, count_cycles, replay, replay_results
+from perception_result_table import ResultTable
+
+RECORDING_EXTENSIONS = (".jsonl", ".csv", RECORDING_SUFFIX)
+
+@dataclass(frozen=True)
+class Shard:
+    """A cycle range [start, stop) of one recording; stop None means until the end"""
+    path: str
+    start: int = 0
+    stop: Optional[int] = None
+
+@dataclass
+class CampaignResult:
+    """Merged statistics of a campaign, in total and per recording"""
+    total: CheckStatistics = field(default_factory=CheckStatistics)
+    per_recording: Dict[str, CheckStatistics] = field(default_factory=dict)
+
+    def to_dict(self):
+        return {
+            "total": self.total.to_dict(),
+            "per_recording": {path: stats.to_dict() for path, stats in self.per_recording.items()},
+        }
+
+def find_recordings(directory: str) -> List[str]:
+    """List the recordings in a directory in sorted order"""
+    return sorted(
+        os.path.join(directory, name)
+        for name in os.listdir(directory)
+        if name.endswith(RECORDING_EXTENSIONS)
+    )
+
+def make_shards(paths: List[str], cycles_per_shard: Optional[int] = None) -> List[Shard]:
+    """Split recordings into whole-file shards or cycle-range shards"""
+    if cycles_per_shard is None:
+        return [Shard(path) for path in paths]
+    shards = []
+    for path in paths:
+        num_cycles = count_cycles(path)
+        for start in range(0, num_cycles, cycles_per_shard):
+            shards.append(Shard(path, start, min(start + cycles_per_shard, num_cycles)))
+    return shards
+
+# Per-worker state set once by the pool initializer
+_worker_params: Optional[Parameters] = None
+_worker_chunk_size = 64
+
+def _init_worker(params: Parameters, chunk_size: int):
+    """Pool initializer storing the campaign parameters in the worker process"""
+    global _worker_params, _worker_chunk_size
+    _worker_params = params
+    _worker_chunk_size = chunk_size
+
+def _evaluate_shard(shard: Shard) -> Tuple[Shard, CheckStatistics]:
+    """Evaluate one shard in a worker process"""
+    return shard, replay(shard.path, _worker_params, _worker_chunk_size, shard.start, shard.stop)
+
+def _evaluate_shard_table(shard: Shard) -> Tuple[Shard, CheckStatistics, ResultTable]:
+    """Evaluate one shard in a worker process, also returning its per-object results"""
+    stats = CheckStatistics()
+    results = replay_results(shard.path, _worker_params, _worker_chunk_size, shard.start, shard.stop)
+    table = ResultTable.from_results(aggregate(results, stats))
+    return shard, stats, table
+
+def merge_shard_statistics(shard_stats: List[Tuple[Shard, CheckStatistics]]) -> CampaignResult:
+    """Merge shard statistics in a deterministic (path, start) order"""
+    result = CampaignResult()
+    for shard, stats in sorted(shard_stats, key=lambda item: (item[0].path, item[0].start)):
+        result.per_recording.setdefault(shard.path, CheckStatistics()).merge(stats)
+        result.total.merge(stats)
+    return result
+
+def run_campaign(directory: str, params: Parameters, max_workers: Optional[int] = None,
+                 cycles_per_shard: Optional[int] = None, chunk_size: int = 64) -> CampaignResult:
+    """Evaluate all recordings of a directory in parallel and merge their statistics"""
+    shards = make_shards(find_recordings(directory), cycles_per_shard)
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                             initargs=(params, chunk_size)) as executor:
+        shard_stats = list(executor.map(_evaluate_shard, shards))
+    return merge_shard_statistics(shard_stats)
+
+class CampaignJob:
+    """Campaign over a list of recordings evaluated in a process pool without blocking the caller
+
+    The shards are planned in the pool too (cycle-range shards count the
+    cycles of every recording) and submitted by the first poll after planning.
+    """
+
+    def __init__(self, paths: List[str], params: Parameters, max_workers: Optional[int] = None,
+                 cycles_per_shard: Optional[int] = None, chunk_size: int = 64, collect_results: bool = False):
+        self.shards: List[Shard] = []
+        self.cancelled = False
+        self.error: Optional[BaseException] = None
+        self._finished: List[Tuple[Shard, CheckStatistics]] = []
+        self._tables: Dict[Shard, ResultTable] = {}
+        self._executor = ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker,
+                                             initargs=(params, chunk_size))
+        self._evaluate = _evaluate_shard_table if collect_results else _evaluate_shard
+        self._planning: Optional[Future] = self._executor.submit(make_shards, paths, cycles_per_shard)
+        self._pending: List[Future] = []
+
+    @property
+    def done(self) -> bool:
+        return self._planning is None and not self._pending
+
+    @property
+    def progress(self) -> float:
+        """Fraction of shards evaluated"""
+        if self._planning is not None:
+            return 0.0
+        return len(self._finished) / len(self.shards) if self.shards else 1.0
+
+    def _submit_shards(self):
+        """Submit the shards once planning has finished"""
+        if not self._planning.done():
+            return
+        planning, self._planning = self._planning, None
+        if planning.exception() is not None:
+            self.error = planning.exception()
+            return
+        self.shards = planning.result()
+        self._pending = [self._executor.submit(self._evaluate, shard) for shard in self.shards]
+
+    def poll(self) -> CampaignResult:
+        """Collect the shards finished since the last poll and return the statistics merged so far"""
+        if self._planning is not None:
+            self._submit_shards()
+        pending = []
+        for future in self._pending:
+            if not future.done():
+                pending.append(future)
+            elif future.exception() is not None:
+                self.error = future.exception()
+            else:
+                shard, stats, *table = future.result()
+                self._finished.append((shard, stats))
+                if table:
+                    self._tables[shard] = table[0]
+        self._pending = pending
+        if self.error is not None:
+            self.cancel()
+        elif self.done:
+            self._executor.shutdown(wait=False)
+        return merge_shard_statistics(self._finished)
+
+    def result_table(self) -> ResultTable:
+        """Per-object results of the shards finished so far, in shard order (needs collect_results)"""
+        shards = sorted(self._tables, key=lambda shard: (shard.path, shard.start))
+        return ResultTable.concatenate([self._tables[shard] for shard in shards])
+
+    def cancel(self):
+        """Drop the shards not yet started; shards already running finish in the background"""
+        self.cancelled = bool(self._pending) or self._planning is not None
+        self._pending = []
+        self._planning = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Code generation backend specializing the checks for one parameter set.
+
+``generate_source(params)`` translates ``perception_rules.RULES`` into the
+Python source of one function ``evaluate_bits(obj, ego, abs_vel_over_ground)``
+returning the packed result bitfield:
+
+* every column a rule reads is loaded into a local once per object
+* parameters are substituted as literals and constant sub-expressions folded,
+  so disabled branches (``is_micro_doppler_check_enabled=False``, the
+  ``is_micro_doppler_check_on_*_applied`` flags) and checks that can no
+  longer hit are eliminated
+* helpers written as rule expressions (``is_moving_towards_ego_lane``) are
+  inlined over the loaded locals
+* the other helpers of the rules (``calc_dx_innovation_threshold``, the ego
+  straightness, the elevation interpolation) are called as implemented in
+  ``perception_engine``, so their thresholds and branches have a single
+  definition
+* the relevance bits are set from constant masks
+
+``compile_evaluator(params)`` compiles that source and caches the evaluator
+per parameter hash, so replays with fixed parameters pay for generation
+once. Keep the returned evaluator when calling it per object: hashing the
+parameters costs more than evaluating one object.
+
+Usage: python perception_codegen.py [--params FILE]   (prints the generated source)
+"""
+
+import argparse
+import hashlib
+import json
+import math
+import operator
+import sys
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Sequence, Set, Tuple
+
+from perception_cache import LRUCache
+from perception_engine import (
+    CHECK_NAMES,
+    CHECK_RELEVANCE,
+    RELEVANCE_BIT_NAMES,
+    EgoVehicleData,
+    ObjectData,
+    ObjectState,
+    Parameters,
+    SensorFilterFusHelper,
+    params_from_dict,
+)
+from perception_rules import (
+    RULES,
+    Abs,
+    AllOf,
+    AllParams,
+    AnyOf,
+    BinOp,
+    Col,
+    ColumnFn,
+    Compare,
+    Const,
+    Expr,
+    Fn,
+    Not,
+    Param,
+    Rule,
+    Where,
+)
+
+# Compiled evaluators kept per parameter hash
+MAX_CACHED_EVALUATORS = 64
+
+_OPERATORS = {
+    "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+    "==": operator.eq, "!=": operator.ne, "+": operator.add, "*": operator.mul, "/": operator.truediv,
+}
+
+# Inlined sources of the ColumnFn helpers of RULES holding no thresholds, over the column locals;
+# the other ColumnFns are called through their scalar_fn
+_COLUMN_FN_SOURCES = {
+    "is_video_inv_ttc_max_float": "(video_inv_ttc == _INF)",  # Representing max float
+}
+
+def _column_source(column: str) -> str:
+    """Expression reading a column from (o, e, v) = (obj, ego, abs_vel_over_ground)"""
+    if column.startswith("state_") and column[len("state_"):] in ObjectState.__dataclass_fields__:
+        return f"o.state.{column[len('state_'):]}"
+    if column in SensorFilterFusHelper.__dataclass_fields__:
+        return f"o.sensor_filter_fus_helper.{column}"
+    if column in ObjectData.__dataclass_fields__:
+        return f"o.{column}"
+    for name in ("radar_based_innovation", "video_based_innovation"):
+        if column == f"{name}_dr":
+            return f"o.{name}[0]"
+        if column == f"{name}_alpha":
+            return f"o.{name}[1]"
+    if column.startswith("ego_") and column[len("ego_"):] in EgoVehicleData.__dataclass_fields__:
+        return f"e.{column[len('ego_'):]}"
+    if column == "abs_vel_over_ground_x":
+        return "v[0]"
+    if column == "abs_vel_over_ground_y":
+        return "v[1]"
+    raise ValueError(f"No scalar source for column {column}")
+
+class _Folded:
+    """Compile-time constant produced by folding"""
+
+    def __init__(self, value):
+        self.value = value
+
+def _literal(value) -> str:
+    if isinstance(value, float) and math.isinf(value):
+        return "_INF" if value > 0 else "(-_INF)"
+    if isinstance(value, (bool, int, float, str)):
+        return repr(value)
+    raise ValueError(f"Cannot emit a literal for {value!r}")
+
+class _Generator:
+    """Translates rule expressions for one parameter set into source text or folded constants"""
+
+    def __init__(self, params: Parameters):
+        self.params = params
+        self.columns: Set[str] = set()
+        self.namespace: Dict[str, Any] = {"_INF": math.inf}
+
+    def text(self, expr: Expr) -> str:
+        code = self.emit(expr)
+        return _literal(code.value) if isinstance(code, _Folded) else code
+
+    def bind(self, value) -> str:
+        """Name of a namespace global holding a value the source cannot spell"""
+        name = f"_fn{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def emit(self, expr: Expr):
+        if isinstance(expr, Col):
+            self.columns.add(expr.name)
+            return expr.name
+        if isinstance(expr, Param):
+            return _Folded(getattr(self.params, expr.name))
+        if isinstance(expr, Const):
+            return _Folded(expr.value)
+        if isinstance(expr, AllParams):
+            return _Folded(self.params)
+        if isinstance(expr, (Compare, BinOp)):
+            left, right = self.emit(expr.left), self.emit(expr.right)
+            if isinstance(left, _Folded) and isinstance(right, _Folded):
+                return _Folded(_OPERATORS[expr.op](left.value, right.value))
+            left = _literal(left.value) if isinstance(left, _Folded) else left
+            right = _literal(right.value) if isinstance(right, _Folded) else right
+            return f"({left} {expr.op} {right})"
+        if isinstance(expr, Abs):
+            operand = self.emit(expr.operand)
+            return _Folded(abs(operand.value)) if isinstance(operand, _Folded) else f"abs({operand})"
+        if isinstance(expr, Not):
+            operand = self.emit(expr.operand)
+            return _Folded(not operand.value) if isinstance(operand, _Folded) else f"(not {operand})"
+        if isinstance(expr, AllOf):  # AnyOf included
+            is_any = isinstance(expr, AnyOf)
+            parts = []
+            for operand in expr.operands:
+                code = self.emit(operand)
+                if isinstance(code, _Folded):
+                    if bool(code.value) == is_any:
+                        return _Folded(is_any)
+                    continue
+                parts.append(code)
+            if not parts:
+                return _Folded(not is_any)
+            return parts[0] if len(parts) == 1 else "(" + (" or " if is_any else " and ").join(parts) + ")"
+        if isinstance(expr, Where):
+            condition = self.emit(expr.condition)
+            if isinstance(condition, _Folded):
+                return self.emit(expr.if_true if condition.value else expr.if_false)
+            return f"({self.text(expr.if_true)} if {condition} else {self.text(expr.if_false)})"
+        if isinstance(expr, Fn):
+            return self.emit_fn(expr)
+        if isinstance(expr, ColumnFn):
+            if expr.name in _COLUMN_FN_SOURCES:
+                self.columns |= expr.columns()
+                return _COLUMN_FN_SOURCES[expr.name]
+            return f"{self.bind(expr.scalar_fn)}(o, e, _params, v)"
+        raise ValueError(f"Cannot generate code for {type(expr).__name__}")
+
+    def emit_fn(self, expr: Fn):
+        args = [self.emit(arg) for arg in expr.args]
+        if all(isinstance(arg, _Folded) for arg in args):
+            return _Folded(expr.scalar_fn(*(arg.value for arg in args)))
+        texts = []
+        for arg in args:
+            if not isinstance(arg, _Folded):
+                texts.append(arg)
+            elif arg.value is self.params:  # AllParams
+                texts.append("_params")
+            else:
+                texts.append(_literal(arg.value))
+        return f"{self.bind(expr.scalar_fn)}({', '.join(texts)})"
+
+def generate_source(params: Parameters, rules: Sequence[Rule] = RULES) -> Tuple[str, Dict[str, Any]]:
+    """Source of evaluate_bits(o, e, v) specialized for one parameter set, and the globals it needs"""
+    generator = _Generator(params)
+    constant_hits = 0
+    conditions: List[str] = []
+    for index, rule_ in enumerate(rules):
+        code = generator.emit(AllOf(*(term.predicate for term in rule_.terms)))
+        if isinstance(code, _Folded):
+            constant_hits |= (1 << index) if code.value else 0
+            conditions.append(f"    # {rule_.check}: {'always' if code.value else 'never'} hits")
+        else:
+            conditions.append(f"    if {code}:  # {rule_.check}\n        hits |= {1 << index}")
+
+    lines = ["def evaluate_bits(o, e, v):"]
+    lines += [f"    {column} = {_column_source(column)}" for column in sorted(generator.columns)]
+    lines.append(f"    hits = {constant_hits}")
+    lines += conditions
+    lines.append("    bits = hits")
+    for bit in RELEVANCE_BIT_NAMES:
+        mask = sum(1 << index for index, name in enumerate(CHECK_NAMES) if CHECK_RELEVANCE[name] & bit)
+        lines.append(f"    if hits & {mask}:\n        bits |= {bit}")
+    lines.append("    return bits")
+    return "\n".join(lines) + "\n", generator.namespace
+
+def parameters_key(params: Parameters) -> str:
+    """Hash identifying a parameter set"""
+    return hashlib.sha256(json.dumps(asdict(params), sort_keys=True).encode()).hexdigest()
+
+@dataclass
+class SpecializedEvaluator:
+    """Compiled evaluate_bits(obj, ego, abs_vel_over_ground) of one parameter set"""
+    key: str
+    source: str
+    evaluate_bits: Callable[[ObjectData, EgoVehicleData, Sequence[float]], int]
+
+_EVALUATORS = LRUCache(MAX_CACHED_EVALUATORS)
+
+def compile_evaluator(params: Parameters) -> SpecializedEvaluator:
+    """Generated and compiled evaluator of a parameter set, cached per parameter hash"""
+    key = parameters_key(params)
+    evaluator = _EVALUATORS.get(key)
+    if evaluator is None:
+        source, namespace = generate_source(params)
+        namespace["_params"] = params
+        exec(compile(source, f"<perception_codegen {key[:12]}>", "exec"), namespace)
+        evaluator = SpecializedEvaluator(key, source, namespace["evaluate_bits"])
+        _EVALUATORS.put(key, evaluator)
+    return evaluator
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Print the evaluator source generated for a parameter set")
+    parser.add_argument("--params", help="JSON parameter file (default: Parameters())")
+    args = parser.parse_args(argv)
+
+    params = Parameters()
+    if args.params:
+        with open(args.params, "r") as f:
+            params = params_from_dict(json.load(f))
+    print(compile_evaluator(params).source, end="")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
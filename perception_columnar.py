@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Memory-mapped columnar binary format for object-list recordings.
+
+A recording is a directory (conventionally named ``*.perc``) containing:
+
+* ``manifest.json``: format version, object/cycle counts and column dtypes
+* ``cycles.bin``: int64 cycle number of every stored cycle
+* ``offsets.bin``: int64 object offsets, ``num_cycles + 1`` entries; the
+  objects of cycle position ``i`` are rows ``offsets[i]:offsets[i + 1]``
+* ``columns/<name>.bin``: one raw fixed-dtype array per ``OBJECT_COLUMNS`` entry
+
+Opening a recording maps every file with ``np.memmap``; batches over any
+cycle window are slices of the mapped columns and are evaluated without
+copying or parsing.
+
+Usage: python perception_columnar.py INPUT [INPUT ...] OUTPUT.perc
+
+INPUT may be JSONL/CSV recordings or configuration files written by the
+emulator's Save Config (one cycle with one object each).
+"""
+
+import json
+import os
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from perception_batch import OBJECT_COLUMNS, ObjectBatch, evaluate_batch, object_to_row
+from perception_engine import Parameters, ego_from_dict, object_from_dict
+
+FORMAT_NAME = "perception-columnar"
+FORMAT_VERSION = 1
+RECORDING_SUFFIX = ".perc"
+
+class ColumnarWriter:
+    """Append cycles to a new columnar recording"""
+
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.join(path, "columns"), exist_ok=True)
+        self._column_files = {name: open(os.path.join(path, "columns", f"{name}.bin"), "wb")
+                              for name in OBJECT_COLUMNS}
+        self._cycles: List[int] = []
+        self._offsets: List[int] = [0]
+
+    def append(self, cycle: int, batch: ObjectBatch):
+        """Write the objects of one cycle (cycle numbers must be ascending)"""
+        if self._cycles and cycle <= self._cycles[-1]:
+            raise ValueError(f"Cycle {cycle} does not follow cycle {self._cycles[-1]}")
+        for name, f in self._column_files.items():
+            f.write(np.ascontiguousarray(batch[name], dtype=OBJECT_COLUMNS[name]).tobytes())
+        self._cycles.append(cycle)
+        self._offsets.append(self._offsets[-1] + len(batch))
+
+    def close(self):
+        """Flush the columns and write the cycle index and manifest"""
+        for f in self._column_files.values():
+            f.close()
+        np.asarray(self._cycles, dtype=np.int64).tofile(os.path.join(self.path, "cycles.bin"))
+        np.asarray(self._offsets, dtype=np.int64).tofile(os.path.join(self.path, "offsets.bin"))
+        manifest = {
+            "format": FORMAT_NAME,
+            "version": FORMAT_VERSION,
+            "num_cycles": len(self._cycles),
+            "num_objects": self._offsets[-1],
+            "columns": {name: dtype.str for name, dtype in OBJECT_COLUMNS.items()},
+        }
+        with open(os.path.join(self.path, "manifest.json"), "w") as f:
+            json.dump(manifest, f, indent=2)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+def _memmap(path, dtype, length):
+    """Map a raw array file read-only; empty files cannot be mapped"""
+    if length == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="r", shape=(length,))
+
+class ColumnarRecording:
+    """Read-only memory-mapped view of a columnar recording"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, "manifest.json"), "r") as f:
+            self.manifest = json.load(f)
+        if self.manifest.get("format") != FORMAT_NAME or self.manifest.get("version") != FORMAT_VERSION:
+            raise ValueError(f"{path} is not a {FORMAT_NAME} v{FORMAT_VERSION} recording")
+        self.num_cycles = self.manifest["num_cycles"]
+        self.num_objects = self.manifest["num_objects"]
+        self.cycles = _memmap(os.path.join(path, "cycles.bin"), np.int64, self.num_cycles)
+        self.offsets = _memmap(os.path.join(path, "offsets.bin"), np.int64, self.num_cycles + 1)
+        self.columns = {}
+        for name, dtype in self.manifest["columns"].items():
+            if name not in OBJECT_COLUMNS or np.dtype(dtype) != OBJECT_COLUMNS[name]:
+                raise ValueError(f"Column {name} ({dtype}) does not match the current column layout")
+            self.columns[name] = _memmap(os.path.join(path, "columns", f"{name}.bin"), dtype, self.num_objects)
+
+    def __len__(self):
+        return self.num_cycles
+
+    def find_cycle(self, cycle: int) -> int:
+        """Position of a cycle number in the recording (cycle numbers must be ascending)"""
+        position = int(np.searchsorted(self.cycles, cycle))
+        if position >= self.num_cycles or self.cycles[position] != cycle:
+            raise KeyError(f"Cycle {cycle} not in recording")
+        return position
+
+    def batch(self, start: int = 0, stop: Optional[int] = None) -> ObjectBatch:
+        """All objects of cycle positions start <= i < stop as one zero-copy batch"""
+        stop = self.num_cycles if stop is None else min(stop, self.num_cycles)
+        begin, end = int(self.offsets[start]), int(self.offsets[stop])
+        return ObjectBatch({name: values[begin:end] for name, values in self.columns.items()})
+
+    def iter_cycles(self, start: int = 0, stop: Optional[int] = None) -> Iterator["DecodedCycle"]:
+        """Yield the cycle positions start <= i < stop as decoded cycles"""
+        from perception_replay import DecodedCycle
+        stop = self.num_cycles if stop is None else min(stop, self.num_cycles)
+        for position in range(start, stop):
+            yield DecodedCycle(int(self.cycles[position]), self.batch(position, position + 1))
+
+    def evaluate_window(self, start: int, stop: int, params: Parameters, float32: bool = False,
+                        dedup: Optional["DedupStatistics"] = None) -> np.ndarray:
+        """Hit matrix for all objects of a cycle window, evaluating duplicate rows once with dedup"""
+        if dedup is not None:
+            from perception_dedup import evaluate_batch_unique
+            return evaluate_batch_unique(self.batch(start, stop), params, float32, dedup)
+        return evaluate_batch(self.batch(start, stop), params, float32)
+
+    def iter_results(self, params: Parameters, chunk_size: int = 64, start: int = 0, stop: Optional[int] = None,
+                     float32: bool = False, dedup: Optional["DedupStatistics"] = None) -> Iterator["CycleResult"]:
+        """Evaluate windows of chunk_size cycles directly on the mapped columns, yielding per-cycle results"""
+        from perception_replay import CycleResult
+        stop = self.num_cycles if stop is None else min(stop, self.num_cycles)
+        object_ids = self.columns["object_id_10bit"]
+        for window_start in range(start, stop, chunk_size):
+            window_stop = min(window_start + chunk_size, stop)
+            hits = self.evaluate_window(window_start, window_stop, params, float32, dedup)
+            base = int(self.offsets[window_start])
+            for position in range(window_start, window_stop):
+                begin, end = int(self.offsets[position]), int(self.offsets[position + 1])
+                yield CycleResult(int(self.cycles[position]), object_ids[begin:end], hits[begin - base:end - base])
+
+def is_columnar_recording(path: str) -> bool:
+    """Whether a path is a columnar recording directory"""
+    return os.path.isdir(path) and os.path.isfile(os.path.join(path, "manifest.json"))
+
+def config_to_batch(config: Dict[str, Any]) -> ObjectBatch:
+    """Convert a configuration written by Save Config into a one-object batch"""
+    obj = object_from_dict(config.get("object_data", {}))
+    ego = ego_from_dict(config.get("ego_data", {}))
+    return ObjectBatch.from_rows([object_to_row(obj, ego, config.get("abs_vel_over_ground", (0.0, 0.0)))])
+
+def write_cycles(path: str, cycles: Iterable["DecodedCycle"]):
+    """Write decoded cycles into a new columnar recording"""
+    with ColumnarWriter(path) as writer:
+        for decoded in cycles:
+            writer.append(decoded.cycle, decoded.batch)
+
+def convert(inputs: List[str], output: str):
+    """Convert recordings and Save Config files into one columnar recording
+
+    Cycles of a recording starting below the cycles already written are
+    shifted to follow them, keeping the cycle numbers ascending.
+    """
+    from perception_replay import read_cycles
+    next_cycle = 0
+    with ColumnarWriter(output) as writer:
+        for path in inputs:
+            if path.endswith(".json"):
+                with open(path, "r") as f:
+                    writer.append(next_cycle, config_to_batch(json.load(f)))
+                next_cycle += 1
+                continue
+            offset = None
+            for decoded in read_cycles(path):
+                if offset is None:
+                    offset = max(0, next_cycle - decoded.cycle)
+                writer.append(decoded.cycle + offset, decoded.batch)
+                next_cycle = decoded.cycle + offset + 1
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 2:
+        print("Usage: python perception_columnar.py INPUT [INPUT ...] OUTPUT.perc", file=sys.stderr)
+        return 2
+    convert(argv[:-1], argv[-1])
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
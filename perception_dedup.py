@@ -0,0 +1,94 @@
+"""
+Hash-consing deduplication of object rows before batch evaluation.
+
+In recordings many object-cycles are identical in every column the checks
+read: parked cars and stationary clutter repeat cycle after cycle with only
+their (unread) ids, extents or counters differing. ``evaluate_batch_unique``
+projects a batch onto ``CHECK_INPUT_COLUMNS`` (the columns of
+``perception_rules.CHECK_COLUMNS``: the object, ego and
+``abs_vel_over_ground`` columns any check reads), evaluates each distinct
+projected row once and scatters the hit rows back to all objects.
+
+Rows are compared by their raw bytes, so deduplication is exact: rows equal
+only as values (``0.0`` and ``-0.0``) are evaluated separately and a
+recorded NaN matches only the same NaN. ``DedupStatistics`` accumulates the
+dedup ratio over a replay.
+
+Grouping the rows costs about as much as evaluating them once, so a single
+replay gains little; the saving is in work repeated per row, such as the
+parameter variants of ``perception_sweep.run_sweep``.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
+from perception_batch import OBJECT_COLUMNS, ObjectBatch, evaluate_batch
+from perception_engine import Parameters
+from perception_rules import CHECK_COLUMNS
+
+# Columns read by any check, in OBJECT_COLUMNS order
+CHECK_INPUT_COLUMNS = tuple(name for name in OBJECT_COLUMNS if any(name in columns for columns in CHECK_COLUMNS.values()))
+
+@dataclass
+class DedupStatistics:
+    """Objects evaluated versus distinct check-relevant rows evaluated"""
+    num_objects: int = 0
+    num_unique: int = 0
+
+    @property
+    def ratio(self) -> float:
+        """Objects per distinct row (1.0 without duplicates)"""
+        return self.num_objects / self.num_unique if self.num_unique else 1.0
+
+    def merge(self, other: "DedupStatistics"):
+        """Add the counts of another statistics instance"""
+        self.num_objects += other.num_objects
+        self.num_unique += other.num_unique
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"num_objects": self.num_objects, "num_unique": self.num_unique, "ratio": self.ratio}
+
+# FNV-1a style row hash over the column words
+_HASH_OFFSET = np.uint64(14695981039346656037)
+_HASH_PRIME = np.uint64(1099511628211)
+
+def unique_rows(batch: ObjectBatch, columns: Sequence[str] = CHECK_INPUT_COLUMNS) -> Tuple[np.ndarray, np.ndarray]:
+    """Index of one object per distinct row of the given columns, and the distinct row of every object
+
+    Rows are grouped by a 64-bit hash of their column words; the grouping is
+    verified against the words and redone on the raw row bytes after a collision.
+    """
+    words = [np.ascontiguousarray(batch[name]).view(f"u{batch[name].dtype.itemsize}") for name in columns]
+    row_hash = np.full(len(batch), _HASH_OFFSET)
+    for column_words in words:
+        row_hash ^= column_words
+        row_hash *= _HASH_PRIME
+        row_hash ^= row_hash >> np.uint64(29)
+    _, first, inverse = np.unique(row_hash, return_index=True, return_inverse=True)
+    inverse = inverse.ravel()
+    representative = first[inverse]
+    if all(np.array_equal(column_words[representative], column_words) for column_words in words):
+        return first, inverse
+    row_bytes = np.concatenate([column_words.view(np.uint8).reshape(len(batch), -1) for column_words in words], axis=1)
+    _, first, inverse = np.unique(row_bytes.view(np.dtype((np.void, row_bytes.shape[1]))).ravel(),
+                                  return_index=True, return_inverse=True)
+    return first, inverse.ravel()
+
+def evaluate_batch_unique(batch: ObjectBatch, params: Optional[Parameters] = None, float32: bool = False,
+                          stats: Optional[DedupStatistics] = None) -> np.ndarray:
+    """evaluate_batch evaluating every distinct check-relevant row once
+
+    With float32 rows are compared after the float32 conversion. Under
+    instrumentation only the distinct rows are counted.
+    """
+    if float32:
+        batch = batch.to_float32()
+    first, inverse = unique_rows(batch)
+    if stats is not None:
+        stats.num_objects += len(batch)
+        stats.num_unique += len(first)
+    if len(first) == len(batch):
+        return evaluate_batch(batch, params)
+    return evaluate_batch(batch.take(first), params)[inverse]
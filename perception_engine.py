@@ -0,0 +1,623 @@
+"""
+Headless evaluation engine for the automotive perception post-processing checks.
+
+This module holds the data structures and the check logic reproduced from the
+C++ ``Dc::Per::Dep`` functions. It does not depend on tkinter, so it can be used
+from scripts and headless CI machines as well as from the GUI emulator.
+"""
+
+import functools
+import math
+from dataclasses import asdict, dataclass, field
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+@dataclass
+class ObjectState:
+    """Represents the object state with position and velocity"""
+    x: float = 0.0  # longitudinal position
+    y: float = 0.0  # lateral position
+    vx: float = 0.0  # longitudinal velocity
+    vy: float = 0.0  # lateral velocity
+
+@dataclass
+class SensorFilterFusHelper:
+    """Sensor fusion helper data"""
+    total_num_radar_updates: int = 0
+    total_num_video_updates: int = 0
+    total_num_front_left_corner_updates: int = 0
+    total_num_front_right_corner_updates: int = 0
+    total_num_front_center_location_radar_updates: int = 0
+    updates_since_last_video_update: int = 0
+    updates_since_last_radar_update: int = 0
+    updates_since_last_front_center_video_update: int = 0
+    updates_since_last_front_center_location_radar_update: int = 0
+    updates_since_last_front_left_corner_update: int = 0
+    updates_since_last_front_right_corner_update: int = 0
+    updates_since_last_update: int = 0
+    is_good_quality_fused_object: bool = False
+    is_trustworthy_object: bool = False
+
+@dataclass
+class ObjectData:
+    """Complete object data structure"""
+    # Basic object attributes
+    state: ObjectState = field(default_factory=ObjectState)
+    is_object_vru: bool = False
+    rcs: float = 0.0
+    num_cycles_existing: int = 0
+    filter_type: str = "LA"  # LA, WNJ, etc.
+
+    # Probabilities
+    prob_has_been_observed_moving: float = 0.0
+    prob_is_currently_moving: float = 0.0
+
+    # Sensor fusion data
+    sensor_filter_fus_helper: SensorFilterFusHelper = field(default_factory=SensorFilterFusHelper)
+
+    # Innovation data
+    avg_dx_innovation: float = 0.0
+    radar_based_innovation: List[float] = field(default_factory=lambda: [0.0, 0.0])
+    video_based_innovation: List[float] = field(default_factory=lambda: [0.0, 0.0])
+    radar_raw_alpha_innovation: float = 0.0
+    video_raw_alpha_innovation: float = 0.0
+
+    # Elevation
+    elevation: float = 0.0
+    elevation_is_valid: bool = False
+
+    # Micro doppler
+    number_micro_doppler_cycles: int = 0
+    expected_vr_high_enough_for_mu_doppler_counter: int = 0
+
+    # Various counters
+    split_counter: int = 0
+    stopping_split_counter: int = 0
+    stationary_locations_only_counter: int = 0
+    non_plausible_location_cnt: int = 0
+    bad_sensor_based_inno_count: int = 0
+    vy_inconsistent: int = 0
+    object_orientation_unreliable_count: int = 0
+    num_cycles_no_orientation_update: int = 0
+    total_num_cycles_with_oncoming_locations: int = 0
+    num_consecutive_cycles_without_oncoming_locations: int = 0
+    transferred_from_sep_cycle: int = 0
+
+    # Object type and classification
+    most_probable_conditional_type: str = "PEDESTRIAN"  # PEDESTRIAN, CAR, TRUCK, 2WHEELER, etc.
+    p_non_obstacle_rcs_only_classifier: float = 0.0
+
+    # Dimensions
+    length: float = 1.8
+    width: float = 0.6
+
+    # Angular data
+    yaw_angle: float = 0.0
+    facing_angle: float = 0.0
+
+    # Video related
+    w_exist_of_associated_video_object: float = 0.0
+    video_inv_ttc: float = 0.0
+    recently_used_video_measurement_handle_valid: bool = False
+    recently_used_video_measurement_handle: int = 0
+    object_id_10bit: int = 1
+    created_by_video_with_high_vy: bool = False
+    num_cycles_since_last_video_update_with_angular_velocity: int = 0
+
+    # Suppression flags
+    is_suppressed_until_next_video_update: bool = False
+    is_suppressed_due_to_video_otc_post_processing: bool = False
+    is_updated_with_stat_loc_with_high_mdoppler_with_outgoing_vr: bool = False
+    is_orientation_implausible_compared_2_vid: bool = False
+
+    # Other accumulated values
+    vy_unreliable_accumulated: float = 0.0
+
+@dataclass
+class EgoVehicleData:
+    """Ego vehicle motion data"""
+    velocity_x: float = 0.0  # m/s
+    acceleration_y: float = 0.0  # m/s²
+    yaw_rate: float = 0.0  # rad/s
+
+@dataclass
+class Parameters:
+    """Configuration parameters"""
+    is_micro_doppler_check_enabled: bool = True
+    min_vru_micro_doppler_cycles: int = 1
+    is_micro_doppler_check_on_crossing_vru_applied: bool = True
+    is_micro_doppler_check_on_stationary_vru_applied: bool = True
+    innovation_check_dx_threshold: float = 50.0
+    innovation_check_dy_threshold: float = 50.0
+    implausible_vy_thresh_la_hypo: float = 8.0
+    split_detection_cnt_max_val: int = 3
+    implausible_rcs_thresh: float = -9.5
+    max_longitudinal_distance_for_rcs_countermeasure: float = 20.0
+    elevation_check_dx_limits: List[float] = field(default_factory=lambda: [0.0, 100.0])
+    elevation_check_dz_thresholds: List[float] = field(default_factory=lambda: [2.0, 3.0])
+
+@dataclass
+class CheckResult:
+    """Outcome of a single check for one object"""
+    name: str
+    hit: bool
+    message: str
+
+    def format(self) -> str:
+        """Format the result as a single display line"""
+        return f"{'✓' if self.hit else '✗'} {self.name} - {self.message}"
+
+def object_to_dict(obj: ObjectData) -> Dict[str, Any]:
+    """Convert an ObjectData instance to a JSON-serializable nested dict"""
+    return asdict(obj)
+
+def object_from_dict(data: Dict[str, Any]) -> ObjectData:
+    """Create an ObjectData instance from a nested dict, defaulting missing fields"""
+    data = dict(data)
+    state = ObjectState(**data.pop("state", {}))
+    sensor_filter_fus_helper = SensorFilterFusHelper(**data.pop("sensor_filter_fus_helper", {}))
+    return ObjectData(state=state, sensor_filter_fus_helper=sensor_filter_fus_helper, **data)
+
+def ego_from_dict(data: Dict[str, Any]) -> EgoVehicleData:
+    """Create an EgoVehicleData instance from a dict, defaulting missing fields"""
+    return EgoVehicleData(**data)
+
+def params_from_dict(data: Dict[str, Any]) -> Parameters:
+    """Create a Parameters instance from a dict, defaulting missing fields"""
+    return Parameters(**data)
+
+def is_negative(value):
+    """Helper function to check if value is negative"""
+    return value < 0.0
+
+def is_moving_towards_ego_lane(dy_obj, vy_obj_rel, vy_obj_over_ground):
+    """Function 3: isMovingTowardsEgoLane"""
+    return is_negative(dy_obj * vy_obj_rel) or is_negative(dy_obj * vy_obj_over_ground)
+
+def is_dep_obj_probably_video_ghost(obj: ObjectData):
+    """Function 4: isDepObjProbablyVideoGhost"""
+    sensor = obj.sensor_filter_fus_helper
+
+    # Complex logic for video ghost detection
+    is_initial_radar_update_phase = (
+        sensor.total_num_front_center_location_radar_updates > 0 and
+        sensor.total_num_front_center_location_radar_updates < 3 and
+        sensor.updates_since_last_radar_update == 0
+    )
+
+    is_tracked_by_video = sensor.total_num_video_updates > 3
+
+    has_not_been_updated_by_corner_radar = (
+        sensor.total_num_front_left_corner_updates == 0 and
+        sensor.total_num_front_right_corner_updates == 0
+    )
+
+    is_almost_video_only = is_tracked_by_video and has_not_been_updated_by_corner_radar and is_initial_radar_update_phase
+
+    has_no_micro_doppler = (
+        obj.number_micro_doppler_cycles == 0 and
+        obj.expected_vr_high_enough_for_mu_doppler_counter > 0
+    )
+
+    is_very_low_rcs = obj.rcs < -15.0
+
+    return is_almost_video_only and has_no_micro_doppler and is_very_low_rcs
+
+def interpolate_elevation_dz_threshold(params: Parameters, obj_dx):
+    """Allowed elevation threshold over dx: linear interpolation between the limits, constant outside
+
+    Branches like linearInterpolateConstantExtrapolate, so equal or reversed
+    limits select an endpoint instead of dividing by their difference.
+    """
+    dx_low, dx_high = params.elevation_check_dx_limits
+    dz_low, dz_high = params.elevation_check_dz_thresholds
+    if obj_dx <= dx_low:
+        return dz_low
+    if obj_dx >= dx_high:
+        return dz_high
+    if dx_high <= dx_low:  # Only a NaN dx gets here; the C++ division yields NaN
+        return math.nan
+    return dz_low + ((obj_dx - dx_low) / (dx_high - dx_low)) * (dz_high - dz_low)
+
+def calc_total_abs_velocity_over_ground(abs_vel_over_ground):
+    """Magnitude of the absolute velocity over ground"""
+    return math.hypot(abs_vel_over_ground[0], abs_vel_over_ground[1])
+
+def calc_dx_innovation_threshold(obj: ObjectData, abs_vel_over_ground):
+    """calcDxInnovationThreshold: dx innovation threshold by object type, rcs, vy reliability, fusion and speed"""
+    abs_dx = abs(obj.state.x)
+    if abs_dx < 20.0 and obj.is_object_vru:
+        return 1.5
+    if obj.rcs < -5.0 and obj.vy_unreliable_accumulated > 1.9:
+        return 1.1
+    if obj.rcs < -15.0:
+        return 1.5
+
+    sensor = obj.sensor_filter_fus_helper
+    nr_contribution = 0.8 * min(255.0, obj.num_cycles_existing)  # 80% of cycles
+    is_good_fused_object = (obj.num_cycles_existing > 5 and
+                            sensor.is_good_quality_fused_object and
+                            sensor.total_num_front_center_location_radar_updates >= nr_contribution and
+                            sensor.total_num_video_updates >= nr_contribution)
+    is_very_slow_object = calc_total_abs_velocity_over_ground(abs_vel_over_ground) < 1.0
+    if is_good_fused_object and is_very_slow_object and obj.rcs > -10.0:
+        return 6.0
+    if abs_dx < 35.0 and obj.is_object_vru and obj.rcs < -5.0 and is_very_slow_object:
+        return 1.4
+    return 1.6  # Default
+
+# Ego motion thresholds of applyRadarOnlyNLDCheck and applyImplausibleVyVruCheck
+EGO_DRIVING_STRAIGHT_RADIUS = 2500.0
+EGO_DRIVING_STRAIGHT_ACCELERATION_THRESHOLD = 0.15
+EGO_DRIVING_STRAIGHT_ANGLE_DT_THRESHOLD = 0.012
+TURNING_EGO_YAW_RATE_THRESHOLD = 10.0 * (math.pi / 180.0)  # 10 degrees in radians
+
+@dataclass(frozen=True)
+class EgoMotion:
+    """Quantities derived from the ego motion, shared by all objects of a cycle"""
+    radius: float  # velocity_x / yaw_rate, infinite without yaw rate
+    is_driving_straight: bool
+    is_turning: bool
+
+@functools.lru_cache(maxsize=256)
+def _ego_motion(velocity_x, acceleration_y, yaw_rate) -> EgoMotion:
+    if yaw_rate == 0:
+        return EgoMotion(math.inf, True, False)
+    radius = velocity_x / yaw_rate
+    is_driving_straight = (abs(radius) > EGO_DRIVING_STRAIGHT_RADIUS or
+                           (abs(acceleration_y) < EGO_DRIVING_STRAIGHT_ACCELERATION_THRESHOLD and
+                            yaw_rate < EGO_DRIVING_STRAIGHT_ANGLE_DT_THRESHOLD))
+    return EgoMotion(radius, is_driving_straight, abs(yaw_rate) > TURNING_EGO_YAW_RATE_THRESHOLD)
+
+def ego_motion(ego: EgoVehicleData) -> EgoMotion:
+    """Ego radius, straightness and turning, computed once per distinct ego state"""
+    return _ego_motion(ego.velocity_x, ego.acceleration_y, ego.yaw_rate)
+
+def is_ego_driving_straight(ego: EgoVehicleData):
+    """Ego driving straight check used by applyRadarOnlyNLDCheck"""
+    return ego_motion(ego).is_driving_straight
+
+def calc_abs_vel_over_ground(state: ObjectState, ego: EgoVehicleData) -> Tuple[float, float]:
+    """Velocity over ground of an object from its relative velocity and the ego motion
+
+    The ego frame moves with velocity_x and rotates with yaw_rate, so a point
+    at (x, y) in it moves with (velocity_x - yaw_rate * y, yaw_rate * x).
+    """
+    return (state.vx + ego.velocity_x - ego.yaw_rate * state.y,
+            state.vy + ego.yaw_rate * state.x)
+
+def apply_suppression_until_next_video_update_check(obj: ObjectData, ego: EgoVehicleData, params: Parameters, abs_vel_over_ground):
+    """Function 1: applySuppressionUntilNextVideoUpdateCheck"""
+    name = "applySuppressionUntilNextVideoUpdateCheck"
+    if obj.is_suppressed_until_next_video_update:
+        return CheckResult(name, True, "Object is suppressed until next video update")
+    return CheckResult(name, False, "Object is not suppressed")
+
+def apply_post_process_video_otc_check(obj: ObjectData, ego: EgoVehicleData, params: Parameters, abs_vel_over_ground):
+    """Function 2: applyPostProcessVideoOtcCheck"""
+    name = "applyPostProcessVideoOtcCheck"
+    if obj.is_suppressed_due_to_video_otc_post_processing:
+        return CheckResult(name, True, "Object is suppressed due to video OTC post processing")
+    return CheckResult(name, False, "Object is not suppressed due to video OTC")
+
+def check_moving_towards_ego_lane(obj: ObjectData, ego: EgoVehicleData, params: Parameters, abs_vel_over_ground):
+    """Function 3: isMovingTowardsEgoLane"""
+    name = "isMovingTowardsEgoLane"
+    if is_moving_towards_ego_lane(obj.state.y, obj.state.vy, abs_vel_over_ground[1]):
+        return CheckResult(name, True, "Object is moving towards ego lane")
+    return CheckResult(name, False, "Object is not moving towards ego lane")
+
+def check_dep_obj_probably_video_ghost(obj: ObjectData, ego: EgoVehicleData, params: Parameters, abs_vel_over_ground):
+    """Function 4: isDepObjProbablyVideoGhost"""
+    name = "isDepObjProbablyVideoGhost"
+    if is_dep_obj_probably_video_ghost(obj):
+        return CheckResult(name, True, "Object is probably a video ghost")
+    return CheckResult(name, False, "Object is probably not a video ghost")
+
+def apply_updated_with_stat_loc_with_high_mdoppler_with_outgoing_vr_check(obj: ObjectData, ego: EgoVehicleData, params: Parameters, abs_vel_over_ground):
+    """Function 6: applyUpdatedWithStatLocWithHighMDopplerWithOutgoingVrCheck"""
+    name = "applyUpdatedWithStatLocWithHighMDopplerWithOutgoingVrCheck"
+    condition_6 = (
+        obj.is_object_vru and
+        abs_vel_over_ground[0] < 0.2 and
+        abs_vel_over_ground[1] > 1.0 and
+        abs(obj.state.y) < 0.5 and
+        obj.is_updated_with_stat_loc_with_high_mdoppler_with_outgoing_vr
+    )
+    if condition_6:
+        return CheckResult(name, True, "VRU with stat loc and high micro doppler")
+    return CheckResult(name, False, "Conditions not met")
+
+def apply_is_measured_ratio_check_for_fast_wnj(obj: ObjectData, ego: EgoVehicleData, params: Parameters, abs_vel_over_ground):
+    """Function 7: applyIsMeasuredRatioCheckForFastWnj"""
+    name = "applyIsMeasuredRatioCheckForFastWnj"
+    if (obj.filter_type == "WNJ" and
+        abs(abs_vel_over_ground[1]) > 4.6 and
+        obj.num_cycles_existing < 255):
+
+        if obj.num_cycles_existing > 1:
+            ratio = obj.sensor_filter_fus_helper.total_num_radar_updates / (obj.num_cycles_existing + 1)
+            if (ratio < 0.7 and obj.sensor_filter_fus_helper.total_num_video_updates <= 5):
+                return CheckResult(name, True, "Fast WNJ with insufficient measurement ratio")
+            return CheckResult(name, False, "Measurement ratio is sufficient")
+        return CheckResult(name, False, "Object too young")
+    return CheckResult(name, False, "Not a fast crossing WNJ object")
+
+def apply_non_crossing_object_check(obj: ObjectData, ego: EgoVehicleData, params: Parameters, abs_vel_over_ground):
+    """Function 9: applyNonCrossingObjectCheck"""
+    name = "applyNonCrossingObjectCheck"
+    appears_crossing = abs_vel_over_ground[1] > 0.5
+    is_prob_moving_low = (obj.prob_is_currently_moving < 0.1 and
+                          obj.prob_has_been_observed_moving < 0.1)
+    has_been_updated_by_radar = obj.sensor_filter_fus_helper.total_num_front_center_location_radar_updates > 0
+    has_no_micro_doppler = obj.number_micro_doppler_cycles == 0
+    has_no_oncoming_locations = obj.total_num_cycles_with_oncoming_locations == 0
+    is_not_perceived_as_moving_by_radar = has_been_updated_by_radar and has_no_micro_doppler and has_no_oncoming_locations
+
+    appears_crossing_but_probably_not = appears_crossing and is_prob_moving_low and is_not_perceived_as_moving_by_radar
+
+    if appears_crossing_but_probably_not:
+        return CheckResult(name, True, "Object appears crossing but is probably not moving")
+    return CheckResult(name, False, "Object crossing behavior is consistent")
+
+def apply_micro_doppler_check(obj: ObjectData, ego: EgoVehicleData, params: Parameters, abs_vel_over_ground):
+    """Function 12: applyMicroDopplerCheck"""
+    name = "applyMicroDopplerCheck"
+    sensor = obj.sensor_filter_fus_helper
+    if (params.is_micro_doppler_check_enabled and
+        obj.is_object_vru and
+        obj.expected_vr_high_enough_for_mu_doppler_counter >= 2 and
+        sensor.total_num_front_center_location_radar_updates > 0 and
+        sensor.total_num_front_left_corner_updates < 1 and
+        sensor.total_num_front_right_corner_updates < 1 and
+        obj.number_micro_doppler_cycles < params.min_vru_micro_doppler_cycles):
+
+        # Check for crossing VRU conditions
+        object_age_threshold = 12
+        is_object_old = (obj.num_cycles_existing > object_age_threshold and
+                         sensor.total_num_front_center_location_radar_updates > 8)
+        upper_abs_vy_threshold = 3.2 if is_object_old else 99.0
+
+        is_crossing_vru = (abs_vel_over_ground[1] > 0.5 and
+                           abs_vel_over_ground[1] < upper_abs_vy_threshold and
+                           abs_vel_over_ground[0] < 4.0)
+
+        are_crossing_vru_conditions_satisfied = is_crossing_vru and params.is_micro_doppler_check_on_crossing_vru_applied
+
+        # Check for stationary VRU conditions
+        is_stationary_vru = (abs_vel_over_ground[0] < 0.5 and abs_vel_over_ground[1] < 0.5)
+        are_stationary_vru_conditions_satisfied = is_stationary_vru and params.is_micro_doppler_check_on_stationary_vru_applied
+
+        if are_crossing_vru_conditions_satisfied or are_stationary_vru_conditions_satisfied:
+            return CheckResult(name, True, "VRU missing expected micro-doppler signatures")
+        return CheckResult(name, False, "VRU conditions not met for micro-doppler check")
+    return CheckResult(name, False, "Micro-doppler check conditions not met")
+
+def apply_radar_only_rcs_and_dr_innovation_limit(obj: ObjectData, ego: EgoVehicleData, params: Parameters, abs_vel_over_ground):
+    """Function 13: applyRadarOnlyRcsAndDrInnovationLimit"""
+    name = "applyRadarOnlyRcsAndDrInnovationLimit"
+    is_front_center_radar_only = (obj.sensor_filter_fus_helper.total_num_video_updates == 0 and
+                                  obj.sensor_filter_fus_helper.total_num_front_center_location_radar_updates > 0)
+    is_dr_innovation_exceeded = abs(obj.avg_dx_innovation) > 1.2
+    is_rcs_too_low = obj.rcs < -15.0
+
+    if is_front_center_radar_only and is_dr_innovation_exceeded and is_rcs_too_low:
+        return CheckResult(name, True, "Radar-only object with high innovation and low RCS")
+    return CheckResult(name, False, "Conditions not met")
+
+def apply_elevation_check(obj: ObjectData, ego: EgoVehicleData, params: Parameters, abs_vel_over_ground):
+    """Function 14: applyElevationCheck"""
+    name = "applyElevationCheck"
+    obj_dx = obj.state.x
+    is_stationary_velocity_threshold = 1.0
+    is_object_stationary = (abs_vel_over_ground[0] < is_stationary_velocity_threshold and
+                            abs_vel_over_ground[1] < is_stationary_velocity_threshold)
+    has_been_updated_by_video_recently = obj.sensor_filter_fus_helper.updates_since_last_video_update < 10
+    is_stationary_video_confirmed_object = is_object_stationary and has_been_updated_by_video_recently
+
+    if (obj_dx > 0 and obj.elevation_is_valid and
+        (is_stationary_video_confirmed_object or obj.is_object_vru)):
+        allowed_dz_threshold = interpolate_elevation_dz_threshold(params, obj_dx)
+        is_dz_inappropriate = obj.elevation > allowed_dz_threshold
+
+        if is_dz_inappropriate:
+            return CheckResult(name, True, "Object elevation is inappropriate (too high)")
+        return CheckResult(name, False, "Object elevation is appropriate")
+    return CheckResult(name, False, "Elevation check preconditions not met")
+
+def apply_innovation_check(obj: ObjectData, ego: EgoVehicleData, params: Parameters, abs_vel_over_ground):
+    """Function 21: applyInnovationCheck"""
+    name = "applyInnovationCheck"
+    innovation_relevant = (abs(obj.state.x) < params.innovation_check_dx_threshold and
+                           abs(obj.state.y) < params.innovation_check_dy_threshold)
+
+    dx_innovation_threshold = calc_dx_innovation_threshold(obj, abs_vel_over_ground)
+    abs_avg_innovation_dx = abs(obj.avg_dx_innovation)
+
+    if innovation_relevant and abs_avg_innovation_dx > dx_innovation_threshold:
+        return CheckResult(name, True, "Object has high dx innovation in relevant range")
+    return CheckResult(name, False, "Innovation is within acceptable limits")
+
+def apply_implausible_vy_vru_check(obj: ObjectData, ego: EgoVehicleData, params: Parameters, abs_vel_over_ground):
+    """Function 23: applyImplausibleVyVruCheck"""
+    name = "applyImplausibleVyVruCheck"
+    is_ego_turning = ego_motion(ego).is_turning
+
+    if (obj.is_object_vru and
+        abs_vel_over_ground[1] > params.implausible_vy_thresh_la_hypo and
+        obj.filter_type == "LA" and
+        not is_ego_turning):
+        return CheckResult(name, True, "VRU with implausible VY velocity")
+    return CheckResult(name, False, "VRU VY velocity is plausible")
+
+def apply_implausible_video_ttc_for_vru(obj: ObjectData, ego: EgoVehicleData, params: Parameters, abs_vel_over_ground):
+    """Function 25: applyImplausibleVideoTtcForVru"""
+    name = "applyImplausibleVideoTtcForVru"
+    if (obj.is_object_vru and
+        obj.sensor_filter_fus_helper.updates_since_last_video_update < 1 and
+        obj.video_inv_ttc == float('inf')):  # Representing max float
+        return CheckResult(name, True, "VRU with implausible video TTC")
+    return CheckResult(name, False, "Video TTC is plausible")
+
+def apply_radar_only_nld_check(obj: ObjectData, ego: EgoVehicleData, params: Parameters, abs_vel_over_ground):
+    """Function 29: applyRadarOnlyNLDCheck"""
+    name = "applyRadarOnlyNLDCheck"
+    if obj.sensor_filter_fus_helper.total_num_video_updates == 0:
+        # Ego driving straight check
+        ego_driving_straight = is_ego_driving_straight(ego)
+
+        # Object in relevant area check
+        is_object_in_relevant_area = ((abs(obj.state.y) <= 1.25 and obj.state.x < 120.0) or
+                                      (abs(obj.state.y) <= 6.0 and obj.state.x < 10.0))
+
+        # Object age check
+        is_object_old_enough = obj.num_cycles_existing >= 3
+
+        # Object measurement check
+        is_object_measured_sufficiently = (obj.sensor_filter_fus_helper.total_num_radar_updates >=
+                                           obj.num_cycles_existing or
+                                           obj.num_cycles_existing >= 30)
+
+        is_radar_only_nld_candidate = (not ego_driving_straight or
+                                       not is_object_in_relevant_area or
+                                       not is_object_old_enough or
+                                       not is_object_measured_sufficiently)
+
+        # High lateral velocity check
+        is_object_close_with_high_lateral_velocity = (abs(obj.state.vy) > 3.0 and
+                                                      obj.state.x < 8.0 and
+                                                      abs(obj.state.y) < 4.0)
+
+        if is_radar_only_nld_candidate or is_object_close_with_high_lateral_velocity:
+            return CheckResult(name, True, "Radar-only object is NLD candidate")
+        return CheckResult(name, False, "Radar-only object is not NLD candidate")
+    return CheckResult(name, False, "Object is not radar-only")
+
+def apply_radar_only_stationary_check(obj: ObjectData, ego: EgoVehicleData, params: Parameters, abs_vel_over_ground):
+    """Function 30: applyRadarOnlyStationaryCheck"""
+    name = "applyRadarOnlyStationaryCheck"
+    if obj.sensor_filter_fus_helper.total_num_video_updates == 0:
+        if abs_vel_over_ground[0] < 0.3 and abs_vel_over_ground[1] < 0.3:
+            return CheckResult(name, True, "Radar-only stationary object")
+        return CheckResult(name, False, "Radar-only object is not stationary")
+    return CheckResult(name, False, "Object is not radar-only")
+
+# Checks in the order they are evaluated and reported
+CHECKS: Tuple[Callable[..., CheckResult], ...] = (
+    apply_suppression_until_next_video_update_check,
+    apply_post_process_video_otc_check,
+    check_moving_towards_ego_lane,
+    check_dep_obj_probably_video_ghost,
+    apply_updated_with_stat_loc_with_high_mdoppler_with_outgoing_vr_check,
+    apply_is_measured_ratio_check_for_fast_wnj,
+    apply_non_crossing_object_check,
+    apply_micro_doppler_check,
+    apply_radar_only_rcs_and_dr_innovation_limit,
+    apply_elevation_check,
+    apply_innovation_check,
+    apply_implausible_vy_vru_check,
+    apply_implausible_video_ttc_for_vru,
+    apply_radar_only_nld_check,
+    apply_radar_only_stationary_check,
+)
+
+CHECK_NAMES: Tuple[str, ...] = (
+    "applySuppressionUntilNextVideoUpdateCheck",
+    "applyPostProcessVideoOtcCheck",
+    "isMovingTowardsEgoLane",
+    "isDepObjProbablyVideoGhost",
+    "applyUpdatedWithStatLocWithHighMDopplerWithOutgoingVrCheck",
+    "applyIsMeasuredRatioCheckForFastWnj",
+    "applyNonCrossingObjectCheck",
+    "applyMicroDopplerCheck",
+    "applyRadarOnlyRcsAndDrInnovationLimit",
+    "applyElevationCheck",
+    "applyInnovationCheck",
+    "applyImplausibleVyVruCheck",
+    "applyImplausibleVideoTtcForVru",
+    "applyRadarOnlyNLDCheck",
+    "applyRadarOnlyStationaryCheck",
+)
+
+# Optional instrumentation receiving every evaluation, see perception_instrumentation
+_instrumentation = None
+
+def set_instrumentation(instrumentation):
+    """Install an instrumentation (None removes it), returning the previously installed one"""
+    global _instrumentation
+    previous, _instrumentation = _instrumentation, instrumentation
+    return previous
+
+def get_instrumentation():
+    """The installed instrumentation, None when disabled"""
+    return _instrumentation
+
+def evaluate_object(obj: ObjectData, ego: EgoVehicleData, params: Parameters,
+                    abs_vel_over_ground: Sequence[float]) -> List[CheckResult]:
+    """Evaluate all checks for a single object"""
+    if _instrumentation is not None:
+        return _instrumentation.evaluate_object(obj, ego, params, abs_vel_over_ground)
+    return [check(obj, ego, params, abs_vel_over_ground) for check in CHECKS]
+
+# Packed result bitfield: bit i is set when check CHECK_NAMES[i] hits, the
+# function relevance bits written by the C++ disqualify* calls sit above them
+DISQUALIFIED_FOR_AEB = 1 << 16
+DISQUALIFIED_FOR_ACC = 1 << 17
+DISQUALIFIED_FOR_VY_DEPENDENT_FUNCTIONS = 1 << 18
+RELEVANCE_BIT_NAMES = {
+    DISQUALIFIED_FOR_AEB: "AEB",
+    DISQUALIFIED_FOR_ACC: "ACC",
+    DISQUALIFIED_FOR_VY_DEPENDENT_FUNCTIONS: "VyDependentFunctions",
+}
+CHECK_HIT_MASK = (1 << len(CHECK_NAMES)) - 1
+
+# Relevance bits set by each check on a hit (disqualifyForAeb, disqualifyForAebAndAcc,
+# disqualifyForVyDependentFunctions); the helpers isMovingTowardsEgoLane and
+# isDepObjProbablyVideoGhost do not disqualify on their own
+CHECK_RELEVANCE = {
+    "applySuppressionUntilNextVideoUpdateCheck": DISQUALIFIED_FOR_AEB,
+    "applyPostProcessVideoOtcCheck": DISQUALIFIED_FOR_AEB,
+    "isMovingTowardsEgoLane": 0,
+    "isDepObjProbablyVideoGhost": 0,
+    "applyUpdatedWithStatLocWithHighMDopplerWithOutgoingVrCheck": DISQUALIFIED_FOR_AEB,
+    "applyIsMeasuredRatioCheckForFastWnj": DISQUALIFIED_FOR_AEB,
+    "applyNonCrossingObjectCheck": DISQUALIFIED_FOR_VY_DEPENDENT_FUNCTIONS,
+    "applyMicroDopplerCheck": DISQUALIFIED_FOR_AEB,
+    "applyRadarOnlyRcsAndDrInnovationLimit": DISQUALIFIED_FOR_AEB,
+    "applyElevationCheck": DISQUALIFIED_FOR_AEB,
+    "applyInnovationCheck": DISQUALIFIED_FOR_AEB,
+    "applyImplausibleVyVruCheck": DISQUALIFIED_FOR_AEB | DISQUALIFIED_FOR_ACC,
+    "applyImplausibleVideoTtcForVru": DISQUALIFIED_FOR_AEB,
+    "applyRadarOnlyNLDCheck": DISQUALIFIED_FOR_AEB | DISQUALIFIED_FOR_ACC,
+    "applyRadarOnlyStationaryCheck": DISQUALIFIED_FOR_AEB | DISQUALIFIED_FOR_ACC,
+}
+
+def relevance_bits(hit_bits: int) -> int:
+    """Function relevance bits implied by a set of check hit bits"""
+    bits = 0
+    for index, name in enumerate(CHECK_NAMES):
+        if hit_bits >> index & 1:
+            bits |= CHECK_RELEVANCE[name]
+    return bits
+
+def pack_hits(hits: Sequence[bool]) -> int:
+    """Pack per-check hit flags (in CHECK_NAMES order) into a result bitfield"""
+    hit_bits = 0
+    for index, hit in enumerate(hits):
+        if hit:
+            hit_bits |= 1 << index
+    return hit_bits | relevance_bits(hit_bits)
+
+def evaluate_object_bits(obj: ObjectData, ego: EgoVehicleData, params: Parameters,
+                         abs_vel_over_ground: Sequence[float]) -> int:
+    """Evaluate all checks for a single object as a packed result bitfield"""
+    if _instrumentation is not None:
+        return pack_hits([result.hit for result in evaluate_object(obj, ego, params, abs_vel_over_ground)])
+    return pack_hits([check(obj, ego, params, abs_vel_over_ground).hit for check in CHECKS])
+
+def hit_check_names(bits: int) -> List[str]:
+    """Names of the checks whose hit bit is set"""
+    return [name for index, name in enumerate(CHECK_NAMES) if bits >> index & 1]
+
+def disqualified_functions(bits: int) -> List[str]:
+    """Names of the functions the object is disqualified for"""
+    return [name for bit, name in RELEVANCE_BIT_NAMES.items() if bits & bit]
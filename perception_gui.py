@@ -0,0 +1,1143 @@
+#!/usr/bin/env python3
+"""
+Tkinter GUI of the Automotive Perception Function Logic Emulator.
+
+Started by ``automotive_perception_emulator.py`` without arguments; importing
+this module imports tkinter, so command-line tools must not depend on it.
+"""
+
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext, simpledialog, filedialog
+import copy
+import json
+import os
+
+from perception_engine import (
+    ObjectData,
+    EgoVehicleData,
+    Parameters,
+    calc_abs_vel_over_ground,
+    CHECKS,
+    CHECK_NAMES,
+    disqualified_functions,
+    evaluate_object,
+    is_negative,
+    is_moving_towards_ego_lane,
+    is_dep_obj_probably_video_ghost,
+    pack_hits,
+)
+from perception_batch import CATEGORIES, decode_category, object_to_row
+from perception_campaign import CampaignJob
+from perception_result_table import SORT_KEYS, ResultTable
+from perception_rules import dependent_checks
+from perception_scenarios import Scenario, ScenarioLibrary
+
+# Column read by the checks for each GUI entry; entries missing here feed no check
+ENTRY_COLUMNS = {
+    'pos_x': 'state_x',
+    'pos_y': 'state_y',
+    'vel_x': 'state_vx',
+    'vel_y': 'state_vy',
+    'is_vru': 'is_object_vru',
+    'rcs': 'rcs',
+    'num_cycles': 'num_cycles_existing',
+    'filter_type': 'filter_type',
+    'prob_has_been_moving': 'prob_has_been_observed_moving',
+    'prob_currently_moving': 'prob_is_currently_moving',
+    'elevation': 'elevation',
+    'elevation_valid': 'elevation_is_valid',
+    'avg_dx_innovation': 'avg_dx_innovation',
+    'radar_innovation_dr': 'radar_based_innovation_dr',
+    'radar_innovation_alpha': 'radar_based_innovation_alpha',
+    'video_innovation_dr': 'video_based_innovation_dr',
+    'video_innovation_alpha': 'video_based_innovation_alpha',
+    'micro_doppler_cycles': 'number_micro_doppler_cycles',
+    'expected_vr_counter': 'expected_vr_high_enough_for_mu_doppler_counter',
+    'total_radar_updates': 'total_num_radar_updates',
+    'total_video_updates': 'total_num_video_updates',
+    'fc_location_radar_updates': 'total_num_front_center_location_radar_updates',
+    'fl_corner_updates': 'total_num_front_left_corner_updates',
+    'fr_corner_updates': 'total_num_front_right_corner_updates',
+    'since_last_video': 'updates_since_last_video_update',
+    'since_last_radar': 'updates_since_last_radar_update',
+    'good_quality_fused': 'is_good_quality_fused_object',
+    'trustworthy_object': 'is_trustworthy_object',
+    'velocity_x': 'ego_velocity_x',
+    'acceleration_y': 'ego_acceleration_y',
+    'yaw_rate': 'ego_yaw_rate',
+    'abs_vel_x': 'abs_vel_over_ground_x',
+    'abs_vel_y': 'abs_vel_over_ground_y',
+}
+
+# Quiet period after the last keystroke before a live evaluation runs
+LIVE_EVALUATION_DELAY_MS = 150
+
+# Batch runs: cycles per worker task (the progress granularity) and result polling period
+BATCH_CYCLES_PER_SHARD = 256
+BATCH_POLL_INTERVAL_MS = 100
+
+# Rows shown at once by the batch result table; only these exist as Treeview items
+BATCH_TABLE_ROWS = 25
+
+DEFAULT_CONFIG_FILE = "perception_config.json"
+
+class AutomotivePerceptionEmulator:
+    """Main emulation class for automotive perception functions"""
+    
+    def __init__(self):
+        self.root = tk.Tk()
+        self.root.title("Automotive Perception Function Emulator")
+        self.root.geometry("1200x800")
+        
+        # Data structures
+        self.obj_data = ObjectData()
+        self.ego_data = EgoVehicleData()
+        self.params = Parameters()
+        self.abs_vel_over_ground = [0.0, 0.0]
+        self.is_mpc3_used = False
+        self.dep_obj_probably_video_ghost = False
+        
+        # Add interactive mode flag
+        self.interactive_mode = tk.BooleanVar(value=False)
+        self.live_mode = tk.BooleanVar(value=False)
+        self.live_job = None
+        
+        # Inputs and results of the last evaluation, for incremental re-evaluation
+        self.last_entry_values = None
+        self.last_params = None
+        self.last_results = None
+        
+        # Running batch evaluation, polled from the Tk main loop
+        self.batch_job = None
+        self.batch_path = None
+        
+        # Batch result table: all results, filtered and sorted row indices, first visible row
+        self.batch_table = ResultTable.empty()
+        self.batch_rows = self.batch_table.select()
+        self.batch_offset = 0
+        
+        # Scenario library opened by the first library action
+        self.library = None
+        
+        # GUI components
+        self.obj_entries = {}
+        self.sensor_entries = {}
+        self.ego_entries = {}
+        self.results_text = None
+        
+        self.setup_gui()
+        
+    def setup_gui(self):
+        """Setup the main GUI"""
+        # Create main frame
+        main_frame = ttk.Frame(self.root)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        
+        # Create notebook for tabs
+        self.notebook = ttk.Notebook(main_frame)
+        self.notebook.pack(fill=tk.BOTH, expand=True)
+        
+        # Create tabs
+        self.create_object_tab()
+        self.create_sensor_tab()
+        self.create_ego_tab()
+        self.create_results_tab()
+        self.create_batch_tab()
+        
+        # Create control buttons
+        self.create_control_buttons()
+        self.bind_live_evaluation()
+        
+    def create_object_tab(self):
+        """Create object data input tab"""
+        self.obj_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.obj_frame, text="Object Data")
+        
+        # Object state frame
+        state_frame = ttk.LabelFrame(self.obj_frame, text="Object State")
+        state_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        # Position
+        tk.Label(state_frame, text="Position X (m):").grid(row=0, column=0, sticky="w")
+        self.obj_entries['pos_x'] = tk.Entry(state_frame, width=10)
+        self.obj_entries['pos_x'].grid(row=0, column=1, padx=5)
+        self.obj_entries['pos_x'].insert(0, "25.0")
+        
+        tk.Label(state_frame, text="Position Y (m):").grid(row=0, column=2, sticky="w")
+        self.obj_entries['pos_y'] = tk.Entry(state_frame, width=10)
+        self.obj_entries['pos_y'].grid(row=0, column=3, padx=5)
+        self.obj_entries['pos_y'].insert(0, "1.5")
+        
+        # Velocity
+        tk.Label(state_frame, text="Velocity X (m/s):").grid(row=1, column=0, sticky="w")
+        self.obj_entries['vel_x'] = tk.Entry(state_frame, width=10)
+        self.obj_entries['vel_x'].grid(row=1, column=1, padx=5)
+        self.obj_entries['vel_x'].insert(0, "0.5")
+        
+        tk.Label(state_frame, text="Velocity Y (m/s):").grid(row=1, column=2, sticky="w")
+        self.obj_entries['vel_y'] = tk.Entry(state_frame, width=10)
+        self.obj_entries['vel_y'].grid(row=1, column=3, padx=5)
+        self.obj_entries['vel_y'].insert(0, "3.0")
+        
+        # Object properties frame
+        props_frame = ttk.LabelFrame(self.obj_frame, text="Object Properties")
+        props_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        # VRU flag
+        tk.Label(props_frame, text="Is VRU:").grid(row=0, column=0, sticky="w")
+        self.obj_entries['is_vru'] = tk.BooleanVar(value=True)
+        tk.Checkbutton(props_frame, variable=self.obj_entries['is_vru']).grid(row=0, column=1)
+        
+        # RCS
+        tk.Label(props_frame, text="RCS (dBm²):").grid(row=0, column=2, sticky="w")
+        self.obj_entries['rcs'] = tk.Entry(props_frame, width=10)
+        self.obj_entries['rcs'].grid(row=0, column=3, padx=5)
+        self.obj_entries['rcs'].insert(0, "-8.0")
+        
+        # Number of cycles
+        tk.Label(props_frame, text="Cycles Existing:").grid(row=1, column=0, sticky="w")
+        self.obj_entries['num_cycles'] = tk.Entry(props_frame, width=10)
+        self.obj_entries['num_cycles'].grid(row=1, column=1, padx=5)
+        self.obj_entries['num_cycles'].insert(0, "8")
+        
+        # Filter type
+        tk.Label(props_frame, text="Filter Type:").grid(row=1, column=2, sticky="w")
+        self.obj_entries['filter_type'] = ttk.Combobox(props_frame, values=["LA", "WNJ", "KF"], width=8)
+        self.obj_entries['filter_type'].grid(row=1, column=3, padx=5)
+        self.obj_entries['filter_type'].set("LA")
+        
+        # Probabilities frame
+        prob_frame = ttk.LabelFrame(self.obj_frame, text="Probabilities")
+        prob_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        tk.Label(prob_frame, text="Prob Has Been Moving:").grid(row=0, column=0, sticky="w")
+        self.obj_entries['prob_has_been_moving'] = tk.Entry(prob_frame, width=10)
+        self.obj_entries['prob_has_been_moving'].grid(row=0, column=1, padx=5)
+        self.obj_entries['prob_has_been_moving'].insert(0, "0.3")
+        
+        tk.Label(prob_frame, text="Prob Currently Moving:").grid(row=0, column=2, sticky="w")
+        self.obj_entries['prob_currently_moving'] = tk.Entry(prob_frame, width=10)
+        self.obj_entries['prob_currently_moving'].grid(row=0, column=3, padx=5)
+        self.obj_entries['prob_currently_moving'].insert(0, "0.2")
+        
+        # Elevation frame
+        elev_frame = ttk.LabelFrame(self.obj_frame, text="Elevation")
+        elev_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        tk.Label(elev_frame, text="Elevation (m):").grid(row=0, column=0, sticky="w")
+        self.obj_entries['elevation'] = tk.Entry(elev_frame, width=10)
+        self.obj_entries['elevation'].grid(row=0, column=1, padx=5)
+        self.obj_entries['elevation'].insert(0, "0.0")
+        
+        tk.Label(elev_frame, text="Elevation Valid:").grid(row=0, column=2, sticky="w")
+        self.obj_entries['elevation_valid'] = tk.BooleanVar(value=True)
+        tk.Checkbutton(elev_frame, variable=self.obj_entries['elevation_valid']).grid(row=0, column=3)
+        
+        # Innovation frame
+        innov_frame = ttk.LabelFrame(self.obj_frame, text="Innovation")
+        innov_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        tk.Label(innov_frame, text="Avg DX Innovation:").grid(row=0, column=0, sticky="w")
+        self.obj_entries['avg_dx_innovation'] = tk.Entry(innov_frame, width=10)
+        self.obj_entries['avg_dx_innovation'].grid(row=0, column=1, padx=5)
+        self.obj_entries['avg_dx_innovation'].insert(0, "0.5")
+        
+        tk.Label(innov_frame, text="Radar Innov DR:").grid(row=0, column=2, sticky="w")
+        self.obj_entries['radar_innovation_dr'] = tk.Entry(innov_frame, width=10)
+        self.obj_entries['radar_innovation_dr'].grid(row=0, column=3, padx=5)
+        self.obj_entries['radar_innovation_dr'].insert(0, "0.0")
+        
+        tk.Label(innov_frame, text="Radar Innov Alpha:").grid(row=1, column=0, sticky="w")
+        self.obj_entries['radar_innovation_alpha'] = tk.Entry(innov_frame, width=10)
+        self.obj_entries['radar_innovation_alpha'].grid(row=1, column=1, padx=5)
+        self.obj_entries['radar_innovation_alpha'].insert(0, "0.0")
+        
+        tk.Label(innov_frame, text="Video Innov DR:").grid(row=1, column=2, sticky="w")
+        self.obj_entries['video_innovation_dr'] = tk.Entry(innov_frame, width=10)
+        self.obj_entries['video_innovation_dr'].grid(row=1, column=3, padx=5)
+        self.obj_entries['video_innovation_dr'].insert(0, "0.0")
+        
+        tk.Label(innov_frame, text="Video Innov Alpha:").grid(row=2, column=0, sticky="w")
+        self.obj_entries['video_innovation_alpha'] = tk.Entry(innov_frame, width=10)
+        self.obj_entries['video_innovation_alpha'].grid(row=2, column=1, padx=5)
+        self.obj_entries['video_innovation_alpha'].insert(0, "0.0")
+        
+        # Micro doppler frame
+        micro_frame = ttk.LabelFrame(self.obj_frame, text="Micro Doppler")
+        micro_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        tk.Label(micro_frame, text="Micro Doppler Cycles:").grid(row=0, column=0, sticky="w")
+        self.obj_entries['micro_doppler_cycles'] = tk.Entry(micro_frame, width=10)
+        self.obj_entries['micro_doppler_cycles'].grid(row=0, column=1, padx=5)
+        self.obj_entries['micro_doppler_cycles'].insert(0, "0")
+        
+        tk.Label(micro_frame, text="Expected VR Counter:").grid(row=0, column=2, sticky="w")
+        self.obj_entries['expected_vr_counter'] = tk.Entry(micro_frame, width=10)
+        self.obj_entries['expected_vr_counter'].grid(row=0, column=3, padx=5)
+        self.obj_entries['expected_vr_counter'].insert(0, "5")
+        
+    def create_sensor_tab(self):
+        """Create sensor data input tab"""
+        self.sensor_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.sensor_frame, text="Sensor Data")
+        
+        # Sensor updates frame
+        updates_frame = ttk.LabelFrame(self.sensor_frame, text="Sensor Updates")
+        updates_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        tk.Label(updates_frame, text="Total Radar Updates:").grid(row=0, column=0, sticky="w")
+        self.sensor_entries['total_radar_updates'] = tk.Entry(updates_frame, width=10)
+        self.sensor_entries['total_radar_updates'].grid(row=0, column=1, padx=5)
+        self.sensor_entries['total_radar_updates'].insert(0, "5")
+        
+        tk.Label(updates_frame, text="Total Video Updates:").grid(row=0, column=2, sticky="w")
+        self.sensor_entries['total_video_updates'] = tk.Entry(updates_frame, width=10)
+        self.sensor_entries['total_video_updates'].grid(row=0, column=3, padx=5)
+        self.sensor_entries['total_video_updates'].insert(0, "3")
+        
+        tk.Label(updates_frame, text="FC Location Radar Updates:").grid(row=1, column=0, sticky="w")
+        self.sensor_entries['fc_location_radar_updates'] = tk.Entry(updates_frame, width=10)
+        self.sensor_entries['fc_location_radar_updates'].grid(row=1, column=1, padx=5)
+        self.sensor_entries['fc_location_radar_updates'].insert(0, "5")
+        
+        tk.Label(updates_frame, text="FL Corner Updates:").grid(row=1, column=2, sticky="w")
+        self.sensor_entries['fl_corner_updates'] = tk.Entry(updates_frame, width=10)
+        self.sensor_entries['fl_corner_updates'].grid(row=1, column=3, padx=5)
+        self.sensor_entries['fl_corner_updates'].insert(0, "0")
+        
+        tk.Label(updates_frame, text="FR Corner Updates:").grid(row=2, column=0, sticky="w")
+        self.sensor_entries['fr_corner_updates'] = tk.Entry(updates_frame, width=10)
+        self.sensor_entries['fr_corner_updates'].grid(row=2, column=1, padx=5)
+        self.sensor_entries['fr_corner_updates'].insert(0, "0")
+        
+        tk.Label(updates_frame, text="Since Last Video:").grid(row=2, column=2, sticky="w")
+        self.sensor_entries['since_last_video'] = tk.Entry(updates_frame, width=10)
+        self.sensor_entries['since_last_video'].grid(row=2, column=3, padx=5)
+        self.sensor_entries['since_last_video'].insert(0, "2")
+        
+        tk.Label(updates_frame, text="Since Last Radar:").grid(row=3, column=0, sticky="w")
+        self.sensor_entries['since_last_radar'] = tk.Entry(updates_frame, width=10)
+        self.sensor_entries['since_last_radar'].grid(row=3, column=1, padx=5)
+        self.sensor_entries['since_last_radar'].insert(0, "0")
+        
+        # Quality flags frame
+        quality_frame = ttk.LabelFrame(self.sensor_frame, text="Quality Flags")
+        quality_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        tk.Label(quality_frame, text="Good Quality Fused:").grid(row=0, column=0, sticky="w")
+        self.sensor_entries['good_quality_fused'] = tk.BooleanVar(value=True)
+        tk.Checkbutton(quality_frame, variable=self.sensor_entries['good_quality_fused']).grid(row=0, column=1)
+        
+        tk.Label(quality_frame, text="Trustworthy Object:").grid(row=0, column=2, sticky="w")
+        self.sensor_entries['trustworthy_object'] = tk.BooleanVar(value=True)
+        tk.Checkbutton(quality_frame, variable=self.sensor_entries['trustworthy_object']).grid(row=0, column=3)
+        
+    def create_ego_tab(self):
+        """Create ego vehicle data input tab"""
+        self.ego_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.ego_frame, text="Ego Vehicle")
+        
+        # Ego motion frame
+        motion_frame = ttk.LabelFrame(self.ego_frame, text="Ego Motion")
+        motion_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        tk.Label(motion_frame, text="Velocity X (m/s):").grid(row=0, column=0, sticky="w")
+        self.ego_entries['velocity_x'] = tk.Entry(motion_frame, width=10)
+        self.ego_entries['velocity_x'].grid(row=0, column=1, padx=5)
+        self.ego_entries['velocity_x'].insert(0, "13.9")
+        
+        tk.Label(motion_frame, text="Acceleration Y (m/s²):").grid(row=0, column=2, sticky="w")
+        self.ego_entries['acceleration_y'] = tk.Entry(motion_frame, width=10)
+        self.ego_entries['acceleration_y'].grid(row=0, column=3, padx=5)
+        self.ego_entries['acceleration_y'].insert(0, "0.0")
+        
+        tk.Label(motion_frame, text="Yaw Rate (rad/s):").grid(row=1, column=0, sticky="w")
+        self.ego_entries['yaw_rate'] = tk.Entry(motion_frame, width=10)
+        self.ego_entries['yaw_rate'].grid(row=1, column=1, padx=5)
+        self.ego_entries['yaw_rate'].insert(0, "0.0")
+        
+        # Absolute velocity frame
+        abs_vel_frame = ttk.LabelFrame(self.ego_frame, text="Absolute Velocity Over Ground")
+        abs_vel_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        tk.Label(abs_vel_frame, text="Abs Vel X (m/s):").grid(row=0, column=0, sticky="w")
+        self.ego_entries['abs_vel_x'] = tk.Entry(abs_vel_frame, width=10)
+        self.ego_entries['abs_vel_x'].grid(row=0, column=1, padx=5)
+        self.ego_entries['abs_vel_x'].insert(0, "0.5")
+        
+        tk.Label(abs_vel_frame, text="Abs Vel Y (m/s):").grid(row=0, column=2, sticky="w")
+        self.ego_entries['abs_vel_y'] = tk.Entry(abs_vel_frame, width=10)
+        self.ego_entries['abs_vel_y'].grid(row=0, column=3, padx=5)
+        self.ego_entries['abs_vel_y'].insert(0, "3.0")
+        
+        self.derive_abs_vel = tk.BooleanVar(value=False)
+        tk.Checkbutton(abs_vel_frame, text="Derive from object velocity and ego motion", variable=self.derive_abs_vel,
+                       command=self.toggle_derived_abs_vel).grid(row=1, column=0, columnspan=4, sticky="w")
+        
+        # Additional flags frame
+        flags_frame = ttk.LabelFrame(self.ego_frame, text="Additional Flags")
+        flags_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        tk.Label(flags_frame, text="Is MPC3 Used:").grid(row=0, column=0, sticky="w")
+        self.ego_entries['is_mpc3_used'] = tk.BooleanVar(value=False)
+        tk.Checkbutton(flags_frame, variable=self.ego_entries['is_mpc3_used']).grid(row=0, column=1)
+        
+    def create_results_tab(self):
+        """Create results display tab"""
+        self.results_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.results_frame, text="Results")
+        
+        # Results text area
+        self.results_text = scrolledtext.ScrolledText(self.results_frame, height=25, width=80)
+        self.results_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+    def create_batch_tab(self):
+        """Create the paged per-object batch result table"""
+        self.batch_frame = ttk.Frame(self.notebook)
+        self.notebook.add(self.batch_frame, text="Batch Results")
+        
+        # Filter and sort bar
+        filter_frame = ttk.Frame(self.batch_frame)
+        filter_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        tk.Label(filter_frame, text="Check:").pack(side=tk.LEFT)
+        self.batch_check = ttk.Combobox(filter_frame, values=["Any"] + list(CHECK_NAMES), width=45, state="readonly")
+        self.batch_check.set("Any")
+        self.batch_check.pack(side=tk.LEFT, padx=5)
+        
+        tk.Label(filter_frame, text="Result:").pack(side=tk.LEFT)
+        self.batch_hit = ttk.Combobox(filter_frame, values=["Any", "Hit", "Miss"], width=6, state="readonly")
+        self.batch_hit.set("Any")
+        self.batch_hit.pack(side=tk.LEFT, padx=5)
+        
+        tk.Label(filter_frame, text="Object ID:").pack(side=tk.LEFT)
+        self.batch_object_id = tk.Entry(filter_frame, width=8)
+        self.batch_object_id.pack(side=tk.LEFT, padx=5)
+        
+        tk.Label(filter_frame, text="Sort by:").pack(side=tk.LEFT)
+        self.batch_sort = ttk.Combobox(filter_frame, values=list(SORT_KEYS) + list(CHECK_NAMES), width=20, state="readonly")
+        self.batch_sort.set("cycle")
+        self.batch_sort.pack(side=tk.LEFT, padx=5)
+        
+        self.batch_descending = tk.BooleanVar(value=False)
+        tk.Checkbutton(filter_frame, text="Descending", variable=self.batch_descending).pack(side=tk.LEFT)
+        ttk.Button(filter_frame, text="Apply", command=self.apply_batch_view).pack(side=tk.LEFT, padx=5)
+        
+        self.batch_count = tk.Label(filter_frame, text="")
+        self.batch_count.pack(side=tk.LEFT, padx=5)
+        
+        # Table with a scrollbar over the filtered rows rather than over the items
+        table_frame = ttk.Frame(self.batch_frame)
+        table_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        self.batch_tree = ttk.Treeview(table_frame, columns=("cycle", "object_id", "hits"), show="headings",
+                                       height=BATCH_TABLE_ROWS)
+        for column, heading, width in (("cycle", "Cycle", 80), ("object_id", "Object ID", 80), ("hits", "Hit Checks", 900)):
+            self.batch_tree.heading(column, text=heading, command=lambda key=column: self.sort_batch_by(key))
+            self.batch_tree.column(column, width=width, stretch=column == "hits")
+        self.batch_tree.heading("hits", command=lambda: self.sort_batch_by("num_hits"))
+        self.batch_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        
+        self.batch_scrollbar = ttk.Scrollbar(table_frame, orient=tk.VERTICAL, command=self.scroll_batch_table)
+        self.batch_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.batch_tree.bind(sequence, self.on_batch_wheel)
+        
+    def create_control_buttons(self):
+        """Create control buttons"""
+        control_frame = ttk.Frame(self.root)
+        control_frame.pack(fill=tk.X, padx=10, pady=5)
+        
+        # Interactive mode checkbox
+        tk.Checkbutton(control_frame, text="Interactive Input Mode", variable=self.interactive_mode).pack(side=tk.LEFT, padx=5)
+        tk.Checkbutton(control_frame, text="Live Evaluation", variable=self.live_mode,
+                       command=self.schedule_live_evaluation).pack(side=tk.LEFT, padx=5)
+        
+        ttk.Button(control_frame, text="Evaluate Functions", command=self.evaluate_functions).pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="Load Example", command=self.load_example).pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="Save Config", command=self.save_config).pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="Load Config", command=self.load_config).pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="Save to Library", command=self.save_to_library).pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="Open from Library", command=self.open_from_library).pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="Clear Results", command=self.clear_results).pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="Run Batch", command=self.run_batch).pack(side=tk.LEFT, padx=5)
+        ttk.Button(control_frame, text="Cancel Batch", command=self.cancel_batch).pack(side=tk.LEFT, padx=5)
+        self.batch_progress = ttk.Progressbar(control_frame, length=150, maximum=1.0)
+        self.batch_progress.pack(side=tk.LEFT, padx=5)
+        self.batch_status = tk.Label(control_frame, text="")
+        self.batch_status.pack(side=tk.LEFT, padx=5)
+    
+    def bind_live_evaluation(self):
+        """Schedule a live evaluation whenever an entry changes"""
+        for entries in (self.obj_entries, self.sensor_entries, self.ego_entries):
+            for entry in entries.values():
+                if isinstance(entry, tk.Variable):
+                    entry.trace_add("write", self.schedule_live_evaluation)
+                else:
+                    entry.bind("<KeyRelease>", self.schedule_live_evaluation, add="+")
+                    entry.bind("<<ComboboxSelected>>", self.schedule_live_evaluation, add="+")
+    
+    def schedule_live_evaluation(self, *args):
+        """Debounce live evaluation so a burst of keystrokes triggers a single run"""
+        if not self.live_mode.get() or self.interactive_mode.get():
+            return
+        if self.live_job is not None:
+            self.root.after_cancel(self.live_job)
+        self.live_job = self.root.after(LIVE_EVALUATION_DELAY_MS, self.live_evaluate)
+    
+    def live_evaluate(self):
+        """Re-evaluate the edited inputs, silently skipping entries that do not parse yet"""
+        self.live_job = None
+        if self.get_input_values_from_gui(show_errors=False):
+            self.dep_obj_probably_video_ghost = self.is_dep_obj_probably_video_ghost()
+            self.update_results()
+    
+    def get_interactive_input(self, field_name, description, field_type, default_value=None):
+        """Get interactive input for a specific field"""
+        prompt = f"Enter {description}:"
+        if default_value is not None:
+            prompt += f" (default: {default_value})"
+        
+        if field_type == "bool":
+            result = messagebox.askyesno("Interactive Input", prompt)
+            return result
+        elif field_type == "int":
+            while True:
+                try:
+                    value = simpledialog.askstring("Interactive Input", prompt)
+                    if value is None:  # User cancelled
+                        return default_value if default_value is not None else 0
+                    if value == "" and default_value is not None:
+                        return default_value
+                    return int(value)
+                except ValueError:
+                    messagebox.showerror("Error", "Please enter a valid integer.")
+        elif field_type == "float":
+            while True:
+                try:
+                    value = simpledialog.askstring("Interactive Input", prompt)
+                    if value is None:  # User cancelled
+                        return default_value if default_value is not None else 0.0
+                    if value == "" and default_value is not None:
+                        return default_value
+                    return float(value)
+                except ValueError:
+                    messagebox.showerror("Error", "Please enter a valid number.")
+        elif field_type == "str":
+            value = simpledialog.askstring("Interactive Input", prompt)
+            if value is None or value == "":
+                return default_value if default_value is not None else ""
+            return value
+        
+    def get_input_values_interactive(self):
+        """Get all input values through interactive prompts"""
+        try:
+            # Object state
+            self.obj_data.state.x = self.get_interactive_input("pos_x", "Object Position X (m)", "float", 25.0)
+            self.obj_data.state.y = self.get_interactive_input("pos_y", "Object Position Y (m)", "float", 1.5)
+            self.obj_data.state.vx = self.get_interactive_input("vel_x", "Object Velocity X (m/s)", "float", 0.5)
+            self.obj_data.state.vy = self.get_interactive_input("vel_y", "Object Velocity Y (m/s)", "float", 3.0)
+            
+            # Object properties
+            self.obj_data.is_object_vru = self.get_interactive_input("is_vru", "Is Object VRU?", "bool", True)
+            self.obj_data.rcs = self.get_interactive_input("rcs", "RCS (dBm²)", "float", -8.0)
+            self.obj_data.num_cycles_existing = self.get_interactive_input("num_cycles", "Number of Cycles Existing", "int", 8)
+            self.obj_data.filter_type = self.get_interactive_input("filter_type", "Filter Type (LA/WNJ/KF)", "str", "LA")
+            
+            # Probabilities
+            self.obj_data.prob_has_been_observed_moving = self.get_interactive_input("prob_has_been_moving", "Probability Has Been Observed Moving (0-1)", "float", 0.3)
+            self.obj_data.prob_is_currently_moving = self.get_interactive_input("prob_currently_moving", "Probability Is Currently Moving (0-1)", "float", 0.2)
+            
+            # Elevation
+            self.obj_data.elevation = self.get_interactive_input("elevation", "Elevation (m)", "float", 0.0)
+            self.obj_data.elevation_is_valid = self.get_interactive_input("elevation_valid", "Is Elevation Valid?", "bool", True)
+            
+            # Innovation
+            self.obj_data.avg_dx_innovation = self.get_interactive_input("avg_dx_innovation", "Average DX Innovation", "float", 0.5)
+            self.obj_data.radar_based_innovation[0] = self.get_interactive_input("radar_innovation_dr", "Radar Innovation DR", "float", 0.0)
+            self.obj_data.radar_based_innovation[1] = self.get_interactive_input("radar_innovation_alpha", "Radar Innovation Alpha", "float", 0.0)
+            self.obj_data.video_based_innovation[0] = self.get_interactive_input("video_innovation_dr", "Video Innovation DR", "float", 0.0)
+            self.obj_data.video_based_innovation[1] = self.get_interactive_input("video_innovation_alpha", "Video Innovation Alpha", "float", 0.0)
+            
+            # Micro doppler
+            self.obj_data.number_micro_doppler_cycles = self.get_interactive_input("micro_doppler_cycles", "Number of Micro Doppler Cycles", "int", 0)
+            self.obj_data.expected_vr_high_enough_for_mu_doppler_counter = self.get_interactive_input("expected_vr_counter", "Expected VR High Enough Counter", "int", 5)
+            
+            # Sensor data
+            self.obj_data.sensor_filter_fus_helper.total_num_radar_updates = self.get_interactive_input("total_radar_updates", "Total Number of Radar Updates", "int", 5)
+            self.obj_data.sensor_filter_fus_helper.total_num_video_updates = self.get_interactive_input("total_video_updates", "Total Number of Video Updates", "int", 3)
+            self.obj_data.sensor_filter_fus_helper.total_num_front_center_location_radar_updates = self.get_interactive_input("fc_location_radar_updates", "Front Center Location Radar Updates", "int", 5)
+            self.obj_data.sensor_filter_fus_helper.total_num_front_left_corner_updates = self.get_interactive_input("fl_corner_updates", "Front Left Corner Updates", "int", 0)
+            self.obj_data.sensor_filter_fus_helper.total_num_front_right_corner_updates = self.get_interactive_input("fr_corner_updates", "Front Right Corner Updates", "int", 0)
+            self.obj_data.sensor_filter_fus_helper.updates_since_last_video_update = self.get_interactive_input("since_last_video", "Updates Since Last Video", "int", 2)
+            self.obj_data.sensor_filter_fus_helper.updates_since_last_radar_update = self.get_interactive_input("since_last_radar", "Updates Since Last Radar", "int", 0)
+            self.obj_data.sensor_filter_fus_helper.is_good_quality_fused_object = self.get_interactive_input("good_quality_fused", "Is Good Quality Fused Object?", "bool", True)
+            self.obj_data.sensor_filter_fus_helper.is_trustworthy_object = self.get_interactive_input("trustworthy_object", "Is Trustworthy Object?", "bool", True)
+            
+            # Ego data
+            self.ego_data.velocity_x = self.get_interactive_input("velocity_x", "Ego Velocity X (m/s)", "float", 13.9)
+            self.ego_data.acceleration_y = self.get_interactive_input("acceleration_y", "Ego Acceleration Y (m/s²)", "float", 0.0)
+            self.ego_data.yaw_rate = self.get_interactive_input("yaw_rate", "Ego Yaw Rate (rad/s)", "float", 0.0)
+            
+            # Absolute velocity over ground
+            if self.derive_abs_vel.get():
+                self.abs_vel_over_ground = list(calc_abs_vel_over_ground(self.obj_data.state, self.ego_data))
+            else:
+                self.abs_vel_over_ground[0] = self.get_interactive_input("abs_vel_x", "Absolute Velocity X (m/s)", "float", 0.5)
+                self.abs_vel_over_ground[1] = self.get_interactive_input("abs_vel_y", "Absolute Velocity Y (m/s)", "float", 3.0)
+            
+            # Additional flags
+            self.is_mpc3_used = self.get_interactive_input("is_mpc3_used", "Is MPC3 Used?", "bool", False)
+            
+            # Set some default values for fields not commonly used
+            self.obj_data.total_num_cycles_with_oncoming_locations = 0
+            self.obj_data.vy_unreliable_accumulated = 0.0
+            self.obj_data.video_inv_ttc = 0.0
+            self.obj_data.is_suppressed_until_next_video_update = False
+            self.obj_data.is_suppressed_due_to_video_otc_post_processing = False
+            self.obj_data.is_updated_with_stat_loc_with_high_mdoppler_with_outgoing_vr = False
+            
+            return True
+        except Exception as e:
+            messagebox.showerror("Input Error", f"Error getting interactive input: {e}")
+            return False
+        
+    def get_input_values(self):
+        """Extract all input values from GUI or interactive input"""
+        if self.interactive_mode.get():
+            return self.get_input_values_interactive()
+        else:
+            return self.get_input_values_from_gui()
+    
+    def read_entry_values(self):
+        """Raw value of every GUI entry keyed by entry name"""
+        values = {}
+        for entries in (self.obj_entries, self.sensor_entries, self.ego_entries):
+            for name, entry in entries.items():
+                values[name] = entry.get()
+        return values
+    
+    def get_input_values_from_gui(self, show_errors=True):
+        """Extract all input values from GUI"""
+        try:
+            # Object state
+            self.obj_data.state.x = float(self.obj_entries['pos_x'].get())
+            self.obj_data.state.y = float(self.obj_entries['pos_y'].get())
+            self.obj_data.state.vx = float(self.obj_entries['vel_x'].get())
+            self.obj_data.state.vy = float(self.obj_entries['vel_y'].get())
+            
+            # Object properties
+            self.obj_data.is_object_vru = self.obj_entries['is_vru'].get()
+            self.obj_data.rcs = float(self.obj_entries['rcs'].get())
+            self.obj_data.num_cycles_existing = int(self.obj_entries['num_cycles'].get())
+            self.obj_data.filter_type = self.obj_entries['filter_type'].get()
+            
+            # Probabilities
+            self.obj_data.prob_has_been_observed_moving = float(self.obj_entries['prob_has_been_moving'].get())
+            self.obj_data.prob_is_currently_moving = float(self.obj_entries['prob_currently_moving'].get())
+            
+            # Elevation
+            self.obj_data.elevation = float(self.obj_entries['elevation'].get())
+            self.obj_data.elevation_is_valid = self.obj_entries['elevation_valid'].get()
+            
+            # Innovation
+            self.obj_data.avg_dx_innovation = float(self.obj_entries['avg_dx_innovation'].get())
+            self.obj_data.radar_based_innovation[0] = float(self.obj_entries['radar_innovation_dr'].get())
+            self.obj_data.radar_based_innovation[1] = float(self.obj_entries['radar_innovation_alpha'].get())
+            self.obj_data.video_based_innovation[0] = float(self.obj_entries['video_innovation_dr'].get())
+            self.obj_data.video_based_innovation[1] = float(self.obj_entries['video_innovation_alpha'].get())
+            
+            # Micro doppler
+            self.obj_data.number_micro_doppler_cycles = int(self.obj_entries['micro_doppler_cycles'].get())
+            self.obj_data.expected_vr_high_enough_for_mu_doppler_counter = int(self.obj_entries['expected_vr_counter'].get())
+            
+            # Sensor data
+            self.obj_data.sensor_filter_fus_helper.total_num_radar_updates = int(self.sensor_entries['total_radar_updates'].get())
+            self.obj_data.sensor_filter_fus_helper.total_num_video_updates = int(self.sensor_entries['total_video_updates'].get())
+            self.obj_data.sensor_filter_fus_helper.total_num_front_center_location_radar_updates = int(self.sensor_entries['fc_location_radar_updates'].get())
+            self.obj_data.sensor_filter_fus_helper.total_num_front_left_corner_updates = int(self.sensor_entries['fl_corner_updates'].get())
+            self.obj_data.sensor_filter_fus_helper.total_num_front_right_corner_updates = int(self.sensor_entries['fr_corner_updates'].get())
+            self.obj_data.sensor_filter_fus_helper.updates_since_last_video_update = int(self.sensor_entries['since_last_video'].get())
+            self.obj_data.sensor_filter_fus_helper.updates_since_last_radar_update = int(self.sensor_entries['since_last_radar'].get())
+            self.obj_data.sensor_filter_fus_helper.is_good_quality_fused_object = self.sensor_entries['good_quality_fused'].get()
+            self.obj_data.sensor_filter_fus_helper.is_trustworthy_object = self.sensor_entries['trustworthy_object'].get()
+            
+            # Ego data
+            self.ego_data.velocity_x = float(self.ego_entries['velocity_x'].get())
+            self.ego_data.acceleration_y = float(self.ego_entries['acceleration_y'].get())
+            self.ego_data.yaw_rate = float(self.ego_entries['yaw_rate'].get())
+            
+            # Absolute velocity over ground
+            if self.derive_abs_vel.get():
+                self.abs_vel_over_ground = list(calc_abs_vel_over_ground(self.obj_data.state, self.ego_data))
+                self.show_derived_abs_vel()
+            else:
+                self.abs_vel_over_ground[0] = float(self.ego_entries['abs_vel_x'].get())
+                self.abs_vel_over_ground[1] = float(self.ego_entries['abs_vel_y'].get())
+            
+            # Additional flags
+            self.is_mpc3_used = self.ego_entries['is_mpc3_used'].get()
+            
+            # Fields not exposed in GUI keep their defaults or the values of the last loaded scenario
+            
+            return True
+        except ValueError as e:
+            if show_errors:
+                messagebox.showerror("Input Error", f"Invalid input value: {e}")
+            return False
+            
+    def toggle_derived_abs_vel(self):
+        """Lock the velocity over ground entries while they are derived, and show the derived values"""
+        state = "readonly" if self.derive_abs_vel.get() else "normal"
+        for name in ('abs_vel_x', 'abs_vel_y'):
+            self.ego_entries[name].configure(state=state)
+        self.schedule_live_evaluation()
+        
+    def show_derived_abs_vel(self):
+        """Write the derived velocity over ground into its read-only entries"""
+        for name, value in zip(('abs_vel_x', 'abs_vel_y'), self.abs_vel_over_ground):
+            entry = self.ego_entries[name]
+            text = f"{value:.6g}"
+            if entry.get() != text:
+                entry.configure(state="normal")
+                entry.delete(0, tk.END)
+                entry.insert(0, text)
+                entry.configure(state="readonly")
+            
+    def is_negative(self, value):
+        """Helper function to check if value is negative"""
+        return is_negative(value)
+        
+    def is_moving_towards_ego_lane(self, dy_obj, vy_obj_rel, vy_obj_over_ground):
+        """Function 3: isMovingTowardsEgoLane"""
+        return is_moving_towards_ego_lane(dy_obj, vy_obj_rel, vy_obj_over_ground)
+        
+    def is_dep_obj_probably_video_ghost(self):
+        """Function 4: isDepObjProbablyVideoGhost"""
+        return is_dep_obj_probably_video_ghost(self.obj_data)
+        
+    def evaluate_functions(self):
+        """Evaluate all functions and display results"""
+        if not self.get_input_values():
+            return
+            
+        # Pre-calculate common values
+        self.dep_obj_probably_video_ghost = self.is_dep_obj_probably_video_ghost()
+        
+        if self.interactive_mode.get():
+            self.last_entry_values = None
+            self.show_results(evaluate_object(self.obj_data, self.ego_data, self.params, self.abs_vel_over_ground))
+        else:
+            self.update_results()
+        
+    def update_results(self):
+        """Re-run only the checks reading an entry changed since the last evaluation and update their lines"""
+        entry_values = self.read_entry_values()
+        if (self.last_results is None or self.last_entry_values is None or self.last_params != self.params
+                or not self.results_text.tag_ranges("summary")):
+            self.show_results(evaluate_object(self.obj_data, self.ego_data, self.params, self.abs_vel_over_ground))
+        else:
+            changed = {ENTRY_COLUMNS[name] for name, value in entry_values.items()
+                       if name in ENTRY_COLUMNS and value != self.last_entry_values[name]}
+            results = list(self.last_results)
+            for index in dependent_checks(changed):
+                results[index] = CHECKS[index](self.obj_data, self.ego_data, self.params, self.abs_vel_over_ground)
+            self.refresh_results(results)
+        self.last_entry_values = entry_values
+        self.last_params = copy.deepcopy(self.params)
+        
+    def format_inputs(self):
+        """Input summary block shown above the function results"""
+        return (f"Object Type: {'VRU' if self.obj_data.is_object_vru else 'Non-VRU'}\n"
+                f"Position: ({self.obj_data.state.x:.2f}, {self.obj_data.state.y:.2f}) m\n"
+                f"Velocity: ({self.obj_data.state.vx:.2f}, {self.obj_data.state.vy:.2f}) m/s\n"
+                f"Abs Vel Over Ground: ({self.abs_vel_over_ground[0]:.2f}, {self.abs_vel_over_ground[1]:.2f}) m/s\n"
+                f"RCS: {self.obj_data.rcs:.2f} dBm²\n"
+                f"Age: {self.obj_data.num_cycles_existing} cycles\n\n")
+        
+    def show_results(self, results):
+        """Redraw the whole results display, tagging every block that incremental updates rewrite"""
+        self.clear_results()
+        
+        # Display input mode
+        input_mode = "Interactive Input Mode" if self.interactive_mode.get() else "GUI Input Mode"
+        self.results_text.insert(tk.END, f"=== AUTOMOTIVE PERCEPTION FUNCTION EVALUATION RESULTS ({input_mode}) ===\n\n")
+        self.results_text.insert(tk.END, self.format_inputs(), "inputs")
+        
+        active_count = sum(result.hit for result in results)
+        self.results_text.insert(tk.END, f"ACTIVE FUNCTIONS ({active_count}):\n", "active_count")
+        self.results_text.insert(tk.END, "=" * 50 + "\n")
+        for index, result in enumerate(results):
+            if result.hit:
+                self.results_text.insert(tk.END, result.format() + "\n", f"check_{index}")
+        # Tagged separators anchor lines moved to the end of a section
+        self.results_text.insert(tk.END, "\n", "active_end")
+            
+        self.results_text.insert(tk.END, f"INACTIVE FUNCTIONS ({len(results) - active_count}):\n", "inactive_count")
+        self.results_text.insert(tk.END, "=" * 50 + "\n")
+        for index, result in enumerate(results):
+            if not result.hit:
+                self.results_text.insert(tk.END, result.format() + "\n", f"check_{index}")
+        self.results_text.insert(tk.END, "\n", "inactive_end")
+            
+        self.results_text.insert(tk.END, self.format_summary(results), "summary")
+        self.last_results = results
+        
+    def format_summary(self, results):
+        """Summary and function relevance lines"""
+        active_count = sum(result.hit for result in results)
+        disqualified = disqualified_functions(pack_hits([r.hit for r in results]))
+        return (f"SUMMARY: {active_count} out of {len(results)} functions would execute their main logic.\n"
+                f"Function relevance: disqualified for {', '.join(disqualified) if disqualified else 'none'}\n")
+        
+    def replace_tagged(self, tag, chars):
+        """Replace the text carrying tag, leaving the display untouched when it is unchanged"""
+        start, end = self.results_text.tag_ranges(tag)[:2]
+        if self.results_text.get(start, end) != chars:
+            self.results_text.delete(start, end)
+            self.results_text.insert(start, chars, tag)
+        
+    def refresh_results(self, results):
+        """Rewrite only the result lines that differ from the displayed results"""
+        placed = [result.hit for result in self.last_results]
+        for index, (old, new) in enumerate(zip(self.last_results, results)):
+            if old == new:
+                continue
+            line = new.format() + "\n"
+            if old.hit == new.hit:
+                self.replace_tagged(f"check_{index}", line)
+                continue
+            # Move the line to the other section, keeping check order within it
+            self.results_text.delete(*self.results_text.tag_ranges(f"check_{index}")[:2])
+            anchor = "active_end" if new.hit else "inactive_end"
+            for later in range(index + 1, len(results)):
+                if placed[later] == new.hit:
+                    anchor = f"check_{later}"
+                    break
+            self.results_text.insert(self.results_text.tag_ranges(anchor)[0], line, f"check_{index}")
+            placed[index] = new.hit
+        
+        active_count = sum(result.hit for result in results)
+        self.replace_tagged("inputs", self.format_inputs())
+        self.replace_tagged("active_count", f"ACTIVE FUNCTIONS ({active_count}):\n")
+        self.replace_tagged("inactive_count", f"INACTIVE FUNCTIONS ({len(results) - active_count}):\n")
+        self.replace_tagged("summary", self.format_summary(results))
+        self.last_results = results
+        
+    def load_example(self):
+        """Load a predefined example scenario"""
+        # Fast crossing pedestrian example
+        self.obj_entries['pos_x'].delete(0, tk.END)
+        self.obj_entries['pos_x'].insert(0, "25.0")
+        self.obj_entries['pos_y'].delete(0, tk.END)
+        self.obj_entries['pos_y'].insert(0, "1.5")
+        self.obj_entries['vel_x'].delete(0, tk.END)
+        self.obj_entries['vel_x'].insert(0, "0.5")
+        self.obj_entries['vel_y'].delete(0, tk.END)
+        self.obj_entries['vel_y'].insert(0, "3.0")
+        
+        self.obj_entries['is_vru'].set(True)
+        self.obj_entries['rcs'].delete(0, tk.END)
+        self.obj_entries['rcs'].insert(0, "-8.0")
+        self.obj_entries['num_cycles'].delete(0, tk.END)
+        self.obj_entries['num_cycles'].insert(0, "8")
+        
+        self.obj_entries['prob_has_been_moving'].delete(0, tk.END)
+        self.obj_entries['prob_has_been_moving'].insert(0, "0.3")
+        self.obj_entries['prob_currently_moving'].delete(0, tk.END)
+        self.obj_entries['prob_currently_moving'].insert(0, "0.2")
+        
+        self.obj_entries['micro_doppler_cycles'].delete(0, tk.END)
+        self.obj_entries['micro_doppler_cycles'].insert(0, "0")
+        self.obj_entries['expected_vr_counter'].delete(0, tk.END)
+        self.obj_entries['expected_vr_counter'].insert(0, "5")
+        
+        self.derive_abs_vel.set(False)
+        self.toggle_derived_abs_vel()
+        self.ego_entries['abs_vel_x'].delete(0, tk.END)
+        self.ego_entries['abs_vel_x'].insert(0, "0.5")
+        self.ego_entries['abs_vel_y'].delete(0, tk.END)
+        self.ego_entries['abs_vel_y'].insert(0, "3.0")
+        
+        self.schedule_live_evaluation()
+        messagebox.showinfo("Example Loaded", "Fast crossing pedestrian example loaded!")
+        
+    def current_scenario(self, name):
+        """Snapshot of the evaluated inputs and parameters as a scenario"""
+        return Scenario(name, copy.deepcopy(self.obj_data), copy.deepcopy(self.ego_data),
+                        list(self.abs_vel_over_ground), copy.deepcopy(self.params), self.is_mpc3_used)
+        
+    def set_entry(self, name, value):
+        """Show a value in the entry, checkbox or combobox of an input field"""
+        for entries in (self.obj_entries, self.sensor_entries, self.ego_entries):
+            if name in entries:
+                entry = entries[name]
+                if isinstance(entry, tk.Variable):
+                    entry.set(bool(value))
+                elif isinstance(entry, ttk.Combobox):
+                    entry.set(value)
+                else:
+                    entry.delete(0, tk.END)
+                    entry.insert(0, str(value))
+                return
+        
+    def apply_scenario(self, scenario):
+        """Load every field of a scenario, including the ones without an entry, and show it in the GUI"""
+        self.obj_data = copy.deepcopy(scenario.object_data)
+        self.ego_data = copy.deepcopy(scenario.ego_data)
+        self.params = copy.deepcopy(scenario.params)
+        self.abs_vel_over_ground = list(scenario.abs_vel_over_ground)
+        self.is_mpc3_used = scenario.is_mpc3_used
+        # The scenario's velocity over ground is taken as recorded
+        self.derive_abs_vel.set(False)
+        self.toggle_derived_abs_vel()
+        row = object_to_row(self.obj_data, self.ego_data, self.abs_vel_over_ground)
+        for name, column in ENTRY_COLUMNS.items():
+            value = row[column]
+            self.set_entry(name, decode_category(column, value) if column in CATEGORIES else value)
+        self.set_entry('is_mpc3_used', self.is_mpc3_used)
+        # Fields without an entry changed as well, so the next evaluation runs every check
+        self.last_entry_values = None
+        self.schedule_live_evaluation()
+        
+    def save_config(self):
+        """Save current configuration to file"""
+        if not self.get_input_values():
+            return
+        path = filedialog.asksaveasfilename(title="Save configuration", initialfile=DEFAULT_CONFIG_FILE,
+                                            defaultextension=".json", filetypes=[("JSON", "*.json")])
+        if not path:
+            return
+        
+        try:
+            with open(path, 'w') as f:
+                json.dump(self.current_scenario(os.path.splitext(os.path.basename(path))[0]).to_dict(), f, indent=2)
+            messagebox.showinfo("Success", f"Configuration saved to {path}")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save configuration: {e}")
+            
+    def load_config(self):
+        """Load configuration from file"""
+        path = filedialog.askopenfilename(title="Load configuration", initialfile=DEFAULT_CONFIG_FILE,
+                                          filetypes=[("JSON", "*.json"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            with open(path, 'r') as f:
+                scenario = Scenario.from_dict(json.load(f))
+            self.apply_scenario(scenario)
+            messagebox.showinfo("Success", f"Configuration loaded from {path}")
+        except FileNotFoundError:
+            messagebox.showerror("Error", "Configuration file not found")
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to load configuration: {e}")
+            
+    def get_library(self):
+        """The open scenario library, asking for its directory on first use"""
+        if self.library is None:
+            path = filedialog.askdirectory(title="Select scenario library directory")
+            if not path:
+                return None
+            try:
+                self.library = ScenarioLibrary(path)
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to open scenario library: {e}")
+        return self.library
+        
+    def save_to_library(self):
+        """Store the current inputs and parameters as a tagged scenario in the library"""
+        if not self.get_input_values():
+            return
+        library = self.get_library()
+        if library is None:
+            return
+        name = simpledialog.askstring("Save to Library", "Scenario name:")
+        if not name:
+            return
+        tags = simpledialog.askstring("Save to Library", "Tags (comma separated, optional):") or ""
+        scenario = self.current_scenario(name)
+        scenario.tags = [tag.strip() for tag in tags.split(",") if tag.strip()]
+        try:
+            scenario_id = library.add(scenario)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to save scenario: {e}")
+            return
+        messagebox.showinfo("Success", f"Scenario saved as {scenario_id} (tags: {', '.join(library.entries[scenario_id].tags)})")
+        
+    def open_from_library(self):
+        """Query the library by tags and check hits and load one of the matching scenarios"""
+        library = self.get_library()
+        if library is None:
+            return
+        query = simpledialog.askstring(
+            "Open from Library",
+            "Tags and check names separated by spaces (prefix a check with ! for a miss, empty for all):")
+        if query is None:
+            return
+        tags, hits, misses = [], [], []
+        for token in query.split():
+            if token.startswith("!") and token[1:] in CHECK_NAMES:
+                misses.append(token[1:])
+            elif token in CHECK_NAMES:
+                hits.append(token)
+            else:
+                tags.append(token)
+        scenario_ids = library.query(tags, hits, misses)
+        if not scenario_ids:
+            messagebox.showinfo("Open from Library", "No matching scenarios")
+            return
+        
+        dialog = tk.Toplevel(self.root)
+        dialog.title(f"{len(scenario_ids)} matching scenarios")
+        listbox = tk.Listbox(dialog, width=100, height=20)
+        listbox.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        for scenario_id in scenario_ids:
+            entry = library.entries[scenario_id]
+            listbox.insert(tk.END, f"{scenario_id} - {entry.name} [{', '.join(entry.tags)}]")
+        
+        def load_selected(*args):
+            selection = listbox.curselection()
+            if not selection:
+                return
+            try:
+                self.apply_scenario(library.load(scenario_ids[selection[0]]))
+            except Exception as e:
+                messagebox.showerror("Error", f"Failed to load scenario: {e}")
+                return
+            dialog.destroy()
+        
+        listbox.bind("<Double-Button-1>", load_selected)
+        ttk.Button(dialog, text="Load", command=load_selected).pack(pady=5)
+        
+    def run_batch(self):
+        """Evaluate a recording in a worker process pool, reporting progress without blocking the GUI"""
+        if self.batch_job is not None:
+            messagebox.showinfo("Batch Running", "A batch evaluation is already running")
+            return
+        path = filedialog.askopenfilename(
+            title="Select recording",
+            filetypes=[("Recordings", "*.jsonl *.csv"), ("Columnar recording manifest", "manifest.json"),
+                       ("All files", "*.*")])
+        if not path:
+            return
+        # Columnar recordings are directories, selected through their manifest
+        if os.path.basename(path) == "manifest.json":
+            path = os.path.dirname(path)
+        try:
+            self.batch_job = CampaignJob([path], self.params, cycles_per_shard=BATCH_CYCLES_PER_SHARD,
+                                         collect_results=True)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to start batch evaluation: {e}")
+            return
+        self.batch_path = path
+        self.batch_progress["value"] = 0.0
+        self.batch_status.config(text="Running...")
+        self.root.after(BATCH_POLL_INTERVAL_MS, self.poll_batch)
+        
+    def poll_batch(self):
+        """Show the statistics of the shards finished so far and reschedule until the batch is done"""
+        job = self.batch_job
+        if job is None:
+            return
+        result = job.poll()
+        self.batch_progress["value"] = job.progress
+        self.show_batch_results(result.total)
+        if not job.done:
+            self.root.after(BATCH_POLL_INTERVAL_MS, self.poll_batch)
+            return
+        self.batch_job = None
+        self.batch_table = job.result_table()
+        self.apply_batch_view()
+        if job.error is not None:
+            self.batch_status.config(text="Failed")
+            messagebox.showerror("Error", f"Batch evaluation failed: {job.error}")
+        else:
+            self.batch_status.config(text="Cancelled" if job.cancelled else "Finished")
+        
+    def cancel_batch(self):
+        """Abort the running batch evaluation, keeping the statistics gathered so far"""
+        if self.batch_job is not None:
+            self.batch_job.cancel()
+            self.batch_status.config(text="Cancelling...")
+        
+    def show_batch_results(self, stats):
+        """Display aggregated batch statistics"""
+        self.clear_results()
+        self.results_text.insert(tk.END, f"=== BATCH EVALUATION RESULTS ({self.batch_path}) ===\n\n")
+        self.results_text.insert(tk.END, f"Cycles: {stats.num_cycles}\n")
+        self.results_text.insert(tk.END, f"Objects: {stats.num_objects}\n\n")
+        self.results_text.insert(tk.END, "HIT COUNTS:\n")
+        self.results_text.insert(tk.END, "=" * 50 + "\n")
+        hit_rates = stats.hit_rates()
+        for name, count in zip(hit_rates, stats.hit_counts):
+            self.results_text.insert(tk.END, f"{name}: {count} ({hit_rates[name]:.1%})\n")
+        
+    def apply_batch_view(self):
+        """Filter and sort the batch result rows and show the first page"""
+        check = self.batch_check.get()
+        hit = self.batch_hit.get()
+        object_id = self.batch_object_id.get().strip()
+        try:
+            rows = self.batch_table.select(
+                check=CHECK_NAMES.index(check) if check in CHECK_NAMES else None,
+                hit={"Hit": True, "Miss": False}.get(hit),
+                object_id=int(object_id) if object_id else None)
+        except ValueError as e:
+            messagebox.showerror("Input Error", f"Invalid object ID: {e}")
+            return
+        self.batch_rows = self.batch_table.sort(rows, self.batch_sort.get(), self.batch_descending.get())
+        self.batch_count.config(text=f"{len(self.batch_rows)} of {len(self.batch_table)} objects")
+        self.show_batch_page(0)
+        
+    def sort_batch_by(self, key):
+        """Sort by a column heading, toggling the direction when it is already the sort key"""
+        if self.batch_sort.get() == key:
+            self.batch_descending.set(not self.batch_descending.get())
+        else:
+            self.batch_sort.set(key)
+            self.batch_descending.set(False)
+        self.apply_batch_view()
+        
+    def show_batch_page(self, offset):
+        """Fill the table items with the rows starting at offset"""
+        offset = max(0, min(offset, len(self.batch_rows) - BATCH_TABLE_ROWS))
+        self.batch_offset = offset
+        self.batch_tree.delete(*self.batch_tree.get_children())
+        for cycle, object_id, hits in self.batch_table.page(self.batch_rows, offset, BATCH_TABLE_ROWS):
+            self.batch_tree.insert("", tk.END, values=(cycle, object_id, ", ".join(hits) or "-"))
+        total = len(self.batch_rows)
+        if total:
+            self.batch_scrollbar.set(offset / total, min(offset + BATCH_TABLE_ROWS, total) / total)
+        else:
+            self.batch_scrollbar.set(0.0, 1.0)
+        
+    def scroll_batch_table(self, action, amount, unit=None):
+        """Scrollbar command moving the visible window over the filtered rows"""
+        if action == "moveto":
+            self.show_batch_page(int(float(amount) * len(self.batch_rows)))
+        else:
+            step = BATCH_TABLE_ROWS if unit == "pages" else 1
+            self.show_batch_page(self.batch_offset + int(amount) * step)
+        
+    def on_batch_wheel(self, event):
+        """Scroll the batch table by three rows per wheel step"""
+        if event.num == 4 or event.delta > 0:
+            self.show_batch_page(self.batch_offset - 3)
+        else:
+            self.show_batch_page(self.batch_offset + 3)
+        return "break"
+        
+    def clear_results(self):
+        """Clear the results display"""
+        self.results_text.delete(1.0, tk.END)
+        self.last_results = None
+        
+    def run(self):
+        """Run the application"""
+        self.root.mainloop()
+        if self.batch_job is not None:
+            self.batch_job.cancel()
+
+if __name__ == "__main__":
+    app = AutomotivePerceptionEmulator()
+    app.run()
\ No newline at end of file
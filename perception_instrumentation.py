@@ -0,0 +1,114 @@
+"""
+Opt-in instrumentation of the check evaluation.
+
+While a ``CheckInstrumentation`` is installed (``instrumented()`` or
+``perception_engine.set_instrumentation``), ``evaluate_object`` and
+``evaluate_batch`` route through it and it records per check:
+
+* number of evaluations and hits
+* cumulative evaluation time
+* for every miss, the first term of the check's rule (``perception_rules``)
+  that did not hold, e.g. which of the applyMicroDopplerCheck preconditions
+  rejected the object
+
+With no instrumentation installed the engine only pays one ``is None`` test
+per call. Instrumentation is per process; statistics of worker processes can
+be combined with ``merge``.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from perception_batch import ObjectBatch
+from perception_engine import (
+    CHECKS,
+    CHECK_NAMES,
+    CheckResult,
+    EgoVehicleData,
+    ObjectData,
+    Parameters,
+    set_instrumentation,
+)
+from perception_rules import RULES, CompiledRuleSet, Rule
+
+class CheckInstrumentation:
+    """Per-check evaluation counts, hit counts, timings and first-failing-term histograms"""
+
+    def __init__(self, rules: Sequence[Rule] = RULES):
+        self.rules = CompiledRuleSet(rules)
+        self.evaluations = [0] * len(CHECK_NAMES)
+        self.hits = [0] * len(CHECK_NAMES)
+        self.seconds = [0.0] * len(CHECK_NAMES)
+        self.first_failures: List[Dict[str, int]] = [{} for _ in CHECK_NAMES]
+
+    def _record_miss(self, check_index: int, term_name: str, count: int = 1):
+        failures = self.first_failures[check_index]
+        failures[term_name] = failures.get(term_name, 0) + count
+
+    def evaluate_object(self, obj: ObjectData, ego: EgoVehicleData, params: Parameters,
+                        abs_vel_over_ground: Sequence[float]) -> List[CheckResult]:
+        """Evaluate all checks for a single object, recording every check"""
+        results = []
+        for check_index, check in enumerate(CHECKS):
+            start = time.perf_counter()
+            result = check(obj, ego, params, abs_vel_over_ground)
+            self.seconds[check_index] += time.perf_counter() - start
+            self.evaluations[check_index] += 1
+            if result.hit:
+                self.hits[check_index] += 1
+            else:
+                term_name = self.rules.first_failing_term(check_index, obj, ego, params, abs_vel_over_ground)
+                self._record_miss(check_index, term_name or "unknown")
+            results.append(result)
+        return results
+
+    def evaluate_batch(self, batch: ObjectBatch, params: Parameters) -> np.ndarray:
+        """Evaluate all checks over a batch rule by rule, recording every check"""
+        hits = np.zeros((len(batch), len(CHECK_NAMES)), dtype=bool)
+        for check_index in range(len(CHECK_NAMES)):
+            start = time.perf_counter()
+            survivors = self.rules.survivors(check_index, batch, params, self.first_failures[check_index])
+            self.seconds[check_index] += time.perf_counter() - start
+            self.evaluations[check_index] += len(batch)
+            self.hits[check_index] += len(survivors)
+            hits[survivors, check_index] = True
+        return hits
+
+    def merge(self, other: "CheckInstrumentation"):
+        """Add the statistics of another instrumentation"""
+        for check_index in range(len(CHECK_NAMES)):
+            self.evaluations[check_index] += other.evaluations[check_index]
+            self.hits[check_index] += other.hits[check_index]
+            self.seconds[check_index] += other.seconds[check_index]
+            for term_name, count in other.first_failures[check_index].items():
+                self._record_miss(check_index, term_name, count)
+
+    def reset(self):
+        """Discard all recorded statistics"""
+        self.__init__(self.rules.rules)
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Statistics per check name; first failures sorted by count"""
+        return {
+            name: {
+                "evaluations": self.evaluations[check_index],
+                "hits": self.hits[check_index],
+                "seconds": self.seconds[check_index],
+                "first_failures": dict(sorted(self.first_failures[check_index].items(),
+                                              key=lambda item: item[1], reverse=True)),
+            }
+            for check_index, name in enumerate(CHECK_NAMES)
+        }
+
+@contextmanager
+def instrumented(instrumentation: Optional[CheckInstrumentation] = None) -> Iterator[CheckInstrumentation]:
+    """Install an instrumentation for the duration of a with block"""
+    instrumentation = instrumentation or CheckInstrumentation()
+    previous = set_instrumentation(instrumentation)
+    try:
+        yield instrumentation
+    finally:
+        set_instrumentation(previous)
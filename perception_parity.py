@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+"""
+Differential parity harness against the C++ checks of ``inputFile.cpp``.
+
+The ``Dc::Per::Dep`` functions behind ``CHECK_NAMES`` are extracted from
+``inputFile.cpp`` by name and compiled together with minimal stand-ins for
+their vfc / DepObject / parameter dependencies (``parity/stubs``) and the
+C entry point ``parity_evaluate`` (``parity/parity_shim.cpp``) into a shared
+library. The shim runs every check with a fresh all-relevant function
+relevance bitfield and packs the outcome like ``pack_hit_matrix``; the
+relevance bits are the ones the C++ actually cleared, so ``CHECK_RELEVANCE``
+is verified as well.
+
+Inputs are exchanged as float32 / int32 records. Float columns are rounded
+to float32 before both sides evaluate them, and ``video_inv_ttc == inf``
+(the Python stand-in for ``FLT_MAX``) is passed to C++ as ``FLT_MAX``. The
+C++ update counters are uint8, so counters above 255 are outside the domain
+the two sides can agree on.
+
+With ``--float32`` the inputs are passed unrounded and the Python side is the
+float32-faithful evaluation (``evaluate_batch(..., float32=True)``);
+``--near-thresholds`` adds objects whose float columns sit within a few
+double ulps of the check thresholds, where double and float32 evaluation
+disagree. ``--degenerate-limits`` adds random objects evaluated with equal
+and with reversed elevation dx limits (``degenerate_limit_variants``).
+
+Usage: python perception_parity.py [--random N] [--near-thresholds N] [--degenerate-limits N]
+                                   [--float32] [--recording PATH ...] [--params FILE]
+
+Prints a JSON report of per-bit mismatch counts and sample rows; the exit
+status is 1 if any bit differs. Requires NumPy and a C++17 compiler.
+"""
+
+import argparse
+import ctypes
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from perception_batch import FILTER_TYPES, ObjectBatch, evaluate_batch_bits
+from perception_engine import (
+    CHECK_NAMES,
+    RELEVANCE_BIT_NAMES,
+    Parameters,
+    params_from_dict,
+)
+from perception_replay import read_cycles
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CPP_SOURCE = os.path.join(ROOT, "inputFile.cpp")
+PARITY_DIR = os.path.join(ROOT, "parity")
+STUB_DIR = os.path.join(PARITY_DIR, "stubs")
+SHIM_SOURCE = os.path.join(PARITY_DIR, "parity_shim.cpp")
+
+# Dc::Per::Dep functions compiled into the parity library
+PARITY_FUNCTIONS = CHECK_NAMES + ("calcDxInnovationThreshold",)
+
+# Field layout of the ParityObject / ParityParams structs in parity/stubs/per_types_stub.hpp
+PARITY_OBJECT_FIELDS = (
+    ("state_x", np.float32), ("state_y", np.float32), ("state_vx", np.float32), ("state_vy", np.float32),
+    ("rcs", np.float32), ("prob_has_been_observed_moving", np.float32), ("prob_is_currently_moving", np.float32),
+    ("avg_dx_innovation", np.float32), ("elevation", np.float32), ("vy_unreliable_accumulated", np.float32),
+    ("video_inv_ttc", np.float32), ("ego_velocity_x", np.float32), ("ego_acceleration_y", np.float32),
+    ("ego_yaw_rate", np.float32), ("abs_vel_over_ground_x", np.float32), ("abs_vel_over_ground_y", np.float32),
+    ("num_cycles_existing", np.int32), ("filter_type", np.int32),
+    ("total_num_radar_updates", np.int32), ("total_num_video_updates", np.int32),
+    ("total_num_front_left_corner_updates", np.int32), ("total_num_front_right_corner_updates", np.int32),
+    ("total_num_front_center_location_radar_updates", np.int32),
+    ("updates_since_last_video_update", np.int32), ("updates_since_last_radar_update", np.int32),
+    ("number_micro_doppler_cycles", np.int32), ("expected_vr_high_enough_for_mu_doppler_counter", np.int32),
+    ("total_num_cycles_with_oncoming_locations", np.int32),
+    ("is_object_vru", np.int32), ("elevation_is_valid", np.int32), ("is_good_quality_fused_object", np.int32),
+    ("is_suppressed_until_next_video_update", np.int32),
+    ("is_suppressed_due_to_video_otc_post_processing", np.int32),
+    ("is_updated_with_stat_loc_with_high_mdoppler_with_outgoing_vr", np.int32),
+)
+PARITY_PARAMS_FIELDS = (
+    ("innovation_check_dx_threshold", np.float32), ("innovation_check_dy_threshold", np.float32),
+    ("implausible_vy_thresh_la_hypo", np.float32),
+    ("elevation_check_dx_limits", np.float32, (2,)), ("elevation_check_dz_thresholds", np.float32, (2,)),
+    ("is_micro_doppler_check_enabled", np.int32), ("min_vru_micro_doppler_cycles", np.int32),
+    ("is_micro_doppler_check_on_crossing_vru_applied", np.int32),
+    ("is_micro_doppler_check_on_stationary_vru_applied", np.int32),
+)
+PARITY_OBJECT_DTYPE = np.dtype(list(PARITY_OBJECT_FIELDS))
+PARITY_PARAMS_DTYPE = np.dtype(list(PARITY_PARAMS_FIELDS))
+
+FLT_MAX = float(np.finfo(np.float32).max)
+
+# Name of every bit of the packed result bitfield
+BIT_NAMES = {**{1 << index: name for index, name in enumerate(CHECK_NAMES)}, **RELEVANCE_BIT_NAMES}
+
+def _skip_comment(source, index):
+    """Index after the comment starting at index, or index if there is none"""
+    if source.startswith("//", index):
+        end = source.find("\n", index)
+        return len(source) if end < 0 else end
+    if source.startswith("/*", index):
+        end = source.find("*/", index + 2)
+        return len(source) if end < 0 else end + 2
+    return index
+
+def _match_brace(source, start):
+    """Index after the brace closing the one at start, ignoring comments"""
+    depth = 0
+    index = start
+    while index < len(source):
+        skipped = _skip_comment(source, index)
+        if skipped != index:
+            index = skipped
+            continue
+        char = source[index]
+        if char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return index + 1
+        index += 1
+    raise ValueError("Unbalanced braces in C++ source")
+
+def extract_functions(source: str, names: Sequence[str]) -> str:
+    """Source of the Dc::Per::Dep function definitions with the given names"""
+    definitions = []
+    for name in names:
+        match = re.search(rf"^[\w:]+\s+Dc::Per::Dep::{re.escape(name)}\s*\(", source, re.MULTILINE)
+        if match is None:
+            raise ValueError(f"Function not found in C++ source: {name}")
+        body_start = source.index("{", match.end())
+        definitions.append(source[match.start():_match_brace(source, body_start)])
+    return "\n\n".join(definitions) + "\n"
+
+def generate_source(cpp_source: str = CPP_SOURCE) -> str:
+    """Translation unit holding the extracted checks and the includes of inputFile.cpp"""
+    with open(cpp_source, "r") as f:
+        source = f.read()
+    includes = "".join(line + "\n" for line in source.splitlines() if line.startswith("#include"))
+    return f"// Generated from {os.path.basename(cpp_source)} by perception_parity.py\n\n{includes}\n" \
+           f"{extract_functions(source, PARITY_FUNCTIONS)}"
+
+def _stub_files():
+    for directory, _, files in sorted(os.walk(STUB_DIR)):
+        for name in sorted(files):
+            yield os.path.join(directory, name)
+
+def build_library(cpp_source: str = CPP_SOURCE, build_dir: Optional[str] = None, compiler: str = "g++") -> str:
+    """Compile the parity library, reusing a previous build of identical sources"""
+    build_dir = build_dir or os.path.join(tempfile.gettempdir(), "perception_parity")
+    generated = generate_source(cpp_source)
+    digest = hashlib.sha256(generated.encode())
+    for path in [SHIM_SOURCE, *_stub_files()]:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    library = os.path.join(build_dir, f"parity_{digest.hexdigest()[:16]}.so")
+    if os.path.exists(library):
+        return library
+
+    os.makedirs(build_dir, exist_ok=True)
+    checks_source = os.path.join(build_dir, "parity_checks.cpp")
+    with open(checks_source, "w") as f:
+        f.write(generated)
+    command = [compiler, "-std=c++17", "-O2", "-shared", "-fPIC", f"-I{STUB_DIR}",
+               "-o", library + ".tmp", checks_source, SHIM_SOURCE]
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Building the parity library failed:\n{result.stderr}")
+    os.replace(library + ".tmp", library)
+    return library
+
+def to_float32(batch: ObjectBatch) -> ObjectBatch:
+    """Batch with every float column rounded to float32, the precision the C++ evaluates"""
+    return ObjectBatch({name: values.astype(np.float32).astype(values.dtype) if values.dtype == np.float64 else values
+                        for name, values in batch.columns.items()})
+
+def pack_objects(batch: ObjectBatch) -> np.ndarray:
+    """ParityObject records of a batch"""
+    objects = np.zeros(len(batch), dtype=PARITY_OBJECT_DTYPE)
+    for name, _ in PARITY_OBJECT_FIELDS:
+        objects[name] = batch[name]
+    objects["video_inv_ttc"] = np.where(np.isposinf(batch["video_inv_ttc"]), FLT_MAX, batch["video_inv_ttc"])
+    return objects
+
+def pack_params(params: Parameters) -> np.ndarray:
+    """ParityParams record of a Parameters instance"""
+    record = np.zeros(1, dtype=PARITY_PARAMS_DTYPE)
+    for name, *_ in PARITY_PARAMS_FIELDS:
+        record[name] = getattr(params, name)
+    return record
+
+class ParityLibrary:
+    """ctypes binding of a compiled parity library"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or build_library()
+        self._library = ctypes.CDLL(self.path)
+        self._evaluate = self._library.parity_evaluate
+        self._evaluate.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_int64, ctypes.c_void_p]
+        self._evaluate.restype = None
+
+    def evaluate_bits(self, batch: ObjectBatch, params: Optional[Parameters] = None) -> np.ndarray:
+        """Packed uint32 result bitfield of every object as computed by the C++ checks"""
+        objects = pack_objects(batch)
+        record = pack_params(params or Parameters())
+        bits = np.zeros(len(batch), dtype=np.uint32)
+        self._evaluate(record.ctypes.data, objects.ctypes.data, len(objects), bits.ctypes.data)
+        return bits
+
+@dataclass
+class ParityReport:
+    """Per-bit disagreements between the Python and C++ evaluation"""
+    num_objects: int = 0
+    mismatch_counts: Dict[str, int] = field(default_factory=lambda: {name: 0 for name in BIT_NAMES.values()})
+    samples: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def num_mismatches(self) -> int:
+        return sum(self.mismatch_counts.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "num_objects": self.num_objects,
+            "num_mismatches": self.num_mismatches,
+            "mismatch_counts": self.mismatch_counts,
+            "samples": self.samples,
+        }
+
+def compare(batch: ObjectBatch, params: Parameters, library: ParityLibrary, report: Optional[ParityReport] = None,
+            max_samples: int = 10, float32: bool = False) -> ParityReport:
+    """Evaluate a batch on both sides and add the differing bits to a report
+
+    Without float32 the inputs are rounded to float32 first and evaluated in
+    double; with it they are evaluated float32-faithfully as they are.
+    """
+    report = report or ParityReport()
+    if float32:
+        python_bits = evaluate_batch_bits(batch, params, float32=True)
+    else:
+        batch = to_float32(batch)
+        python_bits = evaluate_batch_bits(batch, params)
+    cpp_bits = library.evaluate_bits(batch, params)
+    differing = python_bits ^ cpp_bits
+    for bit, name in BIT_NAMES.items():
+        report.mismatch_counts[name] += int(np.count_nonzero(differing & np.uint32(bit)))
+    for row in np.flatnonzero(differing)[:max(0, max_samples - len(report.samples))]:
+        report.samples.append({
+            "python": [BIT_NAMES[bit] for bit in BIT_NAMES if python_bits[row] & bit],
+            "cpp": [BIT_NAMES[bit] for bit in BIT_NAMES if cpp_bits[row] & bit],
+            "object": {name: batch[name][row].item() for name in batch.columns},
+        })
+    report.num_objects += len(batch)
+    return report
+
+def random_batch(size: int, rng: np.random.Generator) -> ObjectBatch:
+    """Random objects within the C++ input domain, covering the hit and miss branches of every check"""
+    def counts(values):
+        return rng.choice(values, size)
+
+    num_cycles = counts([0, 1, 2, 3, 5, 6, 8, 12, 13, 25, 30, 40, 254, 255, 300])
+    return ObjectBatch({
+        "state_x": rng.uniform(-20.0, 150.0, size),
+        "state_y": rng.uniform(-8.0, 8.0, size),
+        "state_vx": rng.uniform(-5.0, 5.0, size),
+        "state_vy": rng.uniform(-6.0, 6.0, size),
+        "is_object_vru": rng.random(size) < 0.5,
+        "rcs": rng.uniform(-25.0, 10.0, size),
+        "num_cycles_existing": num_cycles,
+        "filter_type": rng.integers(0, len(FILTER_TYPES), size),
+        "prob_has_been_observed_moving": rng.random(size) * 0.3,
+        "prob_is_currently_moving": rng.random(size) * 0.3,
+        "total_num_radar_updates": np.minimum(255, (num_cycles * rng.random(size) * 1.2).astype(np.int32)),
+        "total_num_video_updates": np.where(rng.random(size) < 0.4, 0,
+                                            np.minimum(255, (num_cycles * rng.random(size) * 1.2).astype(np.int32))),
+        "total_num_front_left_corner_updates": counts([0, 0, 0, 1, 3]),
+        "total_num_front_right_corner_updates": counts([0, 0, 0, 1, 3]),
+        "total_num_front_center_location_radar_updates": np.minimum(255, counts([0, 1, 2, 3, 9]) +
+                                                                    (num_cycles * rng.random(size)).astype(np.int32)),
+        "updates_since_last_video_update": counts([0, 0, 1, 2, 9, 10, 12]),
+        "updates_since_last_radar_update": counts([0, 0, 1, 2, 5, 12]),
+        "is_good_quality_fused_object": rng.random(size) < 0.5,
+        "avg_dx_innovation": rng.uniform(-7.0, 7.0, size),
+        "elevation": rng.uniform(0.0, 5.0, size),
+        "elevation_is_valid": rng.random(size) < 0.7,
+        "number_micro_doppler_cycles": counts([0, 0, 1, 3]),
+        "expected_vr_high_enough_for_mu_doppler_counter": counts([0, 1, 2, 5]),
+        "vy_unreliable_accumulated": rng.uniform(0.0, 3.0, size),
+        "total_num_cycles_with_oncoming_locations": counts([0, 0, 2]),
+        "video_inv_ttc": np.where(rng.random(size) < 0.5, rng.uniform(-1.0, 1.0, size), np.inf),
+        "is_suppressed_until_next_video_update": rng.random(size) < 0.2,
+        "is_suppressed_due_to_video_otc_post_processing": rng.random(size) < 0.2,
+        "is_updated_with_stat_loc_with_high_mdoppler_with_outgoing_vr": rng.random(size) < 0.5,
+        "ego_velocity_x": rng.uniform(0.0, 30.0, size),
+        "ego_acceleration_y": rng.uniform(-1.0, 1.0, size),
+        "ego_yaw_rate": np.where(rng.random(size) < 0.5, 0.0, rng.uniform(-0.3, 0.3, size)),
+        "abs_vel_over_ground_x": rng.uniform(-1.0, 10.0, size) * counts([0.0, 0.1, 1.0]),
+        "abs_vel_over_ground_y": rng.uniform(-2.0, 10.0, size) * counts([0.0, 0.1, 1.0]),
+    })
+
+# Values the checks compare float columns against
+THRESHOLD_VALUES = {
+    "state_x": (0.0, 8.0, 10.0, 20.0, 35.0, 50.0, 100.0, 120.0),
+    "state_y": (-6.0, -4.0, -1.25, -0.5, 0.5, 1.25, 4.0, 6.0),
+    "state_vy": (-3.0, 3.0),
+    "rcs": (-15.0, -10.0, -5.0),
+    "avg_dx_innovation": (-6.0, -1.6, -1.5, -1.4, -1.2, -1.1, 1.1, 1.2, 1.4, 1.5, 1.6, 6.0),
+    "elevation": (2.0, 2.5, 3.0),
+    "vy_unreliable_accumulated": (1.9,),
+    "prob_has_been_observed_moving": (0.1,),
+    "prob_is_currently_moving": (0.1,),
+    "ego_acceleration_y": (-0.15, 0.15),
+    "ego_yaw_rate": (-10.0 * np.pi / 180.0, 0.012, 10.0 * np.pi / 180.0),
+    "abs_vel_over_ground_x": (0.2, 0.3, 0.5, 1.0, 4.0),
+    "abs_vel_over_ground_y": (-4.6, 0.3, 0.5, 1.0, 3.2, 4.6, 8.0),
+}
+
+def near_threshold_batch(size: int, rng: np.random.Generator) -> ObjectBatch:
+    """Random objects whose float columns mostly lie within a few double ulps of a check threshold"""
+    columns = dict(random_batch(size, rng).columns)
+    for name, thresholds in THRESHOLD_VALUES.items():
+        values = rng.choice(thresholds, size) * (1.0 + rng.choice([-1e-8, -1e-12, 0.0, 1e-12, 1e-8], size))
+        columns[name] = np.where(rng.random(size) < 0.7, values, columns[name])
+    return ObjectBatch(columns)
+
+def degenerate_limit_variants(params: Parameters) -> List[Parameters]:
+    """Copies of params with equal and with reversed elevation dx limits"""
+    dx_low, dx_high = params.elevation_check_dx_limits
+    middle = (dx_low + dx_high) / 2.0
+    return [replace(params, elevation_check_dx_limits=[middle, middle]),
+            replace(params, elevation_check_dx_limits=[dx_high, dx_low])]
+
+def run_parity(batches: Iterable[ObjectBatch], params: Parameters, library: Optional[ParityLibrary] = None,
+               max_samples: int = 10, float32: bool = False) -> ParityReport:
+    """Compare the Python and C++ evaluation over any number of batches"""
+    library = library or ParityLibrary()
+    report = ParityReport()
+    for batch in batches:
+        compare(batch, params, library, report, max_samples, float32)
+    return report
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare the Python checks against the C++ checks of inputFile.cpp")
+    parser.add_argument("--random", type=int, default=100_000, help="number of random objects (default: 100000)")
+    parser.add_argument("--near-thresholds", type=int, default=0, help="number of near-threshold objects")
+    parser.add_argument("--degenerate-limits", type=int, default=0,
+                        help="number of random objects per degenerate elevation dx limit variant")
+    parser.add_argument("--float32", action="store_true", help="compare the float32-faithful evaluation")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--recording", nargs="*", default=[], help="JSONL/CSV/columnar recordings to compare")
+    parser.add_argument("--params", help="JSON parameter file (default: Parameters())")
+    parser.add_argument("--cpp", default=CPP_SOURCE, help="C++ source to extract the checks from")
+    parser.add_argument("--build-dir", help="directory of the cached parity library")
+    parser.add_argument("--max-samples", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    params = Parameters()
+    if args.params:
+        with open(args.params, "r") as f:
+            params = params_from_dict(json.load(f))
+    library = ParityLibrary(build_library(args.cpp, args.build_dir))
+
+    def batches():
+        rng = np.random.default_rng(args.seed)
+        for start in range(0, args.random, 100_000):
+            yield random_batch(min(100_000, args.random - start), rng)
+        for start in range(0, args.near_thresholds, 100_000):
+            yield near_threshold_batch(min(100_000, args.near_thresholds - start), rng)
+        for path in args.recording:
+            for decoded in read_cycles(path):
+                yield decoded.batch
+
+    report = run_parity(batches(), params, library, args.max_samples, args.float32)
+    rng = np.random.default_rng(args.seed + 1)
+    for variant in degenerate_limit_variants(params):
+        for start in range(0, args.degenerate_limits, 100_000):
+            compare(random_batch(min(100_000, args.degenerate_limits - start), rng), variant, library, report,
+                    args.max_samples, args.float32)
+    print(json.dumps(report.to_dict(), indent=2))
+    return 1 if report.num_mismatches else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
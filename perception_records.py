@@ -0,0 +1,231 @@
+"""
+Array-backed compact storage for large object populations.
+
+``ObjectTable`` keeps N objects in a single NumPy structured array with one
+field per column of ``perception_batch.OBJECT_COLUMNS``. Indexing the table
+returns an ``ObjectRecord``, a slotted view exposing the same attribute API as
+``ObjectData`` (including ``obj.state.x``, ``obj.sensor_filter_fus_helper.*``
+and ``obj.radar_based_innovation[0]``), so records can be passed to the
+scalar checks of ``perception_engine`` unchanged. Every attribute can be
+assigned, nested ones as a whole too (``rec.state = ObjectState(...)``,
+``rec.radar_based_innovation = [dr, alpha]``), and records compare by value
+like ``ObjectData``. No per-object ``__dict__`` or nested objects are
+allocated until a record is accessed.
+"""
+
+from dataclasses import fields
+from typing import Iterator, Sequence, Union
+
+import numpy as np
+
+from perception_batch import (
+    CATEGORIES,
+    INNOVATION_COMPONENTS,
+    OBJECT_COLUMNS,
+    ObjectBatch,
+    decode_category,
+    encode_category,
+    object_to_row,
+)
+from perception_engine import EgoVehicleData, ObjectData, ObjectState, SensorFilterFusHelper
+
+# Structured dtype holding one complete object row
+OBJECT_RECORD_DTYPE = np.dtype([(name, dtype) for name, dtype in OBJECT_COLUMNS.items()])
+
+def _column_property(column):
+    """Property reading and writing one column of the backing array"""
+    if column in CATEGORIES:
+        def getter(self):
+            return decode_category(column, int(self._array[column][self._index]))
+
+        def setter(self, value):
+            self._array[column][self._index] = encode_category(column, value)
+    else:
+        def getter(self):
+            return self._array[column][self._index].item()
+
+        def setter(self, value):
+            self._array[column][self._index] = value
+    return property(getter, setter)
+
+def _nested_property(view_class, nested_class):
+    """Property returning a nested view; assigning copies every field of the assigned object"""
+    def getter(self):
+        return view_class(self._array, self._index)
+
+    def setter(self, value):
+        view = view_class(self._array, self._index)
+        for nested_field in fields(nested_class):
+            setattr(view, nested_field.name, getattr(value, nested_field.name))
+    return property(getter, setter)
+
+def _innovation_property(name):
+    """Property returning an innovation view; assigning writes both components"""
+    def getter(self):
+        return InnovationRecord(self._array, self._index, name)
+
+    def setter(self, value):
+        view = InnovationRecord(self._array, self._index, name)
+        value = list(value)
+        if len(value) != len(view):
+            raise ValueError(f"{name} must hold {len(view)} values")
+        for component, component_value in enumerate(value):
+            view[component] = component_value
+    return property(getter, setter)
+
+class _RecordView:
+    """Base class of views onto one row of a structured array"""
+    __slots__ = ("_array", "_index")
+
+    def __init__(self, array, index):
+        self._array = array
+        self._index = index
+
+    def _values(self):
+        """Column values of the view, compared by __eq__"""
+        return tuple(getattr(self, view_field.name) for view_field in fields(self._dataclass))
+
+    def __eq__(self, other):
+        if isinstance(other, type(self)):
+            return self._values() == other._values()
+        if isinstance(other, self._dataclass):
+            return self._values() == tuple(getattr(other, other_field.name) for other_field in fields(other))
+        return NotImplemented
+
+    __hash__ = None
+
+class ObjectStateRecord(_RecordView):
+    """Array-backed view with the ObjectState attribute API"""
+    __slots__ = ()
+    _dataclass = ObjectState
+
+for _state_field in fields(ObjectState):
+    setattr(ObjectStateRecord, _state_field.name, _column_property(f"state_{_state_field.name}"))
+
+class SensorFilterFusHelperRecord(_RecordView):
+    """Array-backed view with the SensorFilterFusHelper attribute API"""
+    __slots__ = ()
+    _dataclass = SensorFilterFusHelper
+
+for _sensor_field in fields(SensorFilterFusHelper):
+    setattr(SensorFilterFusHelperRecord, _sensor_field.name, _column_property(_sensor_field.name))
+
+class InnovationRecord(_RecordView):
+    """Array-backed view of a two-element innovation list"""
+    __slots__ = ("_columns",)
+
+    def __init__(self, array, index, name):
+        super().__init__(array, index)
+        self._columns = tuple(f"{name}_{component}" for component in INNOVATION_COMPONENTS)
+
+    def __len__(self):
+        return len(self._columns)
+
+    def __getitem__(self, component):
+        return self._array[self._columns[component]][self._index].item()
+
+    def __setitem__(self, component, value):
+        self._array[self._columns[component]][self._index] = value
+
+    def __iter__(self):
+        return (self[component] for component in range(len(self)))
+
+    def __eq__(self, other):
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return repr(list(self))
+
+class ObjectRecord(_RecordView):
+    """Array-backed view with the ObjectData attribute API, comparing equal by its object fields"""
+    __slots__ = ()
+    _dataclass = ObjectData
+
+    state = _nested_property(ObjectStateRecord, ObjectState)
+    sensor_filter_fus_helper = _nested_property(SensorFilterFusHelperRecord, SensorFilterFusHelper)
+    radar_based_innovation = _innovation_property("radar_based_innovation")
+    video_based_innovation = _innovation_property("video_based_innovation")
+
+    # Ego context stored alongside the object
+    @property
+    def ego(self):
+        return EgoVehicleData(**{ego_field.name: self._array[f"ego_{ego_field.name}"][self._index].item()
+                                 for ego_field in fields(EgoVehicleData)})
+
+    @property
+    def abs_vel_over_ground(self):
+        return [self._array["abs_vel_over_ground_x"][self._index].item(),
+                self._array["abs_vel_over_ground_y"][self._index].item()]
+
+    def to_object_data(self) -> ObjectData:
+        """Materialize the record as an ObjectData dataclass"""
+        state = ObjectState(**{state_field.name: getattr(self.state, state_field.name)
+                               for state_field in fields(ObjectState)})
+        sensor = SensorFilterFusHelper(**{sensor_field.name: getattr(self.sensor_filter_fus_helper, sensor_field.name)
+                                          for sensor_field in fields(SensorFilterFusHelper)})
+        values = {}
+        for obj_field in fields(ObjectData):
+            if obj_field.name in ("state", "sensor_filter_fus_helper"):
+                continue
+            value = getattr(self, obj_field.name)
+            values[obj_field.name] = list(value) if isinstance(value, InnovationRecord) else value
+        return ObjectData(state=state, sensor_filter_fus_helper=sensor, **values)
+
+for _obj_field in fields(ObjectData):
+    if _obj_field.name not in ("state", "sensor_filter_fus_helper", "radar_based_innovation", "video_based_innovation"):
+        setattr(ObjectRecord, _obj_field.name, _column_property(_obj_field.name))
+
+class ObjectTable:
+    """Fixed-size table of objects backed by one structured array"""
+
+    def __init__(self, array: Union[int, np.ndarray]):
+        if isinstance(array, int):
+            array = np.zeros(array, dtype=OBJECT_RECORD_DTYPE)
+            for name in OBJECT_COLUMNS:
+                array[name] = _DEFAULT_RECORD[name]
+        if array.dtype != OBJECT_RECORD_DTYPE:
+            raise ValueError("Array does not have the object record dtype")
+        self.array = array
+
+    @classmethod
+    def from_objects(cls, objects: Sequence[ObjectData],
+                     ego: Union[EgoVehicleData, Sequence[EgoVehicleData]],
+                     abs_vel_over_ground: Sequence[Sequence[float]]) -> "ObjectTable":
+        """Pack ObjectData instances into a table"""
+        egos = [ego] * len(objects) if isinstance(ego, EgoVehicleData) else ego
+        array = np.empty(len(objects), dtype=OBJECT_RECORD_DTYPE)
+        for index, (obj, obj_ego, abs_vel) in enumerate(zip(objects, egos, abs_vel_over_ground)):
+            row = object_to_row(obj, obj_ego, abs_vel)
+            array[index] = tuple(row[name] for name in OBJECT_COLUMNS)
+        return cls(array)
+
+    @classmethod
+    def from_batch(cls, batch: ObjectBatch) -> "ObjectTable":
+        """Pack the columns of a batch into a table"""
+        array = np.empty(len(batch), dtype=OBJECT_RECORD_DTYPE)
+        for name in OBJECT_COLUMNS:
+            array[name] = batch[name]
+        return cls(array)
+
+    def __len__(self):
+        return len(self.array)
+
+    def __getitem__(self, index) -> ObjectRecord:
+        if index < 0:
+            index += len(self.array)
+        if not 0 <= index < len(self.array):
+            raise IndexError("ObjectTable index out of range")
+        return ObjectRecord(self.array, index)
+
+    def __iter__(self) -> Iterator[ObjectRecord]:
+        return (ObjectRecord(self.array, index) for index in range(len(self.array)))
+
+    def to_batch(self) -> ObjectBatch:
+        """View the table as a batch; the columns are views, not copies"""
+        return ObjectBatch({name: self.array[name] for name in OBJECT_COLUMNS})
+
+    @property
+    def nbytes(self):
+        return self.array.nbytes
+
+_DEFAULT_RECORD = object_to_row(ObjectData(), EgoVehicleData(), (0.0, 0.0))
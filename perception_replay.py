@@ -0,0 +1,274 @@
+"""
+Streaming replay of recorded object-list logs through the check evaluation.
+
+Every stage is a generator, so stages chain without buffering whole recordings:
+
+    read_jsonl_records(path) -> decode_records(...) -> evaluate_cycles(...)
+        -> aggregate(..., stats) -> write_results_jsonl(..., stream)
+
+Three recording layouts are supported:
+
+* JSONL: one line per cycle, ``{"cycle": n, "ego": {...}, "objects": [...]}``
+  where each object is a nested ``ObjectData`` dict (as written by
+  ``object_to_dict``) with an additional ``"abs_vel_over_ground": [x, y]``.
+* CSV: one row per object with a ``cycle`` column followed by the flat
+  ``OBJECT_COLUMNS`` of ``perception_batch``; rows of one cycle are consecutive.
+* Columnar: a memory-mapped ``*.perc`` directory, see ``perception_columnar``.
+"""
+
+import csv
+import itertools
+import json
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO
+
+import numpy as np
+
+from perception_batch import (
+    CATEGORIES,
+    OBJECT_COLUMNS,
+    ObjectBatch,
+    calc_abs_vel_over_ground,
+    concatenate_batches,
+    decode_category,
+    encode_category,
+    evaluate_batch,
+    object_to_row,
+    pack_hit_matrix,
+)
+from perception_columnar import ColumnarRecording, is_columnar_recording
+from perception_dedup import DedupStatistics, evaluate_batch_unique
+from perception_engine import (
+    CHECK_NAMES,
+    EgoVehicleData,
+    ObjectData,
+    Parameters,
+    ego_from_dict,
+    object_from_dict,
+    object_to_dict,
+)
+
+@dataclass
+class DecodedCycle:
+    """One recorded cycle decoded into a batch of objects"""
+    cycle: int
+    batch: ObjectBatch
+
+@dataclass
+class CycleResult:
+    """Check hits for all objects of one cycle"""
+    cycle: int
+    object_ids: np.ndarray
+    hits: np.ndarray  # (objects, checks) boolean hit matrix
+
+    def bits(self) -> np.ndarray:
+        """Packed uint32 result bitfield of every object"""
+        return pack_hit_matrix(self.hits)
+
+@dataclass
+class CheckStatistics:
+    """Aggregated per-check hit counts over any number of cycles"""
+    num_cycles: int = 0
+    num_objects: int = 0
+    hit_counts: List[int] = field(default_factory=lambda: [0] * len(CHECK_NAMES))
+
+    def update(self, hits: np.ndarray):
+        """Add the hit matrix of one cycle"""
+        self.num_cycles += 1
+        self.num_objects += len(hits)
+        for index, count in enumerate(hits.sum(axis=0).tolist()):
+            self.hit_counts[index] += count
+
+    def merge(self, other: "CheckStatistics"):
+        """Add the counts of another statistics instance"""
+        self.num_cycles += other.num_cycles
+        self.num_objects += other.num_objects
+        self.hit_counts = [own + theirs for own, theirs in zip(self.hit_counts, other.hit_counts)]
+
+    def hit_rates(self) -> Dict[str, float]:
+        """Fraction of evaluated objects hitting each check"""
+        return {name: (count / self.num_objects if self.num_objects else 0.0)
+                for name, count in zip(CHECK_NAMES, self.hit_counts)}
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "num_cycles": self.num_cycles,
+            "num_objects": self.num_objects,
+            "hit_counts": dict(zip(CHECK_NAMES, self.hit_counts)),
+        }
+
+def encode_cycle_record(cycle: int, ego: EgoVehicleData, objects: Sequence[ObjectData],
+                        abs_vel_over_ground: Sequence[Sequence[float]]) -> Dict[str, Any]:
+    """Build the JSONL record of one cycle"""
+    encoded_objects = []
+    for obj, abs_vel in zip(objects, abs_vel_over_ground):
+        encoded = object_to_dict(obj)
+        encoded["abs_vel_over_ground"] = list(abs_vel)
+        encoded_objects.append(encoded)
+    return {"cycle": cycle, "ego": vars(ego).copy(), "objects": encoded_objects}
+
+def write_jsonl_records(records: Iterable[Dict[str, Any]], stream: TextIO):
+    """Write cycle records to a JSONL recording, one line per cycle"""
+    for record in records:
+        stream.write(json.dumps(record))
+        stream.write("\n")
+
+def read_jsonl_records(path: str, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """Read cycle records from a JSONL recording one line at a time
+
+    Only the cycles with position start <= i < stop in the file are decoded.
+    """
+    with open(path, "r") as f:
+        lines = (line for line in f if line.strip())
+        for line in itertools.islice(lines, start, stop):
+            yield json.loads(line)
+
+def decode_records(records: Iterable[Dict[str, Any]]) -> Iterator[DecodedCycle]:
+    """Decode JSONL cycle records into batches"""
+    for record in records:
+        ego = ego_from_dict(record.get("ego", {}))
+        rows = []
+        for encoded in record["objects"]:
+            encoded = dict(encoded)
+            abs_vel_over_ground = encoded.pop("abs_vel_over_ground", (0.0, 0.0))
+            rows.append(object_to_row(object_from_dict(encoded), ego, abs_vel_over_ground))
+        yield DecodedCycle(record["cycle"], ObjectBatch.from_rows(rows))
+
+def _parse_csv_value(name, text):
+    """Parse one CSV cell into the value expected by its column"""
+    if name in CATEGORIES:
+        return encode_category(name, text)
+    dtype = OBJECT_COLUMNS[name]
+    if dtype == np.bool_:
+        return text.strip().lower() in ("1", "true", "yes")
+    if np.issubdtype(dtype, np.integer):
+        return int(text)
+    return float(text)
+
+def read_csv_cycles(path: str, start: int = 0, stop: Optional[int] = None) -> Iterator[DecodedCycle]:
+    """Read a CSV recording and decode it cycle by cycle
+
+    Only the cycles with position start <= i < stop in the file are decoded.
+    """
+    with open(path, "r", newline="") as f:
+        reader = csv.DictReader(f)
+        columns = [name for name in reader.fieldnames if name != "cycle"]
+        unknown = set(columns) - set(OBJECT_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown columns in {path}: {sorted(unknown)}")
+        groups = itertools.groupby(reader, key=lambda row: int(row["cycle"]))
+        for cycle, rows in itertools.islice(groups, start, stop):
+            yield DecodedCycle(cycle, ObjectBatch.from_rows(
+                {name: _parse_csv_value(name, row[name]) for name in columns} for row in rows))
+
+def write_csv_cycles(cycles: Iterable[DecodedCycle], stream: TextIO):
+    """Write decoded cycles to a CSV recording"""
+    writer = csv.writer(stream)
+    writer.writerow(["cycle"] + list(OBJECT_COLUMNS))
+    for decoded in cycles:
+        columns = [decoded.batch[name].tolist() for name in OBJECT_COLUMNS]
+        for values in zip(*columns):
+            row = [decoded.cycle]
+            for name, value in zip(OBJECT_COLUMNS, values):
+                row.append(decode_category(name, value) if name in CATEGORIES else value)
+            writer.writerow(row)
+
+def read_cycles(path: str, start: int = 0, stop: Optional[int] = None) -> Iterator[DecodedCycle]:
+    """Read and decode a recording, choosing the reader by file extension"""
+    if is_columnar_recording(path):
+        return ColumnarRecording(path).iter_cycles(start, stop)
+    if path.endswith(".csv"):
+        return read_csv_cycles(path, start, stop)
+    return decode_records(read_jsonl_records(path, start, stop))
+
+def count_cycles(path: str) -> int:
+    """Count the cycles of a recording without decoding them"""
+    if is_columnar_recording(path):
+        return len(ColumnarRecording(path))
+    if path.endswith(".csv"):
+        with open(path, "r", newline="") as f:
+            reader = csv.DictReader(f)
+            return sum(1 for _ in itertools.groupby(reader, key=lambda row: row["cycle"]))
+    with open(path, "r") as f:
+        return sum(1 for line in f if line.strip())
+
+def derive_over_ground_velocities(cycles: Iterable[DecodedCycle]) -> Iterator[DecodedCycle]:
+    """Replace the recorded velocities over ground by the ones derived from the relative velocities and ego motion"""
+    for decoded in cycles:
+        abs_vel_x, abs_vel_y = calc_abs_vel_over_ground(decoded.batch.columns)
+        yield DecodedCycle(decoded.cycle, ObjectBatch(dict(decoded.batch.columns, abs_vel_over_ground_x=abs_vel_x,
+                                                           abs_vel_over_ground_y=abs_vel_y)))
+
+def _chunks(iterable, size):
+    """Group an iterable into lists of at most size items"""
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+def evaluate_cycles(cycles: Iterable[DecodedCycle], params: Parameters, chunk_size: int = 64,
+                    float32: bool = False, dedup: Optional[DedupStatistics] = None) -> Iterator[CycleResult]:
+    """Evaluate decoded cycles, vectorizing over chunks of cycles (float32-faithfully with float32)
+
+    With dedup every distinct check-relevant row of a chunk is evaluated once
+    and the dedup counts are added to it, see ``perception_dedup``.
+    """
+    for chunk in _chunks(cycles, chunk_size):
+        batch = concatenate_batches([decoded.batch for decoded in chunk])
+        if dedup is not None:
+            hits = evaluate_batch_unique(batch, params, float32, dedup)
+        else:
+            hits = evaluate_batch(batch, params, float32)
+        offsets = np.cumsum([0] + [len(decoded.batch) for decoded in chunk])
+        for decoded, start, end in zip(chunk, offsets[:-1], offsets[1:]):
+            yield CycleResult(decoded.cycle, decoded.batch["object_id_10bit"], hits[start:end])
+
+def aggregate(results: Iterable[CycleResult], stats: CheckStatistics) -> Iterator[CycleResult]:
+    """Accumulate per-check statistics while passing results through"""
+    for result in results:
+        stats.update(result.hits)
+        yield result
+
+def write_results_jsonl(results: Iterable[CycleResult], stream: TextIO) -> Iterator[CycleResult]:
+    """Write the hit checks of every object while passing results through"""
+    for result in results:
+        objects = [
+            {"object_id": int(object_id), "hits": [CHECK_NAMES[index] for index in np.flatnonzero(row)]}
+            for object_id, row in zip(result.object_ids, result.hits)
+        ]
+        stream.write(json.dumps({"cycle": result.cycle, "objects": objects}))
+        stream.write("\n")
+        yield result
+
+def drain(iterable: Iterable[Any]):
+    """Consume a pipeline without keeping its items"""
+    for _ in iterable:
+        pass
+
+def replay_results(path: str, params: Parameters, chunk_size: int = 64, start: int = 0, stop: Optional[int] = None,
+                   derive_over_ground: bool = False, float32: bool = False,
+                   dedup: Optional[DedupStatistics] = None) -> Iterator[CycleResult]:
+    """Per-cycle results of a recording (or a cycle range of it)
+
+    With derive_over_ground the velocities over ground are derived from the
+    relative velocities and the ego motion instead of read from the recording;
+    with float32 the checks are evaluated float32-faithfully; with dedup
+    duplicate rows are evaluated once and counted into it.
+    """
+    if derive_over_ground:
+        return evaluate_cycles(derive_over_ground_velocities(read_cycles(path, start, stop)), params, chunk_size,
+                               float32, dedup)
+    if is_columnar_recording(path):
+        return ColumnarRecording(path).iter_results(params, chunk_size, start, stop, float32, dedup)
+    return evaluate_cycles(read_cycles(path, start, stop), params, chunk_size, float32, dedup)
+
+def replay(path: str, params: Parameters, chunk_size: int = 64, start: int = 0, stop: Optional[int] = None,
+           derive_over_ground: bool = False, float32: bool = False,
+           dedup: Optional[DedupStatistics] = None) -> CheckStatistics:
+    """Replay a recording (or a cycle range of it) and return its aggregated check statistics"""
+    stats = CheckStatistics()
+    drain(aggregate(replay_results(path, params, chunk_size, start, stop, derive_over_ground, float32, dedup),
+                    stats))
+    return stats
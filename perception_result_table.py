@@ -0,0 +1,104 @@
+"""
+Columnar per-object result table of a batch run with filtered, sorted paging.
+
+A ``ResultTable`` stores one row per evaluated object as three flat arrays
+(cycle, object id, packed result bitfield). Filtering and sorting produce
+arrays of row indices and ``page`` formats only the requested window of
+them, so views of millions of results never build per-row Python objects
+beyond what is on screen.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from perception_batch import unpack_hit_matrix
+from perception_engine import CHECK_HIT_MASK, CHECK_NAMES
+
+# Sort keys besides the check names
+SORT_KEYS = ("cycle", "object_id", "num_hits")
+
+@dataclass
+class ResultTable:
+    """Packed results of a batch run, one row per evaluated object"""
+    cycles: np.ndarray  # int64
+    object_ids: np.ndarray  # int64
+    bits: np.ndarray  # uint32
+
+    def __len__(self):
+        return len(self.bits)
+
+    @classmethod
+    def empty(cls) -> "ResultTable":
+        return cls(np.zeros(0, np.int64), np.zeros(0, np.int64), np.zeros(0, np.uint32))
+
+    @classmethod
+    def from_results(cls, results: Iterable["CycleResult"]) -> "ResultTable":
+        """Collect per-cycle results into one table"""
+        cycles, object_ids, bits = [], [], []
+        for result in results:
+            cycles.append(np.full(len(result.hits), result.cycle, dtype=np.int64))
+            object_ids.append(np.asarray(result.object_ids, dtype=np.int64))
+            bits.append(result.bits())
+        if not bits:
+            return cls.empty()
+        return cls(np.concatenate(cycles), np.concatenate(object_ids), np.concatenate(bits))
+
+    @classmethod
+    def concatenate(cls, tables: Sequence["ResultTable"]) -> "ResultTable":
+        """Concatenate tables into one table"""
+        if not tables:
+            return cls.empty()
+        return cls(np.concatenate([table.cycles for table in tables]),
+                   np.concatenate([table.object_ids for table in tables]),
+                   np.concatenate([table.bits for table in tables]))
+
+    def hits(self, check: int) -> np.ndarray:
+        """Boolean hit column of one check"""
+        return (self.bits >> np.uint32(check) & np.uint32(1)).astype(bool)
+
+    def num_hits(self) -> np.ndarray:
+        """Number of checks hit by every row"""
+        return unpack_hit_matrix(self.bits & np.uint32(CHECK_HIT_MASK)).sum(axis=1)
+
+    def select(self, check: Optional[int] = None, hit: Optional[bool] = None,
+               object_id: Optional[int] = None) -> np.ndarray:
+        """Indices of the rows matching the filters; without a check, hit filters on any check hitting"""
+        mask = np.ones(len(self), dtype=bool)
+        if object_id is not None:
+            mask &= self.object_ids == object_id
+        if hit is not None:
+            if check is None:
+                row_hits = (self.bits & np.uint32(CHECK_HIT_MASK)) != 0
+            else:
+                row_hits = self.hits(check)
+            mask &= row_hits == hit
+        return np.flatnonzero(mask)
+
+    def sort_values(self, key: str) -> np.ndarray:
+        """Values of a sort key (one of SORT_KEYS or a check name) for every row"""
+        if key == "cycle":
+            return self.cycles
+        if key == "object_id":
+            return self.object_ids
+        if key == "num_hits":
+            return self.num_hits()
+        if key in CHECK_NAMES:
+            return self.hits(CHECK_NAMES.index(key))
+        raise ValueError(f"Unknown sort key: {key}")
+
+    def sort(self, rows: np.ndarray, key: str, descending: bool = False) -> np.ndarray:
+        """Reorder row indices by a sort key, keeping the current order among equal values"""
+        values = self.sort_values(key)[rows].astype(np.int64)
+        order = np.argsort(-values if descending else values, kind="stable")
+        return rows[order]
+
+    def page(self, rows: np.ndarray, start: int, count: int) -> List[Tuple[int, int, List[str]]]:
+        """Cycle, object id and hit check names of rows[start:start + count]"""
+        window = rows[start:start + count]
+        hit_matrix = unpack_hit_matrix(self.bits[window])
+        return [
+            (int(cycle), int(object_id), [CHECK_NAMES[index] for index in np.flatnonzero(row_hits)])
+            for cycle, object_id, row_hits in zip(self.cycles[window], self.object_ids[window], hit_matrix)
+        ]
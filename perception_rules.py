@@ -0,0 +1,647 @@
+"""
+Declarative rule table for the perception checks.
+
+Every check is written as a conjunction of named terms. Each term is a small
+predicate expression built from ``col`` (an ``OBJECT_COLUMNS`` column),
+``param`` (a ``Parameters`` field) and constants. ``RULES`` mirrors the checks
+of ``perception_engine`` and is compiled by ``CompiledRuleSet`` into
+
+* scalar evaluators working directly on ``ObjectData`` / ``EgoVehicleData``
+* batch evaluators that short-circuit per object: each term is evaluated
+  only for the objects that passed all earlier terms.
+
+``CompiledRuleSet.train`` measures the pass rate and cost of every term on a
+corpus and orders the terms so that cheap, selective terms run first.
+"""
+
+import math
+import operator
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+import perception_batch
+import perception_engine
+from perception_batch import CATEGORIES, INNOVATION_COMPONENTS, OBJECT_COLUMNS, ObjectBatch, encode_category
+from perception_engine import (
+    CHECK_NAMES,
+    EgoVehicleData,
+    ObjectData,
+    ObjectState,
+    Parameters,
+    SensorFilterFusHelper,
+    TURNING_EGO_YAW_RATE_THRESHOLD,
+    pack_hits,
+)
+
+def _scalar_accessors():
+    """Column name -> function(obj, ego, params, abs_vel_over_ground) reading the value from the dataclasses"""
+    accessors = {}
+    getters = {}
+    for name in ObjectState.__dataclass_fields__:
+        getters[f"state_{name}"] = operator.attrgetter(f"state.{name}")
+    for name in SensorFilterFusHelper.__dataclass_fields__:
+        getters[name] = operator.attrgetter(f"sensor_filter_fus_helper.{name}")
+    for name in ObjectData.__dataclass_fields__:
+        if name in ("radar_based_innovation", "video_based_innovation"):
+            for index, component in enumerate(INNOVATION_COMPONENTS):
+                accessors[f"{name}_{component}"] = (
+                    lambda attr, index: lambda o, e, p, v: getattr(o, attr)[index])(name, index)
+        elif name not in ("state", "sensor_filter_fus_helper"):
+            getters[name] = operator.attrgetter(name)
+    for name, getter in getters.items():
+        accessors[name] = (lambda getter: lambda o, e, p, v: getter(o))(getter)
+    for name in EgoVehicleData.__dataclass_fields__:
+        accessors[f"ego_{name}"] = (lambda getter: lambda o, e, p, v: getter(e))(operator.attrgetter(name))
+    accessors["abs_vel_over_ground_x"] = lambda o, e, p, v: v[0]
+    accessors["abs_vel_over_ground_y"] = lambda o, e, p, v: v[1]
+    return accessors
+
+SCALAR_ACCESSORS: Dict[str, Callable[[Any, Any, Any, Any], Any]] = _scalar_accessors()
+
+class Expr:
+    """Base class of rule expressions
+
+    ``scalar()`` compiles the expression into a function(obj, ego, params,
+    abs_vel_over_ground); ``vector(columns, params)`` evaluates it over
+    column arrays.
+    """
+
+    def scalar(self) -> Callable[[Any, Any, Any, Any], Any]:
+        raise NotImplementedError
+
+    def vector(self, columns, params):
+        raise NotImplementedError
+
+    def children(self) -> Sequence["Expr"]:
+        return ()
+
+    def columns(self) -> set:
+        """Columns read by the expression"""
+        return set().union(*(child.columns() for child in self.children()))
+
+    def parameters(self) -> set:
+        """Parameters read by the expression"""
+        return set().union(*(child.parameters() for child in self.children()))
+
+    def __lt__(self, other):
+        return Compare(self, "<", other)
+
+    def __le__(self, other):
+        return Compare(self, "<=", other)
+
+    def __gt__(self, other):
+        return Compare(self, ">", other)
+
+    def __ge__(self, other):
+        return Compare(self, ">=", other)
+
+    def __eq__(self, other):
+        return Compare(self, "==", other)
+
+    def __ne__(self, other):
+        return Compare(self, "!=", other)
+
+    __hash__ = object.__hash__
+
+    def __add__(self, other):
+        return BinOp(self, "+", other)
+
+    def __mul__(self, other):
+        return BinOp(self, "*", other)
+
+    def __truediv__(self, other):
+        return BinOp(self, "/", other)
+
+    def __abs__(self):
+        return Abs(self)
+
+def _as_expr(value):
+    return value if isinstance(value, Expr) else Const(value)
+
+class Col(Expr):
+    """Value of one OBJECT_COLUMNS column"""
+
+    def __init__(self, name):
+        if name not in OBJECT_COLUMNS:
+            raise ValueError(f"Unknown column: {name}")
+        self.name = name
+
+    def scalar(self):
+        return SCALAR_ACCESSORS[self.name]
+
+    def vector(self, columns, params):
+        return columns[self.name]
+
+    def columns(self):
+        return {self.name}
+
+    def __str__(self):
+        return self.name
+
+class Param(Expr):
+    """Value of one Parameters field"""
+
+    def __init__(self, name):
+        if name not in Parameters.__dataclass_fields__:
+            raise ValueError(f"Unknown parameter: {name}")
+        self.name = name
+
+    def scalar(self):
+        getter = operator.attrgetter(self.name)
+        return lambda o, e, p, v: getter(p)
+
+    def vector(self, columns, params):
+        return getattr(params, self.name)
+
+    def parameters(self):
+        return {self.name}
+
+    def __str__(self):
+        return f"params.{self.name}"
+
+class Const(Expr):
+    """Constant value"""
+
+    def __init__(self, value):
+        self.value = value
+
+    def scalar(self):
+        value = self.value
+        return lambda o, e, p, v: value
+
+    def vector(self, columns, params):
+        return self.value
+
+    def __str__(self):
+        return repr(self.value)
+
+class AllParams(Expr):
+    """The complete Parameters instance, for helper functions taking parameters"""
+
+    def scalar(self):
+        return lambda o, e, p, v: p
+
+    def vector(self, columns, params):
+        return params
+
+    def parameters(self):
+        return set(Parameters.__dataclass_fields__)
+
+    def __str__(self):
+        return "params"
+
+_OPERATORS = {
+    "<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+    "==": operator.eq, "!=": operator.ne, "+": operator.add, "*": operator.mul, "/": operator.truediv,
+}
+
+class Compare(Expr):
+    """Binary comparison; categorical columns compare against their string values"""
+
+    def __init__(self, left, op, right):
+        self.left, self.op, self.right = _as_expr(left), op, _as_expr(right)
+
+    def children(self):
+        return (self.left, self.right)
+
+    def scalar(self):
+        left, op = self.left.scalar(), _OPERATORS[self.op]
+        if isinstance(self.right, Const):
+            value = self.right.value
+            return lambda o, e, p, v: op(left(o, e, p, v), value)
+        right = self.right.scalar()
+        return lambda o, e, p, v: op(left(o, e, p, v), right(o, e, p, v))
+
+    def vector(self, columns, params):
+        right = self.right.vector(columns, params)
+        if isinstance(self.left, Col) and self.left.name in CATEGORIES and isinstance(right, str):
+            right = encode_category(self.left.name, right)
+        return _OPERATORS[self.op](self.left.vector(columns, params), right)
+
+    def __str__(self):
+        return f"{self.left} {self.op} {self.right}"
+
+class BinOp(Compare):
+    """Arithmetic on two expressions"""
+
+    def vector(self, columns, params):
+        return _OPERATORS[self.op](self.left.vector(columns, params), self.right.vector(columns, params))
+
+    def __str__(self):
+        return f"({self.left} {self.op} {self.right})"
+
+class Abs(Expr):
+    """Absolute value"""
+
+    def __init__(self, operand):
+        self.operand = operand
+
+    def children(self):
+        return (self.operand,)
+
+    def scalar(self):
+        operand = self.operand.scalar()
+        return lambda o, e, p, v: abs(operand(o, e, p, v))
+
+    def vector(self, columns, params):
+        return np.abs(self.operand.vector(columns, params))
+
+    def __str__(self):
+        return f"abs({self.operand})"
+
+class Not(Expr):
+    """Logical negation"""
+
+    def __init__(self, operand):
+        self.operand = operand
+
+    def children(self):
+        return (self.operand,)
+
+    def scalar(self):
+        operand = self.operand.scalar()
+        return lambda o, e, p, v: not operand(o, e, p, v)
+
+    def vector(self, columns, params):
+        return np.logical_not(self.operand.vector(columns, params))
+
+    def __str__(self):
+        return f"not ({self.operand})"
+
+class AllOf(Expr):
+    """Logical conjunction"""
+    joiner = " and "
+
+    def __init__(self, *operands):
+        self.operands = tuple(_as_expr(operand) for operand in operands)
+
+    def children(self):
+        return self.operands
+
+    def scalar(self):
+        operands = tuple(operand.scalar() for operand in self.operands)
+        return lambda o, e, p, v: all(operand(o, e, p, v) for operand in operands)
+
+    def vector(self, columns, params):
+        result = True
+        for operand in self.operands:
+            result = np.logical_and(result, operand.vector(columns, params))
+        return result
+
+    def __str__(self):
+        return "(" + self.joiner.join(str(operand) for operand in self.operands) + ")"
+
+class AnyOf(AllOf):
+    """Logical disjunction"""
+    joiner = " or "
+
+    def scalar(self):
+        operands = tuple(operand.scalar() for operand in self.operands)
+        return lambda o, e, p, v: any(operand(o, e, p, v) for operand in operands)
+
+    def vector(self, columns, params):
+        result = False
+        for operand in self.operands:
+            result = np.logical_or(result, operand.vector(columns, params))
+        return result
+
+class Where(Expr):
+    """Conditional value: if_true where condition holds, otherwise if_false"""
+
+    def __init__(self, condition, if_true, if_false):
+        self.condition, self.if_true, self.if_false = condition, _as_expr(if_true), _as_expr(if_false)
+
+    def children(self):
+        return (self.condition, self.if_true, self.if_false)
+
+    def scalar(self):
+        condition, if_true, if_false = self.condition.scalar(), self.if_true.scalar(), self.if_false.scalar()
+        return lambda o, e, p, v: if_true(o, e, p, v) if condition(o, e, p, v) else if_false(o, e, p, v)
+
+    def vector(self, columns, params):
+        return np.where(self.condition.vector(columns, params),
+                        self.if_true.vector(columns, params), self.if_false.vector(columns, params))
+
+    def __str__(self):
+        return f"({self.if_true} if {self.condition} else {self.if_false})"
+
+class Fn(Expr):
+    """Helper function applied to argument expressions, with separate scalar and vector implementations"""
+
+    def __init__(self, name, scalar_fn, vector_fn, *args):
+        self.name, self.scalar_fn, self.vector_fn = name, scalar_fn, vector_fn
+        self.args = tuple(_as_expr(arg) for arg in args)
+
+    def children(self):
+        return self.args
+
+    def scalar(self):
+        fn, args = self.scalar_fn, tuple(arg.scalar() for arg in self.args)
+        return lambda o, e, p, v: fn(*(arg(o, e, p, v) for arg in args))
+
+    def vector(self, columns, params):
+        return self.vector_fn(*(arg.vector(columns, params) for arg in self.args))
+
+    def __str__(self):
+        return f"{self.name}({', '.join(str(arg) for arg in self.args)})"
+
+class ColumnFn(Expr):
+    """Helper computed from whole objects: scalar_fn(obj, ego, params, abs_vel_over_ground) and batch_fn(columns)"""
+
+    def __init__(self, name, scalar_fn, batch_fn, columns):
+        self.name, self.scalar_fn, self.batch_fn = name, scalar_fn, batch_fn
+        self._columns = set(columns)
+
+    def scalar(self):
+        return self.scalar_fn
+
+    def vector(self, columns, params):
+        return self.batch_fn(columns)
+
+    def columns(self):
+        return set(self._columns)
+
+    def __str__(self):
+        return f"{self.name}()"
+
+col = Col
+param = Param
+
+@dataclass(frozen=True, eq=False)
+class Term:
+    """One named conjunct of a rule"""
+    name: str
+    predicate: Expr
+
+@dataclass(frozen=True, eq=False)
+class Rule:
+    """A check expressed as a conjunction of terms; the check hits if every term holds"""
+    check: str
+    terms: Tuple[Term, ...]
+
+    def columns(self) -> set:
+        return set().union(*(term.predicate.columns() for term in self.terms))
+
+    def parameters(self) -> set:
+        return set().union(*(term.predicate.parameters() for term in self.terms))
+
+def rule(check, *terms):
+    """Build a rule from (name, predicate) pairs or bare predicates named after their expression"""
+    return Rule(check, tuple(Term(*term) if isinstance(term, tuple) else Term(str(term), term) for term in terms))
+
+fc_radar_updates = col("total_num_front_center_location_radar_updates")
+abs_vel_x = col("abs_vel_over_ground_x")
+abs_vel_y = col("abs_vel_over_ground_y")
+num_cycles = col("num_cycles_existing")
+
+RULES: Tuple[Rule, ...] = (
+    rule("applySuppressionUntilNextVideoUpdateCheck",
+         col("is_suppressed_until_next_video_update")),
+    rule("applyPostProcessVideoOtcCheck",
+         col("is_suppressed_due_to_video_otc_post_processing")),
+    rule("isMovingTowardsEgoLane",
+         ("is_moving_towards_ego_lane", AnyOf(col("state_y") * col("state_vy") < 0.0,
+                                              col("state_y") * abs_vel_y < 0.0))),
+    rule("isDepObjProbablyVideoGhost",
+         fc_radar_updates > 0,
+         fc_radar_updates < 3,
+         col("updates_since_last_radar_update") == 0,
+         col("total_num_video_updates") > 3,
+         col("total_num_front_left_corner_updates") == 0,
+         col("total_num_front_right_corner_updates") == 0,
+         col("number_micro_doppler_cycles") == 0,
+         col("expected_vr_high_enough_for_mu_doppler_counter") > 0,
+         col("rcs") < -15.0),
+    rule("applyUpdatedWithStatLocWithHighMDopplerWithOutgoingVrCheck",
+         col("is_object_vru"),
+         abs_vel_x < 0.2,
+         abs_vel_y > 1.0,
+         abs(col("state_y")) < 0.5,
+         col("is_updated_with_stat_loc_with_high_mdoppler_with_outgoing_vr")),
+    rule("applyIsMeasuredRatioCheckForFastWnj",
+         col("filter_type") == "WNJ",
+         abs(abs_vel_y) > 4.6,
+         num_cycles < 255,
+         num_cycles > 1,
+         col("total_num_radar_updates") / (num_cycles + 1.0) < 0.7,
+         col("total_num_video_updates") <= 5),
+    rule("applyNonCrossingObjectCheck",
+         abs_vel_y > 0.5,
+         col("prob_is_currently_moving") < 0.1,
+         col("prob_has_been_observed_moving") < 0.1,
+         fc_radar_updates > 0,
+         col("number_micro_doppler_cycles") == 0,
+         col("total_num_cycles_with_oncoming_locations") == 0),
+    rule("applyMicroDopplerCheck",
+         param("is_micro_doppler_check_enabled"),
+         col("is_object_vru"),
+         col("expected_vr_high_enough_for_mu_doppler_counter") >= 2,
+         fc_radar_updates > 0,
+         col("total_num_front_left_corner_updates") < 1,
+         col("total_num_front_right_corner_updates") < 1,
+         col("number_micro_doppler_cycles") < param("min_vru_micro_doppler_cycles"),
+         ("crossing_or_stationary_vru", AnyOf(
+             AllOf(abs_vel_y > 0.5,
+                   abs_vel_y < Where(AllOf(num_cycles > 12, fc_radar_updates > 8), 3.2, 99.0),
+                   abs_vel_x < 4.0,
+                   param("is_micro_doppler_check_on_crossing_vru_applied")),
+             AllOf(abs_vel_x < 0.5,
+                   abs_vel_y < 0.5,
+                   param("is_micro_doppler_check_on_stationary_vru_applied"))))),
+    rule("applyRadarOnlyRcsAndDrInnovationLimit",
+         col("total_num_video_updates") == 0,
+         fc_radar_updates > 0,
+         abs(col("avg_dx_innovation")) > 1.2,
+         col("rcs") < -15.0),
+    rule("applyElevationCheck",
+         col("state_x") > 0,
+         col("elevation_is_valid"),
+         ("is_stationary_video_confirmed_object_or_vru", AnyOf(
+             AllOf(abs_vel_x < 1.0, abs_vel_y < 1.0, col("updates_since_last_video_update") < 10),
+             col("is_object_vru"))),
+         ("is_dz_inappropriate", col("elevation") > Fn("interpolate_elevation_dz_threshold",
+                                                       perception_engine.interpolate_elevation_dz_threshold,
+                                                       perception_batch.interpolate_elevation_dz_threshold,
+                                                       AllParams(), col("state_x")))),
+    rule("applyInnovationCheck",
+         abs(col("state_x")) < param("innovation_check_dx_threshold"),
+         abs(col("state_y")) < param("innovation_check_dy_threshold"),
+         ("is_dx_innovation_exceeded", abs(col("avg_dx_innovation")) > ColumnFn(
+             "calc_dx_innovation_threshold",
+             lambda o, e, p, v: perception_engine.calc_dx_innovation_threshold(o, v),
+             perception_batch.calc_dx_innovation_threshold,
+             ("state_x", "is_object_vru", "rcs", "vy_unreliable_accumulated", "num_cycles_existing",
+              "is_good_quality_fused_object", "total_num_front_center_location_radar_updates",
+              "total_num_video_updates", "abs_vel_over_ground_x", "abs_vel_over_ground_y")))),
+    rule("applyImplausibleVyVruCheck",
+         col("is_object_vru"),
+         abs_vel_y > param("implausible_vy_thresh_la_hypo"),
+         col("filter_type") == "LA",
+         ("not_is_ego_turning", Not(abs(col("ego_yaw_rate")) > TURNING_EGO_YAW_RATE_THRESHOLD))),
+    rule("applyImplausibleVideoTtcForVru",
+         col("is_object_vru"),
+         col("updates_since_last_video_update") < 1,
+         ("is_video_inv_ttc_max_float", ColumnFn(
+             "is_video_inv_ttc_max_float",
+             lambda o, e, p, v: o.video_inv_ttc == float("inf"),  # Representing max float
+             lambda c: c["video_inv_ttc"] == perception_batch.max_float(c),
+             ("video_inv_ttc",)))),
+    rule("applyRadarOnlyNLDCheck",
+         col("total_num_video_updates") == 0,
+         ("is_radar_only_nld_candidate_or_close_with_high_lateral_velocity", AnyOf(
+             Not(AllOf(ColumnFn("is_ego_driving_straight", lambda o, e, p, v: perception_engine.is_ego_driving_straight(e),
+                                perception_batch.is_ego_driving_straight, ("ego_velocity_x", "ego_yaw_rate", "ego_acceleration_y")),
+                       AnyOf(AllOf(abs(col("state_y")) <= 1.25, col("state_x") < 120.0),
+                             AllOf(abs(col("state_y")) <= 6.0, col("state_x") < 10.0)),
+                       num_cycles >= 3,
+                       AnyOf(col("total_num_radar_updates") >= num_cycles, num_cycles >= 30))),
+             AllOf(abs(col("state_vy")) > 3.0, col("state_x") < 8.0, abs(col("state_y")) < 4.0)))),
+    rule("applyRadarOnlyStationaryCheck",
+         col("total_num_video_updates") == 0,
+         abs_vel_x < 0.3,
+         abs_vel_y < 0.3),
+)
+
+assert tuple(rule_.check for rule_ in RULES) == CHECK_NAMES
+
+# Static dependency maps derived from the rule table
+CHECK_COLUMNS: Dict[str, frozenset] = {rule_.check: frozenset(rule_.columns()) for rule_ in RULES}
+CHECK_PARAMETERS: Dict[str, frozenset] = {rule_.check: frozenset(rule_.parameters()) for rule_ in RULES}
+
+def dependent_checks(columns: Iterable[str] = (), parameters: Iterable[str] = ()) -> List[int]:
+    """Indices (in CHECK_NAMES order) of the checks reading any of the given columns or parameters"""
+    columns, parameters = set(columns), set(parameters)
+    return [index for index, name in enumerate(CHECK_NAMES)
+            if CHECK_COLUMNS[name] & columns or CHECK_PARAMETERS[name] & parameters]
+
+class _Subset:
+    """Lazily gathered view of the columns at a set of object indices"""
+
+    def __init__(self, columns, index):
+        self._columns, self._index, self._cache = columns, index, {}
+
+    def __getitem__(self, name):
+        values = self._cache.get(name)
+        if values is None:
+            values = self._cache[name] = self._columns[name][self._index]
+        return values
+
+@dataclass
+class TermStatistics:
+    """Measured behaviour of one term on a training corpus"""
+    name: str
+    pass_rate: float
+    cost: float  # seconds per object
+
+    @property
+    def rank(self):
+        """Expected cost per rejected object; lower runs earlier"""
+        return self.cost / max(1.0 - self.pass_rate, 1e-9)
+
+class CompiledRuleSet:
+    """Rule table compiled into scalar and short-circuiting batch evaluators"""
+    dense_fraction = 0.25
+
+    def __init__(self, rules: Sequence[Rule] = RULES):
+        self.rules = tuple(rules)
+        self._scalar = tuple(
+            tuple(term.predicate.scalar() for term in rule_.terms) for rule_ in self.rules
+        )
+
+    def evaluate_object(self, obj: ObjectData, ego: EgoVehicleData, params: Parameters,
+                        abs_vel_over_ground: Sequence[float]) -> List[bool]:
+        """Hit flag of every check for one object"""
+        hits = []
+        for terms in self._scalar:
+            for term in terms:
+                if not term(obj, ego, params, abs_vel_over_ground):
+                    hits.append(False)
+                    break
+            else:
+                hits.append(True)
+        return hits
+
+    def evaluate_object_bits(self, obj: ObjectData, ego: EgoVehicleData, params: Parameters,
+                             abs_vel_over_ground: Sequence[float]) -> int:
+        """Packed result bitfield for one object"""
+        return pack_hits(self.evaluate_object(obj, ego, params, abs_vel_over_ground))
+
+    def first_failing_term(self, check_index: int, obj: ObjectData, ego: EgoVehicleData, params: Parameters,
+                           abs_vel_over_ground: Sequence[float]) -> Optional[str]:
+        """Name of the first term of a rule that does not hold for one object, None on a hit"""
+        for term, predicate in zip(self.rules[check_index].terms, self._scalar[check_index]):
+            if not predicate(obj, ego, params, abs_vel_over_ground):
+                return term.name
+        return None
+
+    def survivors(self, check_index: int, batch: ObjectBatch, params: Parameters,
+                  first_failures: Optional[Dict[str, int]] = None) -> np.ndarray:
+        """Indices of the objects passing every term of one rule
+
+        While more than ``dense_fraction`` of the objects survive, terms are
+        evaluated on the full columns; below that, on the gathered survivors.
+        If given, first_failures[term name] is increased by the number of
+        objects rejected by each term.
+        """
+        columns, size = batch.columns, len(batch)
+        survivors = np.arange(size)
+        for term in self.rules[check_index].terms:
+            if len(survivors) > self.dense_fraction * size:
+                passed = term.predicate.vector(columns, params)
+                if np.ndim(passed):
+                    passed = passed[survivors]
+            else:
+                passed = term.predicate.vector(_Subset(columns, survivors), params)
+            remaining = survivors[passed] if np.ndim(passed) else (survivors if passed else survivors[:0])
+            if first_failures is not None and len(remaining) < len(survivors):
+                first_failures[term.name] = first_failures.get(term.name, 0) + len(survivors) - len(remaining)
+            survivors = remaining
+            if len(survivors) == 0:
+                break
+        return survivors
+
+    def evaluate_batch(self, batch: ObjectBatch, params: Parameters) -> np.ndarray:
+        """(N, checks) hit matrix; each term only sees the objects that passed the earlier terms"""
+        hits = np.zeros((len(batch), len(self.rules)), dtype=bool)
+        for check_index in range(len(self.rules)):
+            hits[self.survivors(check_index, batch, params), check_index] = True
+        return hits
+
+    @staticmethod
+    def measure(batch: ObjectBatch, params: Parameters, rules: Sequence[Rule] = RULES,
+                repeat: int = 3) -> Dict[str, List[TermStatistics]]:
+        """Pass rate and per-object cost of every term over a corpus batch"""
+        size = max(len(batch), 1)
+        statistics = {}
+        for rule_ in rules:
+            term_statistics = []
+            for term in rule_.terms:
+                best = math.inf
+                for _ in range(repeat):
+                    start = time.perf_counter()
+                    passed = term.predicate.vector(batch.columns, params)
+                    best = min(best, time.perf_counter() - start)
+                pass_rate = float(np.mean(passed)) if np.ndim(passed) else float(bool(passed))
+                term_statistics.append(TermStatistics(term.name, pass_rate, best / size))
+            statistics[rule_.check] = term_statistics
+        return statistics
+
+    @classmethod
+    def train(cls, batch: ObjectBatch, params: Parameters,
+              rules: Sequence[Rule] = RULES) -> "CompiledRuleSet":
+        """Compile with the terms of every rule ordered by measured cost per rejected object"""
+        statistics = cls.measure(batch, params, rules)
+        ordered = []
+        for rule_ in rules:
+            ranks = {stats.name: stats.rank for stats in statistics[rule_.check]}
+            ordered.append(Rule(rule_.check, tuple(sorted(rule_.terms, key=lambda term: ranks[term.name]))))
+        compiled = cls(ordered)
+        compiled.statistics = statistics
+        return compiled
+
+    def term_order(self) -> Dict[str, List[str]]:
+        """Current evaluation order of the terms of every rule"""
+        return {rule_.check: [term.name for term in rule_.terms] for rule_ in self.rules}
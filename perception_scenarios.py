@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Indexed scenario library of full-fidelity object, ego and parameter records.
+
+A library is a directory holding ``index.json`` and one
+``scenarios/<id>.json`` file per scenario. Scenario files use the layout of
+the emulator's Save Config (``object_data``, ``ego_data``,
+``abs_vel_over_ground``, ``is_mpc3_used``) extended by every ObjectData
+field, the ``params`` and the scenario ``name`` and ``tags``, so they can be
+evaluated by the ``eval`` command and the evaluation server as they are.
+
+The index stores per scenario its name, tags and check-hit signature (the
+packed result bitfield of the scenario evaluated with its own parameters).
+Opening a library reads only the index; ``query`` answers tag and hit/miss
+filters from in-memory inverted sets and ``load`` reads only the scenario
+files a caller asks for. Tags are the user's tags plus the derived ones of
+``derived_tags``. Signatures go stale when the checks change; ``reindex``
+re-evaluates them.
+
+Usage:
+    python perception_scenarios.py LIBRARY add CONFIG [CONFIG ...] [--tag TAG ...]
+    python perception_scenarios.py LIBRARY query [--tag TAG ...] [--hit CHECK ...] [--miss CHECK ...]
+    python perception_scenarios.py LIBRARY reindex
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from perception_engine import (
+    CHECK_NAMES,
+    EgoVehicleData,
+    ObjectData,
+    Parameters,
+    ego_from_dict,
+    evaluate_object_bits,
+    object_from_dict,
+    object_to_dict,
+    params_from_dict,
+)
+
+FORMAT_NAME = "perception-scenarios"
+FORMAT_VERSION = 1
+
+@dataclass
+class Scenario:
+    """One object with its ego context and parameter set"""
+    name: str
+    object_data: ObjectData = field(default_factory=ObjectData)
+    ego_data: EgoVehicleData = field(default_factory=EgoVehicleData)
+    abs_vel_over_ground: List[float] = field(default_factory=lambda: [0.0, 0.0])
+    params: Parameters = field(default_factory=Parameters)
+    is_mpc3_used: bool = False
+    tags: List[str] = field(default_factory=list)
+
+    def bits(self) -> int:
+        """Check-hit signature: the packed result bitfield under the scenario's own parameters"""
+        return evaluate_object_bits(self.object_data, self.ego_data, self.params, self.abs_vel_over_ground)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "tags": list(self.tags),
+            "object_data": object_to_dict(self.object_data),
+            "ego_data": asdict(self.ego_data),
+            "abs_vel_over_ground": list(self.abs_vel_over_ground),
+            "is_mpc3_used": self.is_mpc3_used,
+            "params": asdict(self.params),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], name: Optional[str] = None) -> "Scenario":
+        """Create a scenario from a scenario file or Save Config dict, defaulting missing fields"""
+        return cls(
+            name=data.get("name", name or "scenario"),
+            object_data=object_from_dict(data.get("object_data", {})),
+            ego_data=ego_from_dict(data.get("ego_data", {})),
+            abs_vel_over_ground=list(data.get("abs_vel_over_ground", (0.0, 0.0))),
+            params=params_from_dict(data.get("params", {})),
+            is_mpc3_used=data.get("is_mpc3_used", False),
+            tags=list(data.get("tags", [])),
+        )
+
+def derived_tags(scenario: Scenario) -> List[str]:
+    """Tags following from the object itself: VRU, its filter type and radar-only"""
+    tags = [scenario.object_data.filter_type]
+    if scenario.object_data.is_object_vru:
+        tags.append("VRU")
+    if scenario.object_data.sensor_filter_fus_helper.total_num_video_updates == 0:
+        tags.append("radar-only")
+    return tags
+
+def write_json(path: str, data: Any):
+    """Write a JSON file atomically"""
+    temporary = f"{path}.tmp"
+    with open(temporary, "w") as f:
+        json.dump(data, f, indent=2)
+    os.replace(temporary, path)
+
+def check_index(name: str) -> int:
+    """Position of a check in CHECK_NAMES"""
+    try:
+        return CHECK_NAMES.index(name)
+    except ValueError:
+        raise ValueError(f"Unknown check: {name}") from None
+
+@dataclass
+class IndexEntry:
+    """Index record of one scenario"""
+    name: str
+    tags: List[str]
+    bits: int
+
+class ScenarioLibrary:
+    """Directory of scenario files with an in-memory tag and check-hit index"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[str, IndexEntry] = {}
+        index_path = os.path.join(path, "index.json")
+        if os.path.exists(index_path):
+            with open(index_path, "r") as f:
+                index = json.load(f)
+            if index.get("format") != FORMAT_NAME or index.get("version") != FORMAT_VERSION:
+                raise ValueError(f"{path} is not a {FORMAT_NAME} v{FORMAT_VERSION} library")
+            self.entries = {scenario_id: IndexEntry(**entry) for scenario_id, entry in index["scenarios"].items()}
+        self._build_index()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, scenario_id: str):
+        return scenario_id in self.entries
+
+    def _build_index(self):
+        """Inverted sets of scenario ids per tag and per hit check"""
+        self._by_tag: Dict[str, Set[str]] = {}
+        self._by_hit: List[Set[str]] = [set() for _ in CHECK_NAMES]
+        for scenario_id, entry in self.entries.items():
+            self._index_entry(scenario_id, entry)
+
+    def _index_entry(self, scenario_id: str, entry: IndexEntry):
+        for tag in entry.tags:
+            self._by_tag.setdefault(tag, set()).add(scenario_id)
+        for index, hit_ids in enumerate(self._by_hit):
+            if entry.bits >> index & 1:
+                hit_ids.add(scenario_id)
+
+    def _scenario_path(self, scenario_id: str) -> str:
+        return os.path.join(self.path, "scenarios", f"{scenario_id}.json")
+
+    def _new_id(self, name: str) -> str:
+        """Unique file-name-safe id derived from a scenario name"""
+        base = re.sub(r"[^A-Za-z0-9_-]+", "_", name).strip("_") or "scenario"
+        scenario_id, suffix = base, 2
+        while scenario_id in self.entries:
+            scenario_id, suffix = f"{base}_{suffix}", suffix + 1
+        return scenario_id
+
+    def save_index(self):
+        """Write the index file"""
+        write_json(os.path.join(self.path, "index.json"), {
+            "format": FORMAT_NAME,
+            "version": FORMAT_VERSION,
+            "scenarios": {scenario_id: asdict(entry) for scenario_id, entry in self.entries.items()},
+        })
+
+    def add_all(self, scenarios: Iterable[Scenario]) -> List[str]:
+        """Store scenarios under new ids, writing the index once"""
+        os.makedirs(os.path.join(self.path, "scenarios"), exist_ok=True)
+        scenario_ids = []
+        for scenario in scenarios:
+            scenario_id = self._new_id(scenario.name)
+            write_json(self._scenario_path(scenario_id), scenario.to_dict())
+            tags = list(dict.fromkeys(scenario.tags + derived_tags(scenario)))
+            self.entries[scenario_id] = IndexEntry(scenario.name, tags, scenario.bits())
+            self._index_entry(scenario_id, self.entries[scenario_id])
+            scenario_ids.append(scenario_id)
+        self.save_index()
+        return scenario_ids
+
+    def add(self, scenario: Scenario) -> str:
+        """Store one scenario, returning its id"""
+        return self.add_all([scenario])[0]
+
+    def remove(self, scenario_id: str):
+        """Delete a scenario and its index entry"""
+        del self.entries[scenario_id]
+        os.remove(self._scenario_path(scenario_id))
+        self._build_index()
+        self.save_index()
+
+    def load(self, scenario_id: str) -> Scenario:
+        """Read one scenario file"""
+        if scenario_id not in self.entries:
+            raise KeyError(f"Scenario {scenario_id} not in library")
+        with open(self._scenario_path(scenario_id), "r") as f:
+            return Scenario.from_dict(json.load(f), scenario_id)
+
+    def query(self, tags: Iterable[str] = (), hits: Iterable[str] = (), misses: Iterable[str] = ()) -> List[str]:
+        """Sorted ids of the scenarios carrying all tags, hitting all checks in hits and none in misses"""
+        selected: Optional[Set[str]] = None
+        for tag in tags:
+            ids = self._by_tag.get(tag, set())
+            selected = set(ids) if selected is None else selected & ids
+        for name in hits:
+            ids = self._by_hit[check_index(name)]
+            selected = set(ids) if selected is None else selected & ids
+        if selected is None:
+            selected = set(self.entries)
+        for name in misses:
+            selected -= self._by_hit[check_index(name)]
+        return sorted(selected)
+
+    def load_matching(self, tags: Iterable[str] = (), hits: Iterable[str] = (),
+                      misses: Iterable[str] = ()) -> Iterator[Scenario]:
+        """Read only the scenarios matching a query"""
+        for scenario_id in self.query(tags, hits, misses):
+            yield self.load(scenario_id)
+
+    def reindex(self):
+        """Re-evaluate every scenario's check-hit signature and derived tags"""
+        for scenario_id, entry in self.entries.items():
+            scenario = self.load(scenario_id)
+            entry.tags = list(dict.fromkeys(scenario.tags + derived_tags(scenario)))
+            entry.bits = scenario.bits()
+        self._build_index()
+        self.save_index()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Manage and query a scenario library")
+    parser.add_argument("library", help="library directory (created on first add)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    add = commands.add_parser("add", help="add Save Config or scenario files")
+    add.add_argument("configs", nargs="+")
+    add.add_argument("--tag", action="append", default=[], help="tag added to every scenario")
+    query = commands.add_parser("query", help="print the ids of matching scenarios")
+    query.add_argument("--tag", action="append", default=[])
+    query.add_argument("--hit", action="append", default=[], help="check that must hit")
+    query.add_argument("--miss", action="append", default=[], help="check that must not hit")
+    commands.add_parser("reindex", help="re-evaluate all check-hit signatures")
+    args = parser.parse_args(argv)
+
+    library = ScenarioLibrary(args.library)
+    if args.command == "add":
+        scenarios = []
+        for path in args.configs:
+            with open(path, "r") as f:
+                scenario = Scenario.from_dict(json.load(f), os.path.splitext(os.path.basename(path))[0])
+            scenario.tags = list(dict.fromkeys(scenario.tags + args.tag))
+            scenarios.append(scenario)
+        for scenario_id in library.add_all(scenarios):
+            print(scenario_id)
+    elif args.command == "query":
+        try:
+            scenario_ids = library.query(args.tag, args.hit, args.miss)
+        except ValueError as e:
+            parser.error(str(e))
+        for scenario_id in scenario_ids:
+            print(scenario_id)
+    else:
+        library.reindex()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Local asyncio HTTP/JSON evaluation service with request micro-batching.
+
+Usage: python perception_server.py [--host HOST] [--port PORT] [--params FILE]
+                                   [--window-ms MS] [--max-batch N]
+
+Endpoints:
+
+* ``POST /evaluate``: body is one object in the Save Config layout
+  (``{"object_data": {...}, "ego_data": {...}, "abs_vel_over_ground": [x, y]}``)
+  or ``{"objects": [...]}`` with a list of them. The response holds, per
+  object, the hit check names, the packed result bitfield and the functions
+  the object is disqualified for.
+* ``GET /stats``: request, object and batch counters of the micro-batcher.
+* ``GET /health``: liveness probe.
+
+Requests arriving within ``--window-ms`` of the first pending request are
+coalesced by ``MicroBatcher`` into one ``evaluate_batch`` call; a batch is
+flushed early once it holds ``--max-batch`` objects. Evaluation runs on the
+event loop: a vectorized batch costs less than handing it to a thread.
+Every request is converted into its own batch before it is queued, so a
+malformed request is answered with 400 without affecting the requests it
+would have been coalesced with.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from perception_batch import ObjectBatch, concatenate_batches, evaluate_batch, object_to_row, pack_hit_matrix
+from perception_engine import (
+    CHECK_NAMES,
+    Parameters,
+    disqualified_functions,
+    ego_from_dict,
+    object_from_dict,
+    params_from_dict,
+)
+
+REASONS = {200: "OK", 204: "No Content", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           500: "Internal Server Error"}
+
+class MicroBatcher:
+    """Coalesces concurrent evaluation requests into one vectorized batch evaluation"""
+
+    def __init__(self, params: Parameters, window: float = 0.002, max_objects: int = 65536):
+        if window < 0:
+            raise ValueError(f"window must not be negative, got {window}")
+        if max_objects < 1:
+            raise ValueError(f"max_objects must be positive, got {max_objects}")
+        self.params = params
+        self.window = window
+        self.max_objects = max_objects
+        self.num_requests = 0
+        self.num_objects = 0
+        self.num_batches = 0
+        self._num_pending_objects = 0
+        self._waiters: List[Tuple[asyncio.Future, ObjectBatch]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    async def evaluate(self, batch: ObjectBatch) -> np.ndarray:
+        """Packed result bitfields of a batch, evaluated with the other pending requests"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._waiters.append((future, batch))
+        self._num_pending_objects += len(batch)
+        if self._num_pending_objects >= self.max_objects:
+            self.flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self.flush)
+        return await future
+
+    def flush(self):
+        """Evaluate all pending requests as one batch and resolve their futures"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        waiters = self._waiters
+        self._waiters, self._num_pending_objects = [], 0
+        if not waiters:
+            return
+        try:
+            bits = pack_hit_matrix(evaluate_batch(concatenate_batches([batch for _, batch in waiters]), self.params))
+        except Exception:
+            self._flush_separately(waiters)
+            return
+        self.num_requests += len(waiters)
+        self.num_objects += len(bits)
+        self.num_batches += 1
+        offset = 0
+        for future, batch in waiters:
+            if not future.done():
+                future.set_result(bits[offset:offset + len(batch)])
+            offset += len(batch)
+
+    def _flush_separately(self, waiters: List[Tuple[asyncio.Future, ObjectBatch]]):
+        """Evaluate every request on its own, failing only the requests whose evaluation fails"""
+        for future, batch in waiters:
+            try:
+                bits = pack_hit_matrix(evaluate_batch(batch, self.params))
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+                continue
+            self.num_requests += 1
+            self.num_objects += len(batch)
+            self.num_batches += 1
+            if not future.done():
+                future.set_result(bits)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.num_requests,
+            "objects": self.num_objects,
+            "batches": self.num_batches,
+            "mean_batch_objects": self.num_objects / self.num_batches if self.num_batches else 0.0,
+        }
+
+def parse_objects(payload: Any) -> ObjectBatch:
+    """Batch of the objects of an /evaluate request body, raising for values of the wrong type"""
+    if not isinstance(payload, dict):
+        raise ValueError("Request body must be a JSON object")
+    specs = payload["objects"] if "objects" in payload else [payload]
+    if not isinstance(specs, list):
+        raise ValueError("objects must be a list")
+    rows = []
+    for spec in specs:
+        if not isinstance(spec, dict):
+            raise ValueError("Every object must be a JSON object")
+        obj = object_from_dict(spec.get("object_data", {}))
+        ego = ego_from_dict(spec.get("ego_data", {}))
+        abs_vel_over_ground = spec.get("abs_vel_over_ground", (0.0, 0.0))
+        if len(abs_vel_over_ground) != 2:
+            raise ValueError("abs_vel_over_ground must hold two values")
+        rows.append(object_to_row(obj, ego, abs_vel_over_ground))
+    return ObjectBatch.from_rows(rows)
+
+def format_result(bits: int) -> Dict[str, Any]:
+    """JSON result of one object"""
+    return {
+        "hits": [name for index, name in enumerate(CHECK_NAMES) if bits >> index & 1],
+        "bits": bits,
+        "disqualified": disqualified_functions(bits),
+    }
+
+class EvaluationServer:
+    """HTTP/1.1 keep-alive JSON front end of a MicroBatcher"""
+
+    def __init__(self, batcher: MicroBatcher):
+        self.batcher = batcher
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+        return await asyncio.start_server(self.handle_connection, host, port)
+
+    async def dispatch(self, method: str, path: str, body: bytes) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Status code and JSON payload of one request"""
+        if method == "OPTIONS":
+            return 204, None
+        if path == "/evaluate":
+            if method != "POST":
+                return 405, {"error": "Use POST"}
+            try:
+                batch = parse_objects(json.loads(body))
+            except (ValueError, TypeError, KeyError, OverflowError) as e:
+                return 400, {"error": str(e)}
+            try:
+                bits = await self.batcher.evaluate(batch) if len(batch) else []
+            except Exception as e:
+                return 500, {"error": f"Evaluation failed: {e}"}
+            return 200, {"results": [format_result(int(value)) for value in bits]}
+        if path in ("/stats", "/health"):
+            if method != "GET":
+                return 405, {"error": "Use GET"}
+            return 200, self.batcher.to_dict() if path == "/stats" else {"status": "ok"}
+        return 404, {"error": f"Unknown path: {path}"}
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Serve requests of one connection until the client closes it"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, version = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                body = await reader.readexactly(length) if length else b""
+                status, payload = await self.dispatch(method, target.split("?", 1)[0], body)
+                data = json.dumps(payload).encode() if payload is not None else b""
+                keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                writer.write(
+                    f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n"
+                    f"Access-Control-Allow-Origin: *\r\n"
+                    f"Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n"
+                    f"Access-Control-Allow-Headers: Content-Type\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + data)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+async def serve(host: str, port: int, params: Parameters, window: float, max_objects: int):
+    """Run the evaluation server until cancelled"""
+    server = await EvaluationServer(MicroBatcher(params, window, max_objects)).start(host, port)
+    bound_host, bound_port = server.sockets[0].getsockname()[:2]
+    print(f"Listening on http://{bound_host}:{bound_port}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the perception checks over HTTP/JSON")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port, 0 picks a free one (default: 8765)")
+    parser.add_argument("--params", help="JSON parameter file (default: Parameters())")
+    parser.add_argument("--window-ms", type=float, default=2.0, help="micro-batching window (default: 2 ms)")
+    parser.add_argument("--max-batch", type=int, default=65536, help="objects flushing a batch early")
+    args = parser.parse_args(argv)
+
+    params = Parameters()
+    if args.params:
+        with open(args.params, "r") as f:
+            params = params_from_dict(json.load(f))
+    try:
+        asyncio.run(serve(args.host, args.port, params, args.window_ms / 1000.0, args.max_batch))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,127 @@
+"""
+Threshold sweep / grid-search over the Parameters dataclass.
+
+A corpus of object batches is evaluated against many ``Parameters`` variants
+and the per-check hit rates are reported for each variant. The threshold
+independent part of every check is computed once per batch
+(``BatchFeatures``); each variant then only compares the candidate objects of
+the parameter dependent checks against its thresholds. With dedup only the
+distinct check-relevant rows of every batch are kept, weighted by their
+multiplicity (see ``perception_dedup``).
+"""
+
+import itertools
+import random
+from dataclasses import dataclass, fields, replace
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from perception_batch import BatchFeatures, ObjectBatch, concatenate_batches
+from perception_dedup import DedupStatistics, unique_rows
+from perception_engine import CHECK_NAMES, Parameters
+
+PARAMETER_NAMES = tuple(parameter.name for parameter in fields(Parameters))
+
+def _check_parameter_names(names):
+    """Raise for names that are not Parameters fields"""
+    unknown = set(names) - set(PARAMETER_NAMES)
+    if unknown:
+        raise ValueError(f"Unknown parameters: {sorted(unknown)}")
+
+def grid_variants(grid: Dict[str, Sequence[Any]], base: Optional[Parameters] = None) -> List[Parameters]:
+    """All combinations of the given parameter values, other fields taken from base"""
+    _check_parameter_names(grid)
+    base = base or Parameters()
+    names = list(grid)
+    return [replace(base, **dict(zip(names, values))) for values in itertools.product(*(grid[name] for name in names))]
+
+def random_variants(space: Dict[str, Any], num_variants: int, seed: int = 0,
+                    base: Optional[Parameters] = None) -> List[Parameters]:
+    """Randomly sampled parameter variants
+
+    A ``(low, high)`` tuple samples uniformly from the range (integers if both
+    ends are integers), a list samples one of its elements.
+    """
+    _check_parameter_names(space)
+    base = base or Parameters()
+    rng = random.Random(seed)
+    variants = []
+    for _ in range(num_variants):
+        values = {}
+        for name, spec in space.items():
+            if isinstance(spec, tuple):
+                low, high = spec
+                if isinstance(low, int) and isinstance(high, int):
+                    values[name] = rng.randint(low, high)
+                else:
+                    values[name] = rng.uniform(low, high)
+            else:
+                values[name] = rng.choice(spec)
+        variants.append(replace(base, **values))
+    return variants
+
+@dataclass
+class SweepResult:
+    """Per-check hit counts of every evaluated parameter variant"""
+    variants: List[Parameters]
+    num_objects: int
+    hit_counts: np.ndarray  # (variants, checks)
+
+    def hit_rates(self) -> np.ndarray:
+        """(variants, checks) fraction of objects hitting each check"""
+        return self.hit_counts / max(self.num_objects, 1)
+
+    def to_rows(self, parameter_names: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """One dict per variant with the chosen parameter values and the hit rates"""
+        parameter_names = list(parameter_names or PARAMETER_NAMES)
+        rows = []
+        for variant, rates in zip(self.variants, self.hit_rates().tolist()):
+            row = {name: getattr(variant, name) for name in parameter_names}
+            row.update(zip(CHECK_NAMES, rates))
+            rows.append(row)
+        return rows
+
+    def best(self, check_name: str, maximize: bool = False) -> Tuple[Parameters, float]:
+        """Variant with the lowest (or highest) hit rate for one check"""
+        rates = self.hit_rates()[:, CHECK_NAMES.index(check_name)]
+        index = int(np.argmax(rates) if maximize else np.argmin(rates))
+        return self.variants[index], float(rates[index])
+
+def _coalesce(corpus: Iterable[ObjectBatch], max_objects: int) -> Iterable[ObjectBatch]:
+    """Concatenate consecutive small batches into batches of up to max_objects objects"""
+    pending, pending_size = [], 0
+    for batch in corpus:
+        if pending and pending_size + len(batch) > max_objects:
+            yield concatenate_batches(pending)
+            pending, pending_size = [], 0
+        pending.append(batch)
+        pending_size += len(batch)
+    if pending:
+        yield concatenate_batches(pending)
+
+def _unique_features(batch: ObjectBatch, dedup: DedupStatistics) -> BatchFeatures:
+    """Features of the distinct rows of a batch, weighted by their multiplicity"""
+    first, inverse = unique_rows(batch)
+    dedup.num_objects += len(batch)
+    dedup.num_unique += len(first)
+    return BatchFeatures(batch.take(first), np.bincount(inverse, minlength=len(first)))
+
+def run_sweep(corpus: Iterable[ObjectBatch], variants: Sequence[Parameters],
+              max_batch_objects: int = 1_000_000, dedup: Optional[DedupStatistics] = None) -> SweepResult:
+    """Evaluate a corpus of batches against every parameter variant
+
+    Only the extracted features are kept in memory, the raw batches are
+    released once their features have been computed. With dedup duplicate
+    rows are kept once and the dedup counts are added to it.
+    """
+    batches = _coalesce(corpus, max_batch_objects)
+    if dedup is None:
+        features = [BatchFeatures(batch) for batch in batches]
+    else:
+        features = [_unique_features(batch, dedup) for batch in batches]
+    hit_counts = np.zeros((len(variants), len(CHECK_NAMES)), dtype=np.int64)
+    for row, params in enumerate(variants):
+        for batch_features in features:
+            hit_counts[row] += batch_features.count_hits(params)
+    return SweepResult(list(variants), sum(batch_features.num_objects for batch_features in features), hit_counts)
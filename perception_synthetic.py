@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Seeded streaming generator of synthetic multi-cycle object tracks.
+
+``TrackGenerator`` keeps a fixed number of track slots as column arrays and
+advances all of them per cycle with vectorized NumPy operations:
+
+* ego motion: speed and yaw rate random walks, lateral acceleration v * yaw rate
+* object motion: constant over-ground velocity plus noise; the relative
+  ``state`` follows from it and the ego motion
+* sensor updates drawn per cycle from the family's update probabilities,
+  advancing the same counters as ``perception_tracking.advance_counters``
+* micro-doppler cycles of moving VRUs whose radial velocity is high enough
+* smoothed dx / radar / video innovations and moving probabilities
+
+Every slot holds one track of a scenario family (``FAMILIES``). A track ends
+after its drawn lifetime or when it leaves the field of view; the slot is
+refilled with a new track (new object id, counters reset). Each cycle is
+yielded as a ``DecodedCycle``, so generated tracks stream into the pipeline of
+``perception_replay`` without being written anywhere:
+
+    TrackGenerator(config).cycles(n) -> evaluate_cycles(...) -> aggregate(...)
+
+Usage: python perception_synthetic.py [--cycles N] [--tracks N] [--seed S]
+                                      [--family NAME=WEIGHT ...] [--output PATH]
+
+Without ``--output`` the generated cycles are evaluated and the check
+statistics and object-cycles per second are printed as JSON; with it they are
+written as a CSV or columnar (``*.perc``) recording.
+"""
+
+import argparse
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional, Tuple
+
+import numpy as np
+
+from perception_batch import ObjectBatch, encode_category
+from perception_columnar import RECORDING_SUFFIX, write_cycles
+from perception_engine import Parameters
+from perception_replay import CheckStatistics, DecodedCycle, aggregate, drain, evaluate_cycles, write_csv_cycles
+
+@dataclass(frozen=True)
+class Family:
+    """Spawn distribution and sensor model of one scenario family"""
+    is_vru: bool
+    filter_type: str
+    x_range: Tuple[float, float]  # spawn distance ahead
+    y_range: Tuple[float, float]  # spawn lateral offset; mirrored to a random side
+    vx_range: Tuple[float, float]  # over-ground velocity
+    vy_range: Tuple[float, float]  # over-ground lateral velocity towards the other side
+    rcs_mean: float
+    rcs_sigma: float
+    elevation_range: Tuple[float, float]
+    front_center_radar_rate: float  # per-cycle update probabilities
+    corner_rate: float
+    video_rate: float
+    innovation_sigma: float
+    micro_doppler_rate: float  # per cycle with a high enough radial velocity
+
+FAMILIES: Dict[str, Family] = {
+    "crossing_pedestrian": Family(
+        is_vru=True, filter_type="LA", x_range=(8.0, 60.0), y_range=(3.0, 8.0), vx_range=(-0.3, 0.3),
+        vy_range=(0.8, 2.5), rcs_mean=-10.0, rcs_sigma=3.0, elevation_range=(0.0, 1.0),
+        front_center_radar_rate=0.85, corner_rate=0.2, video_rate=0.8, innovation_sigma=0.4, micro_doppler_rate=0.7),
+    "fast_wnj_crosser": Family(
+        is_vru=False, filter_type="WNJ", x_range=(15.0, 70.0), y_range=(8.0, 20.0), vx_range=(-1.0, 1.0),
+        vy_range=(5.0, 12.0), rcs_mean=5.0, rcs_sigma=5.0, elevation_range=(0.0, 1.5),
+        front_center_radar_rate=0.8, corner_rate=0.4, video_rate=0.7, innovation_sigma=0.6, micro_doppler_rate=0.0),
+    "stationary_clutter": Family(
+        is_vru=False, filter_type="KF", x_range=(5.0, 120.0), y_range=(0.0, 10.0), vx_range=(0.0, 0.0),
+        vy_range=(0.0, 0.0), rcs_mean=-15.0, rcs_sigma=5.0, elevation_range=(0.0, 1.0),
+        front_center_radar_rate=0.7, corner_rate=0.2, video_rate=0.0, innovation_sigma=1.5, micro_doppler_rate=0.0),
+    "bridge": Family(
+        is_vru=False, filter_type="KF", x_range=(60.0, 150.0), y_range=(0.0, 3.0), vx_range=(0.0, 0.0),
+        vy_range=(0.0, 0.0), rcs_mean=15.0, rcs_sigma=5.0, elevation_range=(4.5, 7.0),
+        front_center_radar_rate=0.9, corner_rate=0.05, video_rate=0.0, innovation_sigma=0.8, micro_doppler_rate=0.0),
+    "video_ghost": Family(
+        is_vru=True, filter_type="LA", x_range=(10.0, 60.0), y_range=(0.0, 4.0), vx_range=(-2.0, 2.0),
+        vy_range=(-3.0, 3.0), rcs_mean=-20.0, rcs_sigma=3.0, elevation_range=(0.0, 1.0),
+        front_center_radar_rate=0.05, corner_rate=0.0, video_rate=0.9, innovation_sigma=1.0, micro_doppler_rate=0.0),
+}
+
+# Family parameters as arrays indexed by family code, in FAMILIES order
+_FAMILY_ARRAYS = {
+    name: np.array([getattr(family, name) for family in FAMILIES.values()])
+    for name in ("is_vru", "rcs_mean", "rcs_sigma", "front_center_radar_rate", "corner_rate", "video_rate",
+                 "innovation_sigma", "micro_doppler_rate")
+}
+
+# Radial velocity over ground above which micro-doppler is expected
+MICRO_DOPPLER_MIN_RADIAL_VELOCITY = 0.5
+# Field of view; tracks leaving it end
+MAX_RANGE = 200.0
+MIN_X = -10.0
+MAX_ABS_Y = 30.0
+
+@dataclass
+class GeneratorConfig:
+    """Shape of a synthetic corpus"""
+    num_tracks: int = 128  # live track slots per cycle
+    family_weights: Dict[str, float] = field(default_factory=lambda: {name: 1.0 for name in FAMILIES})
+    cycle_time: float = 0.06  # seconds
+    lifetime_range: Tuple[int, int] = (20, 300)  # cycles
+    ego_speed_range: Tuple[float, float] = (0.0, 30.0)
+    seed: int = 0
+
+    def __post_init__(self):
+        if self.num_tracks < 1:
+            raise ValueError(f"num_tracks must be positive, got {self.num_tracks}")
+        unknown = set(self.family_weights) - set(FAMILIES)
+        if unknown:
+            raise ValueError(f"Unknown families: {sorted(unknown)}")
+        if any(weight < 0 for weight in self.family_weights.values()) or not sum(self.family_weights.values()) > 0:
+            raise ValueError("Family weights must be non-negative with a positive sum")
+
+class TrackGenerator:
+    """Advances a fixed set of track slots and the ego vehicle cycle by cycle"""
+
+    def __init__(self, config: Optional[GeneratorConfig] = None):
+        self.config = config or GeneratorConfig()
+        self.rng = np.random.default_rng(self.config.seed)
+        weights = np.array([self.config.family_weights.get(name, 0.0) for name in FAMILIES])
+        self._family_probabilities = weights / weights.sum()
+        self.cycle = 0
+        self._next_object_id = 0
+        self.ego_velocity_x = float(self.rng.uniform(*self.config.ego_speed_range))
+        self.ego_yaw_rate = 0.0
+
+        n = self.config.num_tracks
+        self.families = np.zeros(n, dtype=np.int64)  # family code of every slot, in FAMILIES order
+        self.lifetimes = np.zeros(n, dtype=np.int64)
+        self.velocity_over_ground = np.zeros((n, 2))
+        self.columns: Dict[str, np.ndarray] = {}
+        self._spawn(np.arange(n))
+
+    def _spawn(self, slots: np.ndarray):
+        """Start new tracks in the given slots, resetting their counters"""
+        rng, count = self.rng, len(slots)
+        if not count:
+            return
+        families = rng.choice(len(FAMILIES), size=count, p=self._family_probabilities)
+        self.families[slots] = families
+        self.lifetimes[slots] = rng.integers(self.config.lifetime_range[0], self.config.lifetime_range[1] + 1, count)
+
+        def per_family(attribute):
+            lows = np.array([getattr(family, attribute)[0] for family in FAMILIES.values()])[families]
+            highs = np.array([getattr(family, attribute)[1] for family in FAMILIES.values()])[families]
+            return rng.uniform(lows, highs)
+
+        side = rng.choice([-1.0, 1.0], count)
+        self.velocity_over_ground[slots, 0] = per_family("vx_range")
+        self.velocity_over_ground[slots, 1] = -side * per_family("vy_range")
+
+        new = {
+            "state_x": per_family("x_range"),
+            "state_y": side * per_family("y_range"),
+            "rcs": _FAMILY_ARRAYS["rcs_mean"][families] + _FAMILY_ARRAYS["rcs_sigma"][families] * rng.standard_normal(count),
+            "elevation": per_family("elevation_range"),
+            "elevation_is_valid": np.ones(count, dtype=bool),
+            "is_object_vru": _FAMILY_ARRAYS["is_vru"][families].astype(bool),
+            "filter_type": np.array([encode_category("filter_type", family.filter_type)
+                                     for family in FAMILIES.values()])[families],
+            "object_id_10bit": (self._next_object_id + np.arange(count)) % 1024,
+            "prob_has_been_observed_moving": np.zeros(count),
+            "prob_is_currently_moving": np.zeros(count),
+        }
+        self._next_object_id += count
+        for name in ("avg_dx_innovation", "radar_based_innovation_dr", "radar_based_innovation_alpha",
+                     "video_based_innovation_dr", "video_based_innovation_alpha", "video_inv_ttc"):
+            new[name] = np.zeros(count)
+        for name in ("total_num_radar_updates", "total_num_video_updates", "total_num_front_center_location_radar_updates",
+                     "total_num_front_left_corner_updates", "total_num_front_right_corner_updates",
+                     "updates_since_last_radar_update", "updates_since_last_video_update",
+                     "updates_since_last_front_center_location_radar_update", "updates_since_last_front_left_corner_update",
+                     "updates_since_last_front_right_corner_update", "updates_since_last_front_center_video_update",
+                     "updates_since_last_update", "num_cycles_existing", "number_micro_doppler_cycles",
+                     "expected_vr_high_enough_for_mu_doppler_counter", "total_num_cycles_with_oncoming_locations",
+                     "num_consecutive_cycles_without_oncoming_locations", "num_cycles_no_orientation_update"):
+            new[name] = np.zeros(count, dtype=np.int64)
+        for name in ("is_good_quality_fused_object", "is_trustworthy_object"):
+            new[name] = np.zeros(count, dtype=bool)
+
+        if not self.columns:
+            self.columns = new
+            return
+        for name, values in new.items():
+            self.columns[name][slots] = values
+
+    def _advance_ego(self):
+        """Random walk of the ego speed and yaw rate"""
+        rng, dt = self.rng, self.config.cycle_time
+        low, high = self.config.ego_speed_range
+        self.ego_velocity_x = float(np.clip(self.ego_velocity_x + rng.normal(0.0, 1.0) * dt, low, high))
+        # Mostly straight driving with occasional turns
+        target = 0.0 if rng.random() < 0.98 else rng.uniform(-0.3, 0.3)
+        self.ego_yaw_rate = float(0.95 * self.ego_yaw_rate + 0.05 * target + rng.normal(0.0, 0.002))
+
+    def _advance_counters(self, sensors: Dict[str, np.ndarray]):
+        """Per-sensor update counters, as perception_tracking.advance_counters does for one track"""
+        c = self.columns
+        for sensor, total, since in (
+                ("front_center_radar", "total_num_front_center_location_radar_updates",
+                 "updates_since_last_front_center_location_radar_update"),
+                ("front_left_corner", "total_num_front_left_corner_updates", "updates_since_last_front_left_corner_update"),
+                ("front_right_corner", "total_num_front_right_corner_updates", "updates_since_last_front_right_corner_update"),
+                ("video", "total_num_video_updates", "updates_since_last_front_center_video_update")):
+            updated = sensors[sensor]
+            c[total] += updated
+            c[since] = np.where(updated, 0, c[since] + 1)
+        radar = sensors["front_center_radar"] | sensors["front_left_corner"] | sensors["front_right_corner"]
+        video = sensors["video"]
+        c["total_num_radar_updates"] += radar
+        c["updates_since_last_radar_update"] = np.where(radar, 0, c["updates_since_last_radar_update"] + 1)
+        c["updates_since_last_video_update"] = np.where(video, 0, c["updates_since_last_video_update"] + 1)
+        c["updates_since_last_update"] = np.where(radar | video, 0, c["updates_since_last_update"] + 1)
+        c["num_cycles_existing"] += 1
+        c["num_cycles_no_orientation_update"] = np.where(video, 0, c["num_cycles_no_orientation_update"] + 1)
+        c["is_good_quality_fused_object"] = (c["total_num_radar_updates"] > 3) & (c["total_num_video_updates"] > 3)
+        c["is_trustworthy_object"] = c["num_cycles_existing"] > 5
+
+    def step(self) -> DecodedCycle:
+        """Advance every track by one cycle and return the cycle's object batch"""
+        rng, dt, n = self.rng, self.config.cycle_time, self.config.num_tracks
+        c, families = self.columns, self.families
+        self._advance_ego()
+
+        # Over-ground velocity with process noise (zero for the stationary families), relative state from it
+        moving = np.abs(self.velocity_over_ground).sum(axis=1) > 0.0
+        self.velocity_over_ground += np.where(moving[:, None], rng.normal(0.0, 0.05, (n, 2)), 0.0)
+        vx_over_ground, vy_over_ground = self.velocity_over_ground[:, 0], self.velocity_over_ground[:, 1]
+        c["state_vx"] = vx_over_ground - self.ego_velocity_x + self.ego_yaw_rate * c["state_y"]
+        c["state_vy"] = vy_over_ground - self.ego_yaw_rate * c["state_x"]
+        c["state_x"] = c["state_x"] + c["state_vx"] * dt
+        c["state_y"] = c["state_y"] + c["state_vy"] * dt
+
+        sensors = {
+            "front_center_radar": rng.random(n) < _FAMILY_ARRAYS["front_center_radar_rate"][families],
+            "front_left_corner": (rng.random(n) < _FAMILY_ARRAYS["corner_rate"][families]) & (c["state_y"] > 0.0),
+            "front_right_corner": (rng.random(n) < _FAMILY_ARRAYS["corner_rate"][families]) & (c["state_y"] <= 0.0),
+            "video": rng.random(n) < _FAMILY_ARRAYS["video_rate"][families],
+        }
+        self._advance_counters(sensors)
+
+        # Micro-doppler needs a radial velocity over ground; only moving VRUs produce it
+        distance = np.maximum(np.hypot(c["state_x"], c["state_y"]), 1e-3)
+        radial_velocity = (vx_over_ground * c["state_x"] + vy_over_ground * c["state_y"]) / distance
+        expected = np.abs(radial_velocity) > MICRO_DOPPLER_MIN_RADIAL_VELOCITY
+        c["expected_vr_high_enough_for_mu_doppler_counter"] += expected
+        c["number_micro_doppler_cycles"] += expected & (rng.random(n) < _FAMILY_ARRAYS["micro_doppler_rate"][families])
+        oncoming = vx_over_ground < -1.0
+        c["total_num_cycles_with_oncoming_locations"] += oncoming
+        c["num_consecutive_cycles_without_oncoming_locations"] = np.where(
+            oncoming, 0, c["num_consecutive_cycles_without_oncoming_locations"] + 1)
+
+        # Innovations are smoothed measurement residuals, updated by the measuring sensor only
+        sigma = _FAMILY_ARRAYS["innovation_sigma"][families]
+        radar = sensors["front_center_radar"] | sensors["front_left_corner"] | sensors["front_right_corner"]
+        video = sensors["video"]
+        for name, updated in (("avg_dx_innovation", radar), ("radar_based_innovation_dr", radar),
+                              ("radar_based_innovation_alpha", radar), ("video_based_innovation_dr", video),
+                              ("video_based_innovation_alpha", video)):
+            c[name] = np.where(updated, 0.8 * c[name] + 0.2 * sigma * rng.standard_normal(n), c[name])
+        c["video_inv_ttc"] = np.where(video, np.maximum(-c["state_vx"], 0.0) / np.maximum(c["state_x"], 1.0),
+                                      c["video_inv_ttc"])
+
+        speed = np.hypot(vx_over_ground, vy_over_ground)
+        is_moving = speed > 0.5
+        c["prob_is_currently_moving"] = 0.8 * c["prob_is_currently_moving"] + 0.2 * is_moving
+        c["prob_has_been_observed_moving"] = np.maximum(c["prob_has_been_observed_moving"], c["prob_is_currently_moving"])
+
+        columns = {name: values.copy() for name, values in c.items()}
+        columns["ego_velocity_x"] = np.full(n, self.ego_velocity_x)
+        columns["ego_yaw_rate"] = np.full(n, self.ego_yaw_rate)
+        columns["ego_acceleration_y"] = np.full(n, self.ego_velocity_x * self.ego_yaw_rate)
+        columns["abs_vel_over_ground_x"] = vx_over_ground.copy()
+        columns["abs_vel_over_ground_y"] = vy_over_ground.copy()
+        decoded = DecodedCycle(self.cycle, ObjectBatch(columns))
+
+        # End tracks past their lifetime or outside the field of view
+        self.lifetimes -= 1
+        ended = ((self.lifetimes <= 0) | (c["state_x"] < MIN_X) | (c["state_x"] > MAX_RANGE)
+                 | (np.abs(c["state_y"]) > MAX_ABS_Y))
+        self._spawn(np.flatnonzero(ended))
+        self.cycle += 1
+        return decoded
+
+    def cycles(self, num_cycles: Optional[int] = None) -> Iterator[DecodedCycle]:
+        """Yield num_cycles cycles, or cycles without end"""
+        while num_cycles is None or self.cycle < num_cycles:
+            yield self.step()
+
+def parse_family_weights(specs) -> Dict[str, float]:
+    """Family weights from NAME=WEIGHT strings"""
+    weights = {}
+    for spec in specs:
+        name, _, weight = spec.partition("=")
+        if name not in FAMILIES:
+            raise ValueError(f"Unknown family: {name}")
+        weights[name] = float(weight) if weight else 1.0
+    return weights
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic multi-cycle track corpora")
+    parser.add_argument("--cycles", type=int, default=1000)
+    parser.add_argument("--tracks", type=int, default=128, help="live tracks per cycle")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--family", action="append", default=[], metavar="NAME=WEIGHT",
+                        help=f"family weight (default: all equally weighted), families: {', '.join(FAMILIES)}")
+    parser.add_argument("--output", help=f"CSV or columnar ({RECORDING_SUFFIX}) recording to write instead of evaluating")
+    parser.add_argument("--chunk-size", type=int, default=64)
+    args = parser.parse_args(argv)
+
+    if args.output and not args.output.endswith((RECORDING_SUFFIX, ".csv")):
+        parser.error(f"--output must be a CSV or columnar ({RECORDING_SUFFIX}) recording")
+    try:
+        weights = parse_family_weights(args.family) if args.family else {name: 1.0 for name in FAMILIES}
+        config = GeneratorConfig(num_tracks=args.tracks, family_weights=weights, seed=args.seed)
+    except ValueError as e:
+        parser.error(str(e))
+    cycles = TrackGenerator(config).cycles(args.cycles)
+
+    if args.output:
+        if args.output.endswith(RECORDING_SUFFIX):
+            write_cycles(args.output, cycles)
+        else:
+            with open(args.output, "w", newline="") as f:
+                write_csv_cycles(cycles, f)
+        return 0
+
+    stats = CheckStatistics()
+    start = time.perf_counter()
+    drain(aggregate(evaluate_cycles(cycles, Parameters(), args.chunk_size), stats))
+    seconds = time.perf_counter() - start
+    print(json.dumps(dict(stats.to_dict(), seconds=seconds,
+                          object_cycles_per_second=stats.num_objects / seconds if seconds else None), indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
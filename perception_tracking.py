@@ -0,0 +1,234 @@
+"""
+Stateful multi-cycle emulation of object tracks.
+
+Instead of snapshots with precomputed counters, a track is driven by one
+``TrackUpdate`` event per cycle naming the sensors that updated it and the
+measured values of that cycle. ``TrackEmulator`` keeps the ``ObjectData`` of
+every live track and advances its counters in O(1) per track and cycle:
+
+* ``total_num_*_updates`` and ``updates_since_last_*_update`` per sensor
+* ``num_cycles_existing``, ``num_cycles_no_orientation_update``,
+  oncoming-location and micro-doppler counters
+* ``object_orientation_unreliable_count`` (``modifyUnreliableOrientationCount``)
+* the moving probability clamps of ``applyWaterSprinklersCheckAcc``
+
+Each step yields a ``DecodedCycle`` of the current track states, so event
+recordings chain into the generator pipeline of ``perception_replay``:
+
+    read_event_records(path) -> emulate(...) -> evaluate_cycles(...) -> ...
+
+Event recordings are JSONL, one line per cycle::
+
+    {"cycle": n, "ego": {...}, "updates": [{"object_id": 7,
+     "sensors": ["front_center_location_radar"], "orientation_updated": false,
+     "oncoming_locations": false, "micro_doppler": false,
+     "expected_vr_high_enough_for_mu_doppler": true,
+     "abs_vel_over_ground": [x, y], "measurements": {"state": {...}, "rcs": -12.0}}]}
+
+Tracks missing from a cycle's updates are dropped; tracks that exist but
+were not measured are listed with an empty ``sensors`` list.
+"""
+
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, Optional, Sequence, Tuple
+
+from perception_batch import ObjectBatch, object_to_row
+from perception_engine import EgoVehicleData, ObjectData, ObjectState, Parameters, SensorFilterFusHelper, ego_from_dict
+from perception_replay import (
+    CheckStatistics,
+    DecodedCycle,
+    aggregate,
+    drain,
+    evaluate_cycles,
+    read_jsonl_records,
+)
+
+# Sensor name -> (total update counter, updates-since-last counter) of SensorFilterFusHelper
+SENSOR_COUNTERS = {
+    "front_center_location_radar": ("total_num_front_center_location_radar_updates",
+                                    "updates_since_last_front_center_location_radar_update"),
+    "front_left_corner": ("total_num_front_left_corner_updates", "updates_since_last_front_left_corner_update"),
+    "front_right_corner": ("total_num_front_right_corner_updates", "updates_since_last_front_right_corner_update"),
+    "front_center_video": (None, "updates_since_last_front_center_video_update"),
+}
+# "radar" and "video" stand for sensors of that technology without dedicated counters
+RADAR_SENSORS = frozenset(("radar", "front_center_location_radar", "front_left_corner", "front_right_corner"))
+VIDEO_SENSORS = frozenset(("video", "front_center_video"))
+SENSORS = RADAR_SENSORS | VIDEO_SENSORS
+
+MAX_ORIENTATION_UNRELIABLE_COUNT = 15
+
+_STATE_FIELDS = frozenset(state_field.name for state_field in fields(ObjectState))
+_SENSOR_FIELDS = frozenset(sensor_field.name for sensor_field in fields(SensorFilterFusHelper))
+_OBJECT_FIELDS = frozenset(obj_field.name for obj_field in fields(ObjectData)) - {"state", "sensor_filter_fus_helper"}
+
+@dataclass
+class TrackUpdate:
+    """Sensor update event of one track in one cycle"""
+    object_id: int
+    sensors: FrozenSet[str] = frozenset()
+    orientation_updated: bool = False
+    oncoming_locations: bool = False
+    micro_doppler: bool = False
+    expected_vr_high_enough_for_mu_doppler: bool = False
+    abs_vel_over_ground: Tuple[float, float] = (0.0, 0.0)
+    measurements: Dict[str, Any] = field(default_factory=dict)  # ObjectData fields, nested dicts for state/sensor helper
+
+    def __post_init__(self):
+        self.sensors = frozenset(self.sensors)
+        unknown = self.sensors - SENSORS
+        if unknown:
+            raise ValueError(f"Unknown sensors: {sorted(unknown)}")
+
+@dataclass
+class CycleEvents:
+    """Ego motion and the updates of all live tracks in one cycle"""
+    cycle: int
+    ego: EgoVehicleData
+    updates: Sequence[TrackUpdate]
+
+def modify_unreliable_orientation_count(obj: ObjectData, ego: EgoVehicleData):
+    """modifyUnreliableOrientationCount: count cycles without orientation update while the ego turns"""
+    if obj.is_object_vru:
+        return
+    angle_dt_threshold = 0.087266  # ~5 deg/s
+    no_orient_update_for_long = obj.num_cycles_no_orientation_update > 1
+    is_ego_yaw_rate_high = abs(ego.yaw_rate) > angle_dt_threshold
+    if no_orient_update_for_long and is_ego_yaw_rate_high:
+        if obj.object_orientation_unreliable_count < MAX_ORIENTATION_UNRELIABLE_COUNT:
+            obj.object_orientation_unreliable_count += 1
+    elif obj.object_orientation_unreliable_count > 0:
+        obj.object_orientation_unreliable_count -= 1
+
+def apply_water_sprinklers_check_acc(obj: ObjectData, abs_vel_over_ground: Sequence[float]):
+    """applyWaterSprinklersCheckAcc: clamp the moving probabilities of likely water sprinkler objects"""
+    sensor = obj.sensor_filter_fus_helper
+    is_radar_only_object = sensor.total_num_video_updates == 0 and sensor.total_num_radar_updates > 0
+    abs_avg_dx_innovation = abs(obj.avg_dx_innovation)
+    is_dr_innovation_exceeded = abs_avg_dx_innovation > 1.2
+    is_rcs_too_low = obj.rcs < -8.1
+    is_dr_innovation_little_exceeded = abs_avg_dx_innovation > 0.78
+    is_ground_reflex_exceeded = obj.p_non_obstacle_rcs_only_classifier > 0.8
+    is_abs_vel_over_ground_low = abs_vel_over_ground[0] < 4.0 and abs_vel_over_ground[1] < 0.7
+    is_object_of_interest = obj.most_probable_conditional_type in ("UNKNOWN", "OBSTACLE", "OBSTACLE_MOBILE")
+
+    if is_radar_only_object and is_rcs_too_low and is_object_of_interest:
+        if (is_dr_innovation_exceeded or
+            (is_dr_innovation_little_exceeded and is_ground_reflex_exceeded) or
+            is_abs_vel_over_ground_low):
+            # The low moving probabilities will affect the ACC braking
+            obj.prob_has_been_observed_moving = min(0.5, obj.prob_has_been_observed_moving)
+            obj.prob_is_currently_moving = min(0.01, obj.prob_is_currently_moving)
+
+def apply_measurements(obj: ObjectData, measurements: Dict[str, Any]):
+    """Overwrite the measured fields of an object"""
+    nested = {"state": (obj.state, _STATE_FIELDS), "sensor_filter_fus_helper": (obj.sensor_filter_fus_helper, _SENSOR_FIELDS)}
+    for name, value in measurements.items():
+        if name in nested:
+            target, allowed = nested[name]
+            unknown = set(value) - allowed
+            if unknown:
+                raise ValueError(f"Unknown {name} fields: {sorted(unknown)}")
+            for nested_name, nested_value in value.items():
+                setattr(target, nested_name, nested_value)
+        elif name in _OBJECT_FIELDS:
+            setattr(obj, name, list(value) if isinstance(value, (list, tuple)) else value)
+        else:
+            raise ValueError(f"Unknown object field: {name}")
+
+def advance_counters(obj: ObjectData, update: TrackUpdate):
+    """Advance the per-cycle counters of one track by one cycle"""
+    sensor = obj.sensor_filter_fus_helper
+    for name, (total_counter, since_counter) in SENSOR_COUNTERS.items():
+        updated = name in update.sensors
+        if total_counter is not None and updated:
+            setattr(sensor, total_counter, getattr(sensor, total_counter) + 1)
+        setattr(sensor, since_counter, 0 if updated else getattr(sensor, since_counter) + 1)
+
+    radar_updated = not RADAR_SENSORS.isdisjoint(update.sensors)
+    video_updated = not VIDEO_SENSORS.isdisjoint(update.sensors)
+    if radar_updated:
+        sensor.total_num_radar_updates += 1
+    if video_updated:
+        sensor.total_num_video_updates += 1
+    sensor.updates_since_last_radar_update = 0 if radar_updated else sensor.updates_since_last_radar_update + 1
+    sensor.updates_since_last_video_update = 0 if video_updated else sensor.updates_since_last_video_update + 1
+    sensor.updates_since_last_update = 0 if update.sensors else sensor.updates_since_last_update + 1
+
+    obj.num_cycles_existing += 1
+    obj.num_cycles_no_orientation_update = 0 if update.orientation_updated else obj.num_cycles_no_orientation_update + 1
+    if update.oncoming_locations:
+        obj.total_num_cycles_with_oncoming_locations += 1
+        obj.num_consecutive_cycles_without_oncoming_locations = 0
+    else:
+        obj.num_consecutive_cycles_without_oncoming_locations += 1
+    if update.micro_doppler:
+        obj.number_micro_doppler_cycles += 1
+    if update.expected_vr_high_enough_for_mu_doppler:
+        obj.expected_vr_high_enough_for_mu_doppler_counter += 1
+
+class TrackEmulator:
+    """Carries the state of every live track from cycle to cycle"""
+
+    def __init__(self):
+        self.tracks: Dict[int, ObjectData] = {}
+        self.abs_vel_over_ground: Dict[int, Tuple[float, float]] = {}
+
+    def step(self, events: CycleEvents) -> DecodedCycle:
+        """Apply the updates of one cycle and return the resulting track states"""
+        live, abs_vels, rows = {}, {}, []
+        for update in events.updates:
+            obj = self.tracks.get(update.object_id)
+            if obj is None:
+                obj = ObjectData(object_id_10bit=update.object_id)
+            apply_measurements(obj, update.measurements)
+            advance_counters(obj, update)
+            modify_unreliable_orientation_count(obj, events.ego)
+            apply_water_sprinklers_check_acc(obj, update.abs_vel_over_ground)
+            live[update.object_id] = obj
+            abs_vels[update.object_id] = tuple(update.abs_vel_over_ground)
+            rows.append(object_to_row(obj, events.ego, update.abs_vel_over_ground))
+        self.tracks, self.abs_vel_over_ground = live, abs_vels
+        return DecodedCycle(events.cycle, ObjectBatch.from_rows(rows))
+
+def emulate(events: Iterable[CycleEvents], emulator: Optional[TrackEmulator] = None) -> Iterator[DecodedCycle]:
+    """Run cycle events through a track emulator, yielding the track states of every cycle"""
+    emulator = emulator or TrackEmulator()
+    for cycle_events in events:
+        yield emulator.step(cycle_events)
+
+def decode_update(data: Dict[str, Any]) -> TrackUpdate:
+    """Create a TrackUpdate from its JSON form"""
+    data = dict(data)
+    data["abs_vel_over_ground"] = tuple(data.get("abs_vel_over_ground", (0.0, 0.0)))
+    return TrackUpdate(**data)
+
+def encode_update(update: TrackUpdate) -> Dict[str, Any]:
+    """JSON form of a TrackUpdate"""
+    return {
+        "object_id": update.object_id,
+        "sensors": sorted(update.sensors),
+        "orientation_updated": update.orientation_updated,
+        "oncoming_locations": update.oncoming_locations,
+        "micro_doppler": update.micro_doppler,
+        "expected_vr_high_enough_for_mu_doppler": update.expected_vr_high_enough_for_mu_doppler,
+        "abs_vel_over_ground": list(update.abs_vel_over_ground),
+        "measurements": update.measurements,
+    }
+
+def encode_cycle_events(events: CycleEvents) -> Dict[str, Any]:
+    """Build the JSONL record of one event cycle"""
+    return {"cycle": events.cycle, "ego": vars(events.ego).copy(),
+            "updates": [encode_update(update) for update in events.updates]}
+
+def read_event_records(path: str) -> Iterator[CycleEvents]:
+    """Read an event recording cycle by cycle"""
+    for record in read_jsonl_records(path):
+        yield CycleEvents(record["cycle"], ego_from_dict(record.get("ego", {})),
+                          [decode_update(update) for update in record["updates"]])
+
+def replay_events(path: str, params: Parameters, chunk_size: int = 64) -> CheckStatistics:
+    """Emulate an event recording and return its aggregated check statistics"""
+    stats = CheckStatistics()
+    drain(aggregate(evaluate_cycles(emulate(read_event_records(path)), params, chunk_size), stats))
+    return stats